@@ -0,0 +1 @@
+"""PyPass performance benchmarks (run with ``python -m benchmarks.<name>``)."""
@@ -0,0 +1,128 @@
+"""
+Generation Benchmarks
+Times every phase of SecurePasswordGenerator.generate_password
+
+Usage:
+    python -m benchmarks.bench_generation                     # compare to baseline
+    python -m benchmarks.bench_generation --update-baseline   # record a baseline
+    python -m benchmarks.bench_generation --threshold 10 -o results.json
+
+Only the KDF and end-to-end phases pay for PBKDF2; the other phases run on a
+PRNG seeded from fixed material so they measure just their own work.
+"""
+
+import argparse
+import os
+import sys
+
+from src.derivation import uses_unbiased_sampler
+from src.password_generator import SecurePasswordGenerator, PersonalInfo, PasswordOptions
+
+from . import harness
+
+
+LENGTHS = (8, 16, 32, 64, 128)
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline_generation.json")
+
+_SEED = bytes(range(64))
+
+
+def _personal_info() -> PersonalInfo:
+    return PersonalInfo(
+        first_name="Alice",
+        last_name="Smith",
+        birth_date="12-08-1992",
+        current_date="02-10-2025",
+        platform="Email",
+        city="London",
+    )
+
+
+def _generator(version: str = "v1", length: int = 12) -> SecurePasswordGenerator:
+    generator = SecurePasswordGenerator(derivation_version=version)
+    generator.set_personal_info(_personal_info())
+    options = PasswordOptions()
+    options.length = length
+    generator.set_options(options)
+    return generator
+
+
+def _prng(generator: SecurePasswordGenerator):
+    """A PRNG of the generator's kind without paying for the KDF"""
+    if uses_unbiased_sampler(generator.derivation_version):
+        return SecurePasswordGenerator._UnbiasedPRNG(_SEED)
+    return SecurePasswordGenerator._DeterministicPRNG(_SEED)
+
+
+def run(args: argparse.Namespace) -> dict:
+    results = {}
+    kdf_repeats = harness.repeats_for(args, 5)
+    fast_repeats = harness.repeats_for(args, 7, 2)
+
+    generator = _generator()
+    results["kdf/build_prng"] = harness.measure(
+        generator._build_prng, kdf_repeats)
+
+    def drain_prng():
+        prng = SecurePasswordGenerator._DeterministicPRNG(_SEED)
+        for _ in range(256):
+            prng.next_bytes(64)
+    throughput = harness.measure(drain_prng, fast_repeats, 20)
+    throughput["bytes_per_second"] = 256 * 64 / throughput["median"]
+    results["prng/next_bytes_16KiB"] = throughput
+
+    for version in ("v1", "v3"):
+        for length in LENGTHS:
+            generator = _generator(version, length)
+            characters = generator.options.compile().characters
+
+            def sample(generator=generator, characters=characters, length=length):
+                prng = _prng(generator)
+                return [characters[i] for i in prng.next_ints(len(characters), length)]
+
+            results[f"sample/{version}/len={length}"] = harness.measure(
+                sample, fast_repeats, 200)
+
+    for version in ("v1", "v4"):
+        for length in LENGTHS:
+            generator = _generator(version, length)
+            charset = generator.options.get_character_set()
+            password = [charset[i] for i in _prng(generator).next_ints(len(charset), length)]
+
+            def requirements(generator=generator, password=password, charset=charset):
+                return generator._ensure_character_requirements(
+                    list(password), charset, _prng(generator))
+
+            def patterns(generator=generator, password=password, charset=charset):
+                return generator._avoid_obvious_patterns(
+                    list(password), charset, _prng(generator))
+
+            results[f"requirements/{version}/len={length}"] = harness.measure(
+                requirements, fast_repeats, 200)
+            results[f"patterns/{version}/len={length}"] = harness.measure(
+                patterns, fast_repeats, 200)
+
+    scorer = SecurePasswordGenerator()
+    for length in LENGTHS:
+        password = ("aB3$" * length)[:length]
+        results[f"strength/len={length}"] = harness.measure(
+            lambda password=password: scorer.assess_strength(password),
+            fast_repeats, 500)
+
+    for length in LENGTHS:
+        generator = _generator("v1", length)
+        results[f"end_to_end/v1/len={length}"] = harness.measure(
+            generator.generate_password, harness.repeats_for(args, 3))
+
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    harness.add_arguments(parser, DEFAULT_BASELINE)
+    args = parser.parse_args(argv)
+    return harness.finish(args, run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Keystream Benchmarks
+Compares bytes per second and seek cost across keystream backends
+
+Usage:
+    python -m benchmarks.bench_keystream                     # compare to baseline
+    python -m benchmarks.bench_keystream --update-baseline   # record a baseline
+    python -m benchmarks.bench_keystream --quick -o results.json
+
+Each backend is timed on bulk read_into a preallocated buffer, on the
+64-byte reads the PRNG makes while generating, and on a random seek followed
+by a short read (what a rotation costs).
+"""
+
+import argparse
+import os
+import random
+import sys
+
+from src.keystream import KEYSTREAMS, open_keystream
+from src.password_generator import SecurePasswordGenerator
+
+from . import harness
+
+
+BULK_SIZES = (4096, 1 << 20)
+SMALL_READS = 256
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline_keystream.json")
+
+_KEY = bytes(range(64))
+
+
+def run(args: argparse.Namespace) -> dict:
+    results = {}
+    repeats = harness.repeats_for(args, 7, 2)
+
+    for name in KEYSTREAMS:
+        for size in BULK_SIZES:
+            buffer = bytearray(size)
+
+            def bulk(name=name, buffer=buffer):
+                open_keystream(name, _KEY).read_into(buffer)
+
+            number = max(1, (1 << 22) // size // 16)
+            result = harness.measure(bulk, repeats, number)
+            result["bytes_per_second"] = size / result["median"]
+            results[f"{name}/read_into_{size // 1024}KiB"] = result
+
+        def small_reads(name=name):
+            prng = SecurePasswordGenerator._DeterministicPRNG(_KEY, name)
+            for _ in range(SMALL_READS):
+                prng.next_bytes(64)
+
+        result = harness.measure(small_reads, repeats, 20)
+        result["bytes_per_second"] = SMALL_READS * 64 / result["median"]
+        results[f"{name}/prng_next_bytes_16KiB"] = result
+
+        offsets = random.Random(0).sample(range(2 ** 62), 64)
+        stream = open_keystream(name, _KEY)
+
+        def seek_read(stream=stream, offsets=offsets):
+            for offset in offsets:
+                stream.seek(offset)
+                stream.read(64)
+
+        results[f"{name}/seek_read_64B_x64"] = harness.measure(seek_read, repeats, 20)
+
+    for phase, result in sorted(results.items()):
+        if "bytes_per_second" in result:
+            print(f"{phase:<40} {result['bytes_per_second'] / 1e6:>10.1f} MB/s")
+    print()
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    harness.add_arguments(parser, DEFAULT_BASELINE)
+    args = parser.parse_args(argv)
+    return harness.finish(args, run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Startup Benchmarks
+Import times of the core modules and time-to-first-window of the GUI
+
+Usage:
+    python -m benchmarks.bench_startup                          # source build
+    python -m benchmarks.bench_startup --frozen dist/PyPass.exe # plus a frozen build
+    python -m benchmarks.bench_startup --update-baseline
+
+Every sample runs in a fresh interpreter, so nothing is served from an
+already-populated sys.modules. Time-to-first-window is measured from process
+spawn until the app reports its first window mapped (see STARTUP_PROBE_ENV in
+src/gui.py); it is skipped when no display is available.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from . import harness
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline_startup.json")
+
+# Must match src.gui.STARTUP_PROBE_ENV; not imported to keep tkinter out
+STARTUP_PROBE_ENV = "PYPASS_STARTUP_PROBE"
+WINDOW_TIMEOUT = 60.0
+
+# Modules that must import without pulling in tkinter
+HEADLESS_MODULES = ("src.password_generator", "src.cli", "src.batch")
+IMPORT_MODULES = HEADLESS_MODULES + ("src.gui",)
+
+_IMPORT_PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "print(time.perf_counter() - start, 'tkinter' in sys.modules)\n"
+)
+
+
+def _time_import(module: str) -> float:
+    """Seconds to import module in a fresh interpreter; fails if tkinter leaks"""
+    output = subprocess.run(
+        [sys.executable, "-c", _IMPORT_PROBE.format(module=module)],
+        cwd=ROOT, check=True, capture_output=True, text=True).stdout.split()
+    if module in HEADLESS_MODULES and output[1] == "True":
+        raise RuntimeError(f"Importing {module} loaded tkinter")
+    return float(output[0])
+
+
+def _samples_to_result(samples: List[float]) -> Dict:
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "repeats": len(samples),
+        "number": 1,
+    }
+
+
+def _time_first_window(command: List[str]) -> Optional[float]:
+    """Seconds from spawn until the app's first window was mapped"""
+    with tempfile.TemporaryDirectory() as tmp:
+        probe = os.path.join(tmp, "first_window")
+        env = dict(os.environ, **{STARTUP_PROBE_ENV: probe})
+        start = time.time()
+        process = subprocess.Popen(command, cwd=ROOT, env=env,
+                                   stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.DEVNULL)
+        try:
+            process.wait(timeout=WINDOW_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            raise RuntimeError(f"{command[0]} did not open a window in time")
+        if not os.path.exists(probe):
+            return None  # No display, or the app failed to start
+        with open(probe, "r", encoding="utf-8") as f:
+            return float(f.read()) - start
+
+
+def _has_display() -> bool:
+    if sys.platform in ("win32", "darwin"):
+        return True
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def run(args: argparse.Namespace) -> dict:
+    results = {}
+    repeats = harness.repeats_for(args, 7, 2)
+
+    for module in IMPORT_MODULES:
+        results[f"import/{module}"] = _samples_to_result(
+            [_time_import(module) for _ in range(repeats)])
+
+    builds = {"source": [sys.executable, os.path.join(ROOT, "main.py")]}
+    if args.frozen:
+        builds["frozen"] = [os.path.abspath(args.frozen)]
+
+    if not _has_display():
+        print("No display available; skipping time-to-first-window", file=sys.stderr)
+        return results
+
+    window_repeats = harness.repeats_for(args, 5, 1)
+    for build, command in builds.items():
+        samples = [_time_first_window(command) for _ in range(window_repeats)]
+        if None in samples:
+            print(f"{build}: no window was reported; skipping", file=sys.stderr)
+            continue
+        results[f"first_window/{build}"] = _samples_to_result(samples)
+
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    harness.add_arguments(parser, DEFAULT_BASELINE)
+    parser.add_argument(
+        "--frozen", metavar="EXECUTABLE",
+        help="Also time a PyInstaller build (e.g. dist/PyPass.exe)")
+    args = parser.parse_args(argv)
+    return harness.finish(args, run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
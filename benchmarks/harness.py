@@ -0,0 +1,117 @@
+"""
+Benchmark Harness
+Timing, machine-readable results and baseline regression checks
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+
+def measure(func: Callable[[], object], repeats: int, number: int = 1) -> Dict:
+    """Time func; returns per-call seconds (median and min over repeats)"""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "repeats": repeats,
+        "number": number,
+    }
+
+
+def environment() -> Dict:
+    """Describe the machine the numbers came from"""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict],
+            threshold_percent: float) -> List[str]:
+    """Return a message for every phase slower than baseline by > threshold"""
+    regressions = []
+    for phase, result in sorted(results.items()):
+        reference = baseline.get(phase)
+        if reference is None or not reference.get("median"):
+            continue
+        change = (result["median"] / reference["median"] - 1) * 100
+        if change > threshold_percent:
+            regressions.append(
+                f"{phase}: {result['median'] * 1e6:.1f}us vs baseline "
+                f"{reference['median'] * 1e6:.1f}us (+{change:.1f}%)")
+    return regressions
+
+
+def add_arguments(parser: argparse.ArgumentParser, default_baseline: str):
+    """Options shared by every benchmark script"""
+    parser.add_argument(
+        "-o", "--output", help="Write JSON results to this file")
+    parser.add_argument(
+        "--baseline", default=default_baseline,
+        help=f"Baseline JSON to compare against (default: {default_baseline})")
+    parser.add_argument(
+        "--threshold", type=float, default=25.0,
+        help="Allowed slowdown per phase in percent (default: 25)")
+    parser.add_argument(
+        "--update-baseline", action="store_true",
+        help="Record these results as the new baseline")
+    parser.add_argument(
+        "--quick", action="store_true",
+        help="Fewer repeats; for smoke-testing the suite, not for baselines")
+
+
+def finish(args: argparse.Namespace, results: Dict[str, Dict]) -> int:
+    """Print, save and compare results; returns the process exit code"""
+    report = {"environment": environment(), "results": results}
+
+    for phase, result in sorted(results.items()):
+        print(f"{phase:<40} median {result['median'] * 1e6:>12.1f}us"
+              f"   min {result['min'] * 1e6:>12.1f}us")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; skipping comparison")
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    regressions = compare(results, baseline.get("results", {}), args.threshold)
+    if regressions:
+        print(f"\nRegressions beyond {args.threshold:.0f}%:", file=sys.stderr)
+        for message in regressions:
+            print(f"  {message}", file=sys.stderr)
+        return 1
+
+    print(f"\nNo phase regressed by more than {args.threshold:.0f}%")
+    return 0
+
+
+def repeats_for(args: argparse.Namespace, full: int, quick: Optional[int] = None) -> int:
+    """Pick a repeat count honoring --quick"""
+    return (quick or 1) if args.quick else full
@@ -32,7 +32,13 @@ a = Analysis(
         'scipy', 'sklearn', 'tensorflow', 'torch',
         'pytest', 'doctest',
         'pydoc', 'pdb', 'bdb', 'profile',
-        'distutils', 'setuptools', 'pip'
+        'distutils', 'setuptools', 'pip',
+        # The windowed onefile build is GUI-only: headless modules (reached
+        # from main.py --no-gui) would only add to the archive unpacked on
+        # every start. Use the onedir build or run from source for the CLI.
+        'src.cli', 'src.batch', 'src.async_generation', 'src.service',
+        'src.strength', 'src.breach', 'asyncio', 'multiprocessing', 'http',
+        'email', 'xml', 'unittest', 'sqlite3'
     ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
@@ -7,14 +7,22 @@ Main entry point for the application
 import os
 import sys
 
-from src.gui import PasswordGeneratorApp
-
 
 def main():
     """Main entry point for PyPass application"""
+    argv = sys.argv[1:]
+    if "--no-gui" in argv:
+        # Headless mode must not pull in tkinter
+        argv.remove("--no-gui")
+        from src.cli import main as cli_main
+        return cli_main(argv)
+
+    from src.gui import PasswordGeneratorApp
+
     app = PasswordGeneratorApp()
     app.run()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+PyPass - Offline Password Generator
+Headless command-line entry point: ``python -m pypass generate jobs.jsonl``
+"""
+
+import sys
+
+from src.cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,9 @@
+"""Allow ``python -m src`` to run the headless PyPass command line."""
+
+import sys
+
+from .cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
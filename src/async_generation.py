@@ -0,0 +1,134 @@
+"""
+Async Generation Module
+asyncio-native password generation that keeps the KDF off the event loop
+"""
+
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable, List, Optional, Tuple, Union
+
+from .batch import BatchResult, _generate_job, _result
+from .breach import BreachIndex
+from .derivation import DEFAULT_DERIVATION_VERSION, validate_version
+from .kdf import KDFProfile
+from .password_generator import PersonalInfo, PasswordOptions
+
+
+class AsyncPasswordGenerator:
+    """Runs derivations on an executor and awaits them from asyncio.
+
+    At most ``max_in_flight`` derivations occupy the executor at any time;
+    further requests wait for a free slot instead of queueing unbounded work.
+    A slot is only released once its derivation has really finished, so a
+    cancelled or timed-out request cannot be used to exceed the cap.
+    """
+
+    def __init__(self, executor: Union[str, Executor] = "thread",
+                 max_in_flight: Optional[int] = None,
+                 derivation_version: str = DEFAULT_DERIVATION_VERSION,
+                 kdf_profile: Optional[KDFProfile] = None,
+                 breach_index: Optional[BreachIndex] = None):
+        if max_in_flight is None:
+            max_in_flight = os.cpu_count() or 1
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be positive")
+
+        self.derivation_version = validate_version(derivation_version)
+        self.kdf_profile = kdf_profile
+        # Flags generate_many_async results found in a breach corpus
+        self.breach_index = breach_index
+        self.max_in_flight = max_in_flight
+        self._owns_executor = isinstance(executor, str)
+
+        if executor == "thread":
+            executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        elif executor == "process":
+            executor = ProcessPoolExecutor(max_workers=max_in_flight)
+        elif isinstance(executor, str):
+            raise ValueError("Executor must be 'thread', 'process' or an Executor")
+
+        self._executor = executor
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of derivations currently occupying the executor"""
+        return self._in_flight
+
+    async def _run(self, personal_info: PersonalInfo, options: PasswordOptions,
+                   timeout: Optional[float] = None) -> Tuple[Optional[str], Optional[str]]:
+        """Derive in a free slot; ``timeout`` starts once the slot is held"""
+        await self._slots.acquire()
+        loop = asyncio.get_running_loop()
+        try:
+            future = self._executor.submit(
+                _generate_job, personal_info, options, self.derivation_version,
+                self.kdf_profile)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        self._in_flight += 1
+
+        def release(_):
+            try:
+                loop.call_soon_threadsafe(self._release)
+            except RuntimeError:
+                pass  # Event loop already closed
+
+        future.add_done_callback(release)
+        # Cancelling the awaiting task (or timing out) cancels the job if it
+        # has not started; a running job keeps its slot until it finishes
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+
+    def _release(self):
+        self._in_flight -= 1
+        self._slots.release()
+
+    async def generate_password_async(self, personal_info: PersonalInfo,
+                                      options: PasswordOptions,
+                                      timeout: Optional[float] = None) -> str:
+        """Generate one password without blocking the event loop.
+
+        Raises ValueError for invalid input, like ``generate_password()``, and
+        asyncio.TimeoutError if no result arrives within ``timeout`` seconds
+        (including time spent waiting for a free slot).
+        """
+        password, error = await asyncio.wait_for(
+            self._run(personal_info, options), timeout)
+        if error is not None:
+            raise ValueError(error)
+        return password
+
+    async def generate_many_async(self, jobs: Iterable[Tuple[PersonalInfo, PasswordOptions]],
+                                  timeout: Optional[float] = None) -> List[BatchResult]:
+        """Generate a batch concurrently, reporting per-job errors in input order.
+
+        ``timeout`` applies to each job's derivation, not to the time it
+        waits for a slot behind the rest of the batch; a job that exceeds it
+        is reported as an error rather than failing the whole batch.
+        """
+        async def run_one(index: int, personal_info: PersonalInfo,
+                          options: PasswordOptions) -> BatchResult:
+            try:
+                password, error = await self._run(personal_info, options, timeout)
+            except asyncio.TimeoutError:
+                return BatchResult(index, None, "Timed out")
+            return _result(index, password, error, self.breach_index)
+
+        return list(await asyncio.gather(*(
+            run_one(index, personal_info, options)
+            for index, (personal_info, options) in enumerate(jobs))))
+
+    def close(self):
+        """Shut down the executor if this instance created it"""
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self) -> "AsyncPasswordGenerator":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
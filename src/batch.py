@@ -0,0 +1,171 @@
+"""
+Batch Generation Module
+Parallel password generation across worker processes or threads
+"""
+
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Deque, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .breach import BreachIndex
+from .derivation import DEFAULT_DERIVATION_VERSION, validate_version
+from .kdf import KDFProfile
+from .password_generator import SecurePasswordGenerator, PersonalInfo, PasswordOptions
+
+
+EXECUTORS = ("process", "thread")
+
+
+class BatchResult(NamedTuple):
+    """Outcome of a single batch job, reported in input order"""
+
+    index: int
+    password: Optional[str]
+    error: Optional[str]
+    breached: Optional[bool] = None  # Set only when a breach index was given
+
+    @property
+    def ok(self) -> bool:
+        """True when the job produced a password"""
+        return self.error is None
+
+
+# One generator per worker thread/process, so v2 master keys are reused
+# across the jobs a worker handles.
+_worker_state = threading.local()
+
+
+def _worker_generator(derivation_version: str,
+                      kdf_profile: Optional[KDFProfile] = None) -> SecurePasswordGenerator:
+    generator = getattr(_worker_state, "generator", None)
+    if generator is None or generator.derivation_version != derivation_version:
+        generator = SecurePasswordGenerator(
+            derivation_version=derivation_version, kdf_profile=kdf_profile)
+        _worker_state.generator = generator
+    else:
+        generator.set_kdf_profile(kdf_profile)
+    return generator
+
+
+def _run_job(generator: SecurePasswordGenerator, personal_info: PersonalInfo,
+             options: PasswordOptions) -> Tuple[Optional[str], Optional[str]]:
+    """Generate one password, returning (password, error) instead of raising"""
+    try:
+        generator.set_personal_info(personal_info)
+        generator.set_options(options)
+        return generator.generate_password(), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _generate_job(personal_info: PersonalInfo, options: PasswordOptions,
+                  derivation_version: str,
+                  kdf_profile: Optional[KDFProfile] = None) -> Tuple[Optional[str], Optional[str]]:
+    """Pool entry point: run a job on this worker's generator"""
+    return _run_job(_worker_generator(derivation_version, kdf_profile),
+                    personal_info, options)
+
+
+def _result(index: int, password: Optional[str], error: Optional[str],
+            breach_index: Optional[BreachIndex]) -> BatchResult:
+    """Build a BatchResult, checking the password against breach_index.
+
+    The check runs in the consuming process: a lookup costs microseconds,
+    far less than shipping the index state to each worker.
+    """
+    breached = None
+    if breach_index is not None and password is not None:
+        breached = password in breach_index
+    return BatchResult(index, password, error, breached)
+
+
+def _resolve_workers(workers: Optional[int]) -> int:
+    """Default the worker count to the number of CPUs"""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Worker count must be positive")
+    return workers
+
+
+def iter_generate(jobs: Iterable[Tuple[PersonalInfo, PasswordOptions]],
+                  executor: str = "process",
+                  workers: Optional[int] = None,
+                  derivation_version: str = DEFAULT_DERIVATION_VERSION,
+                  max_pending: Optional[int] = None,
+                  kdf_profile: Optional[KDFProfile] = None,
+                  breach_index: Optional[BreachIndex] = None) -> Iterator[BatchResult]:
+    """Stream results for an iterable of jobs without materializing it.
+
+    At most ``max_pending`` jobs (default ``4 * workers``) are read ahead and
+    in flight at once, so memory stays bounded however long the input is.
+    Results are yielded in input order. With ``breach_index`` each result's
+    ``breached`` flag reports whether its password is in the corpus.
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"Executor must be one of: {', '.join(EXECUTORS)}")
+    validate_version(derivation_version)
+    workers = _resolve_workers(workers)
+    if max_pending is None:
+        max_pending = workers * 4
+    if max_pending < 1:
+        raise ValueError("max_pending must be positive")
+
+    if workers == 1:
+        # Not worth a pool; avoid the startup cost entirely
+        generator = SecurePasswordGenerator(
+            derivation_version=derivation_version, kdf_profile=kdf_profile)
+        for index, (personal_info, options) in enumerate(jobs):
+            yield _result(index, *_run_job(generator, personal_info, options),
+                          breach_index)
+        return
+
+    # hashlib releases the GIL during PBKDF2, so threads scale as well as
+    # processes for the KDF; processes also parallelize the Python-level work.
+    pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    pending: Deque[Tuple[int, Future]] = deque()
+
+    with pool_class(max_workers=workers) as pool:
+        try:
+            for index, (personal_info, options) in enumerate(jobs):
+                pending.append((index, pool.submit(
+                    _generate_job, personal_info, options, derivation_version,
+                    kdf_profile)))
+                if len(pending) >= max_pending:
+                    done_index, future = pending.popleft()
+                    yield _result(done_index, *future.result(), breach_index)
+
+            while pending:
+                done_index, future = pending.popleft()
+                yield _result(done_index, *future.result(), breach_index)
+        finally:
+            # Consumer stopped early: don't run jobs nobody will read
+            for _, future in pending:
+                future.cancel()
+
+
+def generate_many(jobs: Iterable[Tuple[PersonalInfo, PasswordOptions]],
+                  executor: str = "process",
+                  workers: Optional[int] = None,
+                  derivation_version: str = DEFAULT_DERIVATION_VERSION,
+                  kdf_profile: Optional[KDFProfile] = None,
+                  breach_index: Optional[BreachIndex] = None) -> List[BatchResult]:
+    """Generate passwords for many (PersonalInfo, PasswordOptions) pairs in parallel.
+
+    Each job runs the same code path as ``generate_password()``, so results are
+    identical to single calls. Results keep input order; a failing job is
+    reported through ``BatchResult.error`` and does not stop the batch.
+    With ``derivation_version="v2"`` each worker runs the slow KDF once per
+    identity rather than once per job. ``kdf_profile`` selects the slow KDF
+    and its cost (see ``kdf.estimate_batch_cost`` to size a batch first).
+    ``breach_index`` flags results whose password is in a breach corpus.
+    """
+    jobs = list(jobs)
+    workers = max(1, min(_resolve_workers(workers), len(jobs)))
+    return list(iter_generate(jobs, executor=executor, workers=workers,
+                              derivation_version=derivation_version,
+                              max_pending=max(1, len(jobs)),
+                              kdf_profile=kdf_profile,
+                              breach_index=breach_index))
@@ -0,0 +1,436 @@
+"""
+Batch Panel Module for PyPass
+Generate passwords for one identity across many platforms in a Tk window
+
+Rows live in a plain list (``BatchTableModel``). The Treeview only ever
+holds the handful of items that fit on screen and refills them as the view
+scrolls, so 10k platforms cost Tk no more than 20. Derivations run on a
+thread pool (``BatchRunner``) and report per-row progress through a queue
+the Tk thread drains on a timer; workers never touch Tk.
+"""
+
+import os
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+from .kdf import KDFProfile
+from .password_generator import SecurePasswordGenerator, PersonalInfo, PasswordOptions
+
+
+STATUS_QUEUED = "Queued"
+STATUS_RUNNING = "Deriving..."
+STATUS_DONE = "Done"
+STATUS_FAILED = "Failed"
+
+_MASK = "•" * 12
+
+
+def parse_platforms(text: str) -> List[str]:
+    """Platforms from pasted or imported text: one per line, blanks and repeats dropped"""
+    platforms = []
+    seen = set()
+    for line in text.splitlines():
+        platform = line.strip()
+        if platform and platform not in seen:
+            seen.add(platform)
+            platforms.append(platform)
+    return platforms
+
+
+class BatchRow:
+    """State of one platform in the batch"""
+
+    __slots__ = ("platform", "status", "password", "error")
+
+    def __init__(self, platform: str):
+        self.platform = platform
+        self.status = STATUS_QUEUED
+        self.password: Optional[str] = None
+        self.error: Optional[str] = None
+
+
+class BatchTableModel:
+    """All rows of a batch; the table view renders a window of them"""
+
+    COLUMNS = ("#", "Platform", "Status", "Password")
+
+    def __init__(self, platforms: Sequence[str]):
+        self.rows = [BatchRow(platform) for platform in platforms]
+        self.revealed = set()
+        self.finished = 0
+        self.failed = 0
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def update(self, index: int, status: str, password: Optional[str] = None,
+               error: Optional[str] = None):
+        """Record progress for a row"""
+        row = self.rows[index]
+        if status in (STATUS_DONE, STATUS_FAILED) and row.status not in (STATUS_DONE, STATUS_FAILED):
+            self.finished += 1
+            self.failed += status == STATUS_FAILED
+        row.status, row.password, row.error = status, password, error
+
+    def toggle_reveal(self, index: int) -> bool:
+        """Show or mask a row's password; returns True if now shown"""
+        if index in self.revealed:
+            self.revealed.discard(index)
+            return False
+        self.revealed.add(index)
+        return True
+
+    def display(self, index: int) -> Tuple:
+        """Column values for a row"""
+        row = self.rows[index]
+        if row.error is not None:
+            shown = row.error
+        elif row.password is None:
+            shown = ""
+        else:
+            shown = row.password if index in self.revealed else _MASK
+        return (index + 1, row.platform, row.status, shown)
+
+    def window(self, offset: int, count: int) -> List[Tuple]:
+        """Column values for rows offset..offset+count (fewer at the end)"""
+        return [self.display(index)
+                for index in range(offset, min(offset + count, len(self.rows)))]
+
+
+class BatchRunner:
+    """Derives every platform's password for one identity on a thread pool.
+
+    ``drain()`` applies queued progress events to a model; call it from the
+    Tk thread. hashlib releases the GIL during the KDF, so threads scale
+    across cores. (src.batch is not used: it pulls in multiprocessing, which
+    the GUI-only build leaves out.)
+    """
+
+    def __init__(self, personal_info: PersonalInfo, options: PasswordOptions,
+                 platforms: Sequence[str], derivation_version: str,
+                 kdf_profile: Optional[KDFProfile] = None,
+                 workers: Optional[int] = None):
+        self.personal_info = personal_info
+        self.options = options
+        self.platforms = list(platforms)
+        self.derivation_version = derivation_version
+        self.kdf_profile = kdf_profile
+        self.workers = workers or os.cpu_count() or 1
+        self._events: "queue.Queue[Tuple[int, str, Optional[str], Optional[str]]]" = queue.Queue()
+        self._cancelled = False
+        # Jobs past the cancel check; guarded by _lock
+        self._active = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._outstanding = len(self.platforms)
+        # One generator per pool thread, so v2+ derive the master key once each
+        self._local = threading.local()
+
+    def start(self):
+        """Queue every platform; returns immediately"""
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="pypass-batch")
+        for index, platform in enumerate(self.platforms):
+            self._executor.submit(self._run, index, platform)
+
+    def _run(self, index: int, platform: str):
+        with self._lock:
+            if self._cancelled:
+                return
+            self._active += 1
+        try:
+            self._derive(index, platform)
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def _derive(self, index: int, platform: str):
+        self._events.put((index, STATUS_RUNNING, None, None))
+        generator = getattr(self._local, "generator", None)
+        if generator is None:
+            generator = SecurePasswordGenerator(
+                derivation_version=self.derivation_version, kdf_profile=self.kdf_profile)
+            self._local.generator = generator
+        try:
+            generator.set_personal_info(
+                PersonalInfo(**dict(vars(self.personal_info), platform=platform)))
+            generator.set_options(self.options)
+            self._events.put((index, STATUS_DONE, generator.generate_password(), None))
+        except Exception as e:
+            self._events.put((index, STATUS_FAILED, None, str(e)))
+
+    def drain(self, model: BatchTableModel, limit: int = 2000) -> List[int]:
+        """Apply up to limit queued events to model; returns the changed rows"""
+        changed = []
+        for _ in range(limit):
+            try:
+                index, status, password, error = self._events.get_nowait()
+            except queue.Empty:
+                break
+            model.update(index, status, password, error)
+            if status in (STATUS_DONE, STATUS_FAILED):
+                self._outstanding -= 1
+            changed.append(index)
+        if self._outstanding == 0 and self._executor is not None:
+            self._executor.shutdown(wait=False)
+        return changed
+
+    @property
+    def done(self) -> bool:
+        """True once every row has finished, or a cancelled batch has settled"""
+        if self._outstanding == 0:
+            return True
+        with self._lock:
+            # Events are queued before _active drops, so none can still arrive
+            return self._cancelled and self._active == 0 and self._events.empty()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self):
+        """Skip rows that have not started; running derivations still finish"""
+        with self._lock:
+            self._cancelled = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class BatchPanel:
+    """Toplevel window: platform list in, virtualized results table out"""
+
+    VISIBLE_ROWS = 18
+    POLL_INTERVAL_MS = 100
+
+    def __init__(self, app):
+        self.app = app
+        self.model = BatchTableModel([])
+        self.runner: Optional[BatchRunner] = None
+        self.offset = 0
+        self.selected: Optional[int] = None
+        self._poll_job = None
+
+        self.window = tk.Toplevel(app.root)
+        self.window.title("PyPass - Batch Generate")
+        self.window.geometry("720x640")
+        self.window.minsize(560, 520)
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        self._create_widgets()
+
+    def _create_widgets(self):
+        frame = ttk.Frame(self.window, padding="15")
+        frame.pack(fill="both", expand=True)
+        frame.columnconfigure(0, weight=1)
+        frame.rowconfigure(4, weight=1)
+
+        ttk.Label(frame, text="Platforms (one per line), for the personal "
+                              "information and options in the main window:").grid(
+            row=0, column=0, sticky="w")
+        self.platform_text = tk.Text(frame, height=6, wrap="none")
+        self.platform_text.grid(row=1, column=0, sticky="ew", pady=(5, 10))
+
+        buttons = ttk.Frame(frame)
+        buttons.grid(row=2, column=0, sticky="ew")
+        self.import_button = ttk.Button(buttons, text="Import...", command=self.import_platforms)
+        self.import_button.pack(side="left")
+        self.generate_button = ttk.Button(buttons, text="Generate All", command=self.start)
+        self.generate_button.pack(side="left", padx=(5, 0))
+        self.cancel_button = ttk.Button(buttons, text="Cancel", command=self.cancel,
+                                        state="disabled")
+        self.cancel_button.pack(side="left", padx=(5, 0))
+        self.copy_button = ttk.Button(buttons, text="Copy", command=self.copy_selected)
+        self.copy_button.pack(side="right")
+        self.reveal_button = ttk.Button(buttons, text="Show/Hide", command=self.reveal_selected)
+        self.reveal_button.pack(side="right", padx=(0, 5))
+
+        progress = ttk.Frame(frame)
+        progress.grid(row=3, column=0, sticky="ew", pady=10)
+        progress.columnconfigure(1, weight=1)
+        self.progress_label = ttk.Label(progress, text="No batch run yet", width=24)
+        self.progress_label.grid(row=0, column=0, sticky="w")
+        self.progress_bar = ttk.Progressbar(progress, mode="determinate")
+        self.progress_bar.grid(row=0, column=1, sticky="ew", padx=(10, 0))
+
+        table = ttk.Frame(frame)
+        table.grid(row=4, column=0, sticky="nsew")
+        table.columnconfigure(0, weight=1)
+        table.rowconfigure(0, weight=1)
+        self.tree = ttk.Treeview(table, columns=BatchTableModel.COLUMNS, show="headings",
+                                 height=self.VISIBLE_ROWS, selectmode="browse")
+        for column, width, stretch in (("#", 60, False), ("Platform", 200, True),
+                                       ("Status", 100, False), ("Password", 240, True)):
+            self.tree.heading(column, text=column)
+            self.tree.column(column, width=width, stretch=stretch)
+        # A fixed set of items; _refresh rewrites their values as the view moves
+        self._items = [self.tree.insert("", "end", values=()) for _ in range(self.VISIBLE_ROWS)]
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar = ttk.Scrollbar(table, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<Double-1>", lambda _: self.reveal_selected())
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda _: self.scroll_to(self.offset - 3))
+        self.tree.bind("<Button-5>", lambda _: self.scroll_to(self.offset + 3))
+        self._refresh()
+
+    # Virtualized view
+
+    def scroll_to(self, offset: int):
+        """Show rows from offset on"""
+        offset = max(0, min(offset, len(self.model) - self.VISIBLE_ROWS))
+        if offset != self.offset:
+            self.offset = offset
+            self._refresh()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self.model)))
+        elif action == "scroll":
+            step = self.VISIBLE_ROWS if unit == "pages" else 1
+            self.scroll_to(self.offset + int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        self.scroll_to(self.offset - (event.delta // 120 or (1 if event.delta > 0 else -1)) * 3)
+        return "break"
+
+    def _refresh(self):
+        """Rewrite the visible items from the model"""
+        values = self.model.window(self.offset, self.VISIBLE_ROWS)
+        for slot, item in enumerate(self._items):
+            self.tree.item(item, values=values[slot] if slot < len(values) else ())
+        # Keep the selection on the same row, not the same screen slot
+        slot = None if self.selected is None else self.selected - self.offset
+        if slot is not None and 0 <= slot < len(values):
+            if self.tree.selection() != (self._items[slot],):
+                self.tree.selection_set(self._items[slot])
+        elif self.tree.selection():
+            self.tree.selection_remove(*self.tree.selection())
+        total = max(1, len(self.model))
+        self.scrollbar.set(self.offset / total,
+                           min(1.0, (self.offset + self.VISIBLE_ROWS) / total))
+
+    def _on_select(self, _event):
+        selection = self.tree.selection()
+        if selection:
+            index = self.offset + self._items.index(selection[0])
+            if index < len(self.model):
+                self.selected = index
+
+    # Actions
+
+    def import_platforms(self):
+        """Append platforms from a text file (one per line)"""
+        from tkinter import filedialog, messagebox
+
+        path = filedialog.askopenfilename(
+            parent=self.window, title="Import platforms",
+            filetypes=[("Text files", "*.txt *.csv"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            messagebox.showerror("Import Error", f"Failed to read file: {e}", parent=self.window)
+            return
+        if self.platform_text.get("1.0", "end").strip():
+            text = "\n" + text
+        self.platform_text.insert("end", text)
+
+    def start(self):
+        """Generate every listed platform for the main window's identity"""
+        from tkinter import messagebox
+
+        error = self.app._input_error(require_platform=False)
+        platforms = parse_platforms(self.platform_text.get("1.0", "end"))
+        if error is None and not platforms:
+            error = ("Input Error", "Please enter at least one platform.")
+        if error is not None:
+            messagebox.showerror(*error, parent=self.window)
+            return
+
+        if self._poll_job is not None:
+            return  # Still settling a cancelled batch
+        personal_info, options = self.app._collect_inputs()
+        generator = self.app.password_generator
+        self.model = BatchTableModel(platforms)
+        self.runner = BatchRunner(personal_info, options, platforms,
+                                  generator.derivation_version, generator.kdf_profile)
+        self.offset, self.selected = 0, None
+        self.progress_bar.config(maximum=len(platforms), value=0)
+        self.generate_button.config(state="disabled")
+        self.cancel_button.config(state="normal")
+        self.runner.start()
+        self._update_progress()
+        self._refresh()
+        self._poll_job = self.window.after(self.POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self):
+        self._poll_job = None
+        if self.runner is None:
+            return
+        changed = self.runner.drain(self.model)
+        if changed:
+            self._update_progress()
+            # Only rows on screen need Tk work
+            if any(self.offset <= index < self.offset + self.VISIBLE_ROWS for index in changed):
+                self._refresh()
+        if self.runner.done:
+            self._finish()
+        else:
+            self._poll_job = self.window.after(self.POLL_INTERVAL_MS, self._poll)
+
+    def _update_progress(self):
+        text = f"{self.model.finished} / {len(self.model)} done"
+        if self.model.failed:
+            text += f", {self.model.failed} failed"
+        if self.runner is not None and self.runner.cancelled:
+            text += " (cancelled)"
+        self.progress_label.config(text=text)
+        self.progress_bar.config(value=self.model.finished)
+
+    def _finish(self):
+        self.generate_button.config(state="normal")
+        self.cancel_button.config(state="disabled")
+        self._update_progress()
+        self._refresh()
+
+    def cancel(self):
+        """Stop queued rows; rows already deriving still complete"""
+        if self.runner is not None:
+            self.runner.cancel()
+            self.cancel_button.config(state="disabled")
+
+    def _selected_password(self) -> Optional[str]:
+        if self.selected is None or self.selected >= len(self.model):
+            return None
+        return self.model.rows[self.selected].password
+
+    def reveal_selected(self):
+        """Show or mask the selected row's password"""
+        if self._selected_password() is not None:
+            self.model.toggle_reveal(self.selected)
+            self._refresh()
+
+    def copy_selected(self):
+        """Copy the selected row's password (auto-cleared like the main window)"""
+        password = self._selected_password()
+        if password is not None:
+            self.app.clipboard_manager.copy_to_clipboard(password)
+            self.progress_label.config(
+                text=f"Copied {self.model.rows[self.selected].platform} (clears in 30s)")
+
+    def close(self):
+        """Cancel outstanding work and close the window"""
+        self.cancel()
+        if self._poll_job is not None:
+            self.window.after_cancel(self._poll_job)
+            self._poll_job = None
+        self.model = BatchTableModel([])
+        self.window.destroy()
+        self.app.batch_panel = None
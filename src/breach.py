@@ -0,0 +1,262 @@
+"""
+Breach Index Module
+Offline breached-password checks against a local hash corpus
+
+Converts a text dump of SHA-1 hashes (the "HASH:COUNT" lines of a Have I
+Been Pwned download, or bare hashes) into a single file (integers
+big-endian)::
+
+    magic   b"PYPBRH01"
+    u64     record count N
+    u64     Bloom filter size in bits M
+    u8      Bloom hash functions K, then 7 bytes padding
+    records N x (20-byte SHA-1, u32 count), sorted by hash, unique
+    bytes   Bloom filter bits (ceil(M / 8) bytes)
+
+Lookups check the Bloom filter, then binary-search the records through
+mmap, so even a 30+ GB corpus answers in well under a millisecond without
+being loaded into memory. Nothing here ever touches the network.
+"""
+
+import hashlib
+import heapq
+import math
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
+
+
+_MAGIC = b"PYPBRH01"
+_HEADER = struct.Struct(">QQB7x")
+_RECORDS_START = len(_MAGIC) + _HEADER.size
+_RECORD = struct.Struct(">20sI")
+HASH_SIZE = 20
+RECORD_SIZE = _RECORD.size
+MAX_COUNT = 2 ** 32 - 1
+
+DEFAULT_BITS_PER_ENTRY = 10  # ~1% Bloom false positives with 7 hash functions
+DEFAULT_MEMORY_RECORDS = 1_000_000  # Records sorted in memory per run
+
+
+def password_hash(password: str) -> bytes:
+    """SHA-1 of a password as used by breach corpora (UTF-8 bytes)"""
+    # surrogateescape restores undecodable bytes read from audit inputs
+    return hashlib.sha1(password.encode("utf-8", "surrogateescape")).digest()
+
+
+def _parse_line(line: str, line_number: int) -> Optional[Tuple[bytes, int]]:
+    text = line.strip()
+    if not text:
+        return None
+    digest, _, count = text.partition(":")
+    try:
+        if len(digest) != 2 * HASH_SIZE:
+            raise ValueError
+        occurrences = int(count) if count else 1
+        if occurrences < 0:
+            raise ValueError
+        return bytes.fromhex(digest), min(occurrences, MAX_COUNT)
+    except ValueError:
+        raise ValueError(f"Line {line_number}: expected SHA1[:COUNT], got {text[:60]!r}")
+
+
+def _read_run(f: BinaryIO, start: int) -> Iterator[Tuple[bytes, int]]:
+    f.seek(start)
+    while True:
+        block = f.read(RECORD_SIZE * 4096)
+        if not block:
+            return
+        yield from _RECORD.iter_unpack(block)
+
+
+def _bloom_indexes(digest: bytes, bits: int, hashes: int) -> Iterator[int]:
+    # SHA-1 digests are already uniform, so double hashing over two slices
+    # of the digest stands in for K independent hash functions
+    first = int.from_bytes(digest[:8], "big")
+    step = int.from_bytes(digest[8:16], "big") | 1
+    for i in range(hashes):
+        yield (first + i * step) % bits
+
+
+def build_breach_index(lines: Iterable[str], path: str,
+                       bits_per_entry: int = DEFAULT_BITS_PER_ENTRY,
+                       memory_records: int = DEFAULT_MEMORY_RECORDS) -> int:
+    """Convert a hash dump to a breach index at path; returns the record count.
+
+    Input already sorted by hash (like the HIBP "ordered by hash" download)
+    streams straight through; anything else is external-sorted in runs of
+    ``memory_records``. Duplicate hashes are merged, adding their counts.
+    """
+    if bits_per_entry < 1 or memory_records < 1:
+        raise ValueError("bits_per_entry and memory_records must be positive")
+
+    directory = os.path.dirname(os.path.abspath(path))
+    scratch = tempfile.mkdtemp(prefix=".breach-", dir=directory)
+    try:
+        # Run 0 grows for as long as the input stays sorted, directly in the
+        # output layout; out-of-order records go to sorted in-memory runs.
+        runs: List[Tuple[str, int]] = []
+        head_path = os.path.join(scratch, "run-0")
+        head = open(head_path, "wb")
+        head.write(bytes(_RECORDS_START))
+        runs.append((head_path, _RECORDS_START))
+        previous = b""
+        buffer: List[Tuple[bytes, int]] = []
+
+        def spill():
+            buffer.sort()
+            run_path = os.path.join(scratch, f"run-{len(runs)}")
+            with open(run_path, "wb") as run:
+                run.write(b"".join(_RECORD.pack(*record) for record in buffer))
+            runs.append((run_path, 0))
+            buffer.clear()
+
+        for line_number, line in enumerate(lines, start=1):
+            record = _parse_line(line, line_number)
+            if record is None:
+                continue
+            if not buffer and len(runs) == 1 and record[0] > previous:
+                head.write(_RECORD.pack(*record))
+                previous = record[0]
+                continue
+            buffer.append(record)
+            if len(buffer) >= memory_records:
+                spill()
+        head.close()
+        if buffer:
+            spill()
+
+        # Run 0 is strictly increasing, so on its own it is already final
+        output_path = head_path
+        if len(runs) > 1:
+            output_path = os.path.join(scratch, "merged")
+            _merge_runs(runs, output_path)
+        count = _finish_index(output_path, bits_per_entry)
+        os.replace(output_path, path)
+        return count
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def _merge_runs(runs: List[Tuple[str, int]], output_path: str):
+    files = [open(run_path, "rb") for run_path, _ in runs]
+    try:
+        with open(output_path, "wb") as out:
+            out.write(bytes(_RECORDS_START))
+            pending: Optional[Tuple[bytes, int]] = None
+            block = bytearray()
+            merged = heapq.merge(*(_read_run(f, start) for f, (_, start) in zip(files, runs)))
+            for digest, count in merged:
+                if pending is not None and pending[0] == digest:
+                    pending = (digest, min(pending[1] + count, MAX_COUNT))
+                    continue
+                if pending is not None:
+                    block += _RECORD.pack(*pending)
+                    if len(block) >= RECORD_SIZE * 4096:
+                        out.write(block)
+                        block.clear()
+                pending = (digest, count)
+            if pending is not None:
+                block += _RECORD.pack(*pending)
+            out.write(block)
+    finally:
+        for f in files:
+            f.close()
+
+
+def _finish_index(path: str, bits_per_entry: int) -> int:
+    """Append the Bloom filter to a records file and write its header"""
+    count = (os.path.getsize(path) - _RECORDS_START) // RECORD_SIZE
+    bits = max(64, count * bits_per_entry)
+    bits += -bits % 8
+    hashes = max(1, min(16, round(bits_per_entry * math.log(2))))
+    bloom_start = _RECORDS_START + count * RECORD_SIZE
+
+    with open(path, "r+b") as f:
+        f.write(_MAGIC + _HEADER.pack(count, bits, hashes))
+        f.truncate(bloom_start + bits // 8)
+        with mmap.mmap(f.fileno(), 0) as mapping:
+            for offset in range(_RECORDS_START, bloom_start, RECORD_SIZE):
+                for index in _bloom_indexes(mapping[offset:offset + HASH_SIZE], bits, hashes):
+                    mapping[bloom_start + (index >> 3)] |= 1 << (index & 7)
+            mapping.flush()
+    return count
+
+
+class BreachIndex:
+    """Read-only, memory-mapped breach index.
+
+    Pickles as its path, so it can be handed to worker processes; each
+    process maps the file itself.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if self._map[:len(_MAGIC)] != _MAGIC:
+                raise ValueError(f"{path} is not a breach index")
+            self._count, self._bits, self._hashes = _HEADER.unpack_from(
+                self._map, len(_MAGIC))
+            self._bloom_start = _RECORDS_START + self._count * RECORD_SIZE
+            if self._bloom_start + self._bits // 8 > len(self._map):
+                raise ValueError(f"{path} is truncated or corrupt")
+        except ValueError:
+            self._map.close()
+            raise
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _bloom_contains(self, digest: bytes) -> bool:
+        mapping, start = self._map, self._bloom_start
+        return all(mapping[start + (index >> 3)] >> (index & 7) & 1
+                   for index in _bloom_indexes(digest, self._bits, self._hashes))
+
+    def count_hash(self, digest: bytes) -> int:
+        """Times a SHA-1 digest appears in the corpus (0 if absent)"""
+        if len(digest) != HASH_SIZE:
+            raise ValueError(f"Expected a {HASH_SIZE}-byte SHA-1 digest")
+        if not self._bloom_contains(digest):
+            return 0
+        mapping = self._map
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            offset = _RECORDS_START + middle * RECORD_SIZE
+            candidate = mapping[offset:offset + HASH_SIZE]
+            if candidate < digest:
+                low = middle + 1
+            elif candidate > digest:
+                high = middle
+            else:
+                return _RECORD.unpack_from(mapping, offset)[1]
+        return 0
+
+    def count(self, password: str) -> int:
+        """Times password appears in the corpus (0 if absent)"""
+        return self.count_hash(password_hash(password))
+
+    def __contains__(self, password: str) -> bool:
+        return self.count(password) > 0
+
+    def close(self):
+        """Unmap the file"""
+        self._map.close()
+
+    def __enter__(self) -> "BreachIndex":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getstate__(self):
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"])
@@ -0,0 +1,545 @@
+"""
+Command-Line Module for PyPass
+Headless, streaming bulk generation from JSONL or CSV job records
+
+This module must never import tkinter (directly or through src.gui), so it
+can run on servers and in pipelines without a display.
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+from collections import deque
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+
+from .batch import EXECUTORS, iter_generate
+from .derivation import DEFAULT_DERIVATION_VERSION, DERIVATION_VERSIONS
+from .kdf import DEFAULT_KDF, calibrate, estimate_batch_cost, parse_kdf_profile
+from .password_generator import PersonalInfo, PasswordOptions
+
+
+PERSONAL_FIELDS = ("first_name", "last_name", "birth_date",
+                   "current_date", "platform", "city")
+OPTION_FLAGS = ("include_uppercase", "include_lowercase", "include_numbers",
+                "include_special", "exclude_ambiguous")
+OUTPUT_FIELDS = ("line", "id", "platform", "password", "error")
+
+_TRUE_VALUES = {"1", "true", "yes", "y", "on"}
+_FALSE_VALUES = {"0", "false", "no", "n", "off"}
+
+
+def _parse_flag(name: str, value) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE_VALUES:
+        return True
+    if text in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid boolean for {name}: {value!r}")
+
+
+def record_to_job(record: Dict) -> Tuple[PersonalInfo, PasswordOptions]:
+    """Build a (PersonalInfo, PasswordOptions) job from one input record"""
+    personal_info = PersonalInfo(
+        **{field: str(record.get(field) or "") for field in PERSONAL_FIELDS})
+
+    options = PasswordOptions()
+    if record.get("length") not in (None, ""):
+        try:
+            options.length = int(record["length"])
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid length: {record['length']!r}")
+    if record.get("rotation") not in (None, ""):
+        try:
+            options.rotation = int(record["rotation"])
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid rotation: {record['rotation']!r}")
+    # Missing or empty fields keep the PasswordOptions defaults
+    for flag in OPTION_FLAGS:
+        if record.get(flag) not in (None, ""):
+            setattr(options, flag, _parse_flag(flag, record[flag]))
+
+    return personal_info, options
+
+
+def _read_jsonl(stream: TextIO) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, None, f"Invalid JSON: {e.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Record must be a JSON object"
+            continue
+        yield line_number, record, None
+
+
+def _read_csv(stream: TextIO) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+    reader = csv.DictReader(stream)
+    for record in reader:
+        yield reader.line_num, record, None
+
+
+class _ResultWriter:
+    """Writes one output row per input record in JSONL or CSV"""
+
+    def __init__(self, stream: TextIO, output_format: str,
+                 fields: Tuple[str, ...] = OUTPUT_FIELDS):
+        self.stream = stream
+        self.output_format = output_format
+        self._csv = None
+        if output_format == "csv":
+            self._csv = csv.DictWriter(stream, fieldnames=fields)
+            self._csv.writeheader()
+
+    def write(self, row: Dict):
+        if self._csv is not None:
+            self._csv.writerow(row)
+        else:
+            self.stream.write(json.dumps(row) + "\n")
+
+
+def _kdf_argument(spec: str):
+    try:
+        return parse_kdf_profile(spec)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _open_breach_index(path: Optional[str]):
+    if path is None:
+        return None
+    from .breach import BreachIndex
+
+    return BreachIndex(path)
+
+
+def _add_breach_argument(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--breach-index", metavar="PATH", default=None,
+        help="Check passwords against an offline breach index "
+             "(built with 'pypass breach-index')")
+
+
+def _detect_format(path: Optional[str], requested: Optional[str]) -> str:
+    if requested:
+        return requested
+    if path and os.path.splitext(path)[1].lower() == ".csv":
+        return "csv"
+    return "jsonl"
+
+
+def _open_input(path: Optional[str]) -> TextIO:
+    if path in (None, "-"):
+        return sys.stdin
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def _open_output(path: Optional[str]) -> TextIO:
+    if path in (None, "-"):
+        return sys.stdout
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def run_generate(args: argparse.Namespace) -> int:
+    """Stream job records through the batch generator; returns an exit code"""
+    input_format = _detect_format(args.input, args.input_format)
+    output_format = _detect_format(args.output, args.output_format)
+
+    breach_index = _open_breach_index(args.breach_index)
+    source = _open_input(args.input)
+    sink = _open_output(args.output)
+
+    reader = _read_csv if input_format == "csv" else _read_jsonl
+    fields = OUTPUT_FIELDS + (("breached",) if breach_index is not None else ())
+    writer = _ResultWriter(sink, output_format, fields)
+
+    # Input-ordered metadata for records read but not yet written. Invalid
+    # records never reach the pool; they are emitted in their input position.
+    entries: "deque[Tuple[Dict, Optional[str]]]" = deque()
+    failures = 0
+
+    def jobs():
+        for line_number, record, error in reader(source):
+            row = {"line": line_number,
+                   "id": (record or {}).get("id"),
+                   "platform": (record or {}).get("platform")}
+            if error is None:
+                try:
+                    job = record_to_job(record)
+                except ValueError as e:
+                    error = str(e)
+            entries.append((row, error))
+            if error is None:
+                yield job
+
+    def emit(row: Dict, password: Optional[str], error: Optional[str],
+             breached: Optional[bool] = None):
+        nonlocal failures
+        if error is not None:
+            failures += 1
+        row.update(password=password, error=error)
+        if breach_index is not None:
+            row["breached"] = breached
+        writer.write(row)
+
+    try:
+        for result in iter_generate(jobs(), executor=args.executor,
+                                    workers=args.workers,
+                                    derivation_version=args.derivation,
+                                    max_pending=args.max_pending,
+                                    kdf_profile=args.kdf,
+                                    breach_index=breach_index):
+            while True:
+                row, error = entries.popleft()
+                if error is None:
+                    emit(row, result.password, result.error, result.breached)
+                    break
+                emit(row, None, error)
+
+        while entries:
+            row, error = entries.popleft()
+            emit(row, None, error)
+    finally:
+        sink.flush()
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+        if breach_index is not None:
+            breach_index.close()
+
+    return 1 if failures else 0
+
+
+def run_audit(args: argparse.Namespace) -> int:
+    """Score a password list chunk by chunk and write a summary report"""
+    from .strength import audit_passwords
+
+    # surrogateescape keeps undecodable bytes distinct instead of failing
+    breach_index = _open_breach_index(args.breach_index)
+    source = sys.stdin if args.input in (None, "-") else open(
+        args.input, "r", encoding="utf-8", errors="surrogateescape", newline="")
+    try:
+        report = audit_passwords(source, chunk_size=args.chunk_size,
+                                 use_numpy=False if args.no_numpy else None,
+                                 guesses=args.guesses, breach_index=breach_index)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if breach_index is not None:
+            breach_index.close()
+
+    sink = _open_output(args.report)
+    try:
+        sink.write(json.dumps(report, indent=2) + "\n")
+    finally:
+        if sink is not sys.stdout:
+            sink.close()
+    return 0
+
+
+def run_serve(args: argparse.Namespace) -> int:
+    """Run the local HTTP generation service until interrupted"""
+    # Imported lazily: the service is only needed for this command
+    from .service import GenerationService
+
+    service = GenerationService(
+        host=args.host, port=args.port, workers=args.workers,
+        queue_size=args.queue_size, batch_size=args.batch_size,
+        batch_window=args.batch_window / 1000.0,
+        derivation_version=args.derivation, kdf_profile=args.kdf,
+        breach_index=_open_breach_index(args.breach_index))
+    print(f"PyPass service listening on http://{args.host}:{args.port}",
+          file=sys.stderr)
+    service.serve_forever()
+    return 0
+
+
+def run_regenerate(args: argparse.Namespace) -> int:
+    """Regenerate every stored profile for the identities given on input"""
+    from .profile_store import ProfileStore, regenerate_all
+
+    input_format = _detect_format(args.input, args.input_format)
+    source = _open_input(args.input)
+    reader = _read_csv if input_format == "csv" else _read_jsonl
+
+    # Identity records carry an "identity" reference plus the personal fields;
+    # any platform in them is ignored in favour of the stored ones
+    identities = {}
+    try:
+        for line_number, record, error in reader(source):
+            if error is None and not (record.get("identity") or "").strip():
+                error = "Missing identity"
+            if error is not None:
+                raise ValueError(f"line {line_number}: {error}")
+            identities[record["identity"].strip()] = record_to_job(record)[0]
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+    with ProfileStore(args.store) as store:
+        profiles = [profile for profile in store.profiles()
+                    if profile.identity in identities
+                    and args.identity in (None, profile.identity)]
+        if args.rotate:
+            # Persist the next rotation first; v2+ still costs one KDF per identity
+            profiles = [profile.rotated() for profile in profiles]
+            for profile in profiles:
+                store.put(profile)
+
+    sink = _open_output(args.output)
+    writer = _ResultWriter(sink, _detect_format(args.output, args.output_format))
+    failures = 0
+    try:
+        for line, (profile, result) in enumerate(regenerate_all(
+                profiles, identities, executor=args.executor,
+                workers=args.workers), start=1):
+            failures += not result.ok
+            writer.write({"line": line, "id": profile.identity,
+                          "platform": profile.platform,
+                          "password": result.password, "error": result.error})
+    finally:
+        sink.flush()
+        if sink is not sys.stdout:
+            sink.close()
+    return 1 if failures else 0
+
+
+def run_wordlist(args: argparse.Namespace) -> int:
+    """Build a memory-mapped wordlist from a text file (one word per line)"""
+    from .wordlist import WordList, build_wordlist
+
+    source = _open_input(args.input)
+    try:
+        count = build_wordlist(source, args.output)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+    with WordList(args.output) as wordlist:
+        print(json.dumps({"words": count, "digest": wordlist.digest,
+                          "bits_per_word": math.log2(count)}, indent=2))
+    return 0
+
+
+def run_breach_index(args: argparse.Namespace) -> int:
+    """Convert a SHA-1 breach dump into a memory-mapped breach index"""
+    from .breach import build_breach_index
+
+    source = _open_input(args.input)
+    try:
+        count = build_breach_index(source, args.output,
+                                   bits_per_entry=args.bloom_bits,
+                                   memory_records=args.memory_records)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+    print(json.dumps({"hashes": count, "bytes": os.path.getsize(args.output)},
+                     indent=2))
+    return 0
+
+
+def run_calibrate(args: argparse.Namespace) -> int:
+    """Pick KDF parameters for a target latency and estimate a batch's cost"""
+    profile = args.kdf or calibrate(args.kind, args.target_ms / 1000.0)
+    report = estimate_batch_cost(
+        args.jobs, profile, workers=args.workers or os.cpu_count() or 1,
+        identities=args.identities, derivation_version=args.derivation)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+def _add_kdf_argument(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--kdf", type=_kdf_argument, default=None, metavar="PROFILE",
+        help="KDF profile, e.g. pbkdf2-sha512:i=300000 or scrypt:n=32768:r=8:p=1 "
+             f"(default: {DEFAULT_KDF.fingerprint()})")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the argument parser for the pypass command"""
+    parser = argparse.ArgumentParser(
+        prog="pypass",
+        description="PyPass - Offline Password Generator (headless mode)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate = subparsers.add_parser(
+        "generate", help="Generate passwords for JSONL/CSV job records")
+    generate.add_argument(
+        "input", nargs="?", default="-",
+        help="Input file of job records (default: stdin)")
+    generate.add_argument(
+        "-o", "--output", default="-",
+        help="Output file for results (default: stdout)")
+    generate.add_argument(
+        "--input-format", choices=("jsonl", "csv"),
+        help="Input format (default: from file extension, else jsonl)")
+    generate.add_argument(
+        "--output-format", choices=("jsonl", "csv"),
+        help="Output format (default: from file extension, else jsonl)")
+    generate.add_argument(
+        "-w", "--workers", type=int, default=None,
+        help="Number of parallel workers (default: CPU count)")
+    generate.add_argument(
+        "--executor", choices=EXECUTORS, default="process",
+        help="Worker pool type (default: process)")
+    generate.add_argument(
+        "--max-pending", type=int, default=None,
+        help="Maximum records in flight (default: 4 x workers)")
+    generate.add_argument(
+        "--derivation", choices=DERIVATION_VERSIONS,
+        default=DEFAULT_DERIVATION_VERSION,
+        help=f"Derivation version (default: {DEFAULT_DERIVATION_VERSION})")
+    _add_kdf_argument(generate)
+    _add_breach_argument(generate)
+    generate.set_defaults(handler=run_generate)
+
+    audit = subparsers.add_parser(
+        "audit", help="Score a password list (one per line) and summarize")
+    audit.add_argument(
+        "input", nargs="?", default="-",
+        help="Password list file (default: stdin)")
+    audit.add_argument(
+        "-o", "--report", default="-",
+        help="Output file for the JSON summary report (default: stdout)")
+    audit.add_argument(
+        "--chunk-size", type=int, default=50_000,
+        help="Passwords scored per chunk (default: 50000)")
+    audit.add_argument(
+        "--no-numpy", action="store_true",
+        help="Use the pure-Python scorer even if NumPy is installed")
+    audit.add_argument(
+        "--guesses", action="store_true",
+        help="Also summarize pattern-based guess estimates (slower)")
+    _add_breach_argument(audit)
+    audit.set_defaults(handler=run_audit)
+
+    serve = subparsers.add_parser(
+        "serve", help="Run a local HTTP/JSON generation service")
+    serve.add_argument(
+        "--host", default="127.0.0.1",
+        help="Address to bind (default: 127.0.0.1)")
+    serve.add_argument(
+        "--port", type=int, default=8765, help="Port to bind (default: 8765)")
+    serve.add_argument(
+        "-w", "--workers", type=int, default=None,
+        help="Number of worker threads (default: CPU count)")
+    serve.add_argument(
+        "--queue-size", type=int, default=256,
+        help="Queued requests before answering 429 (default: 256)")
+    serve.add_argument(
+        "--batch-size", type=int, default=16,
+        help="Maximum requests per micro-batch (default: 16)")
+    serve.add_argument(
+        "--batch-window", type=float, default=5.0,
+        help="Milliseconds to wait for a micro-batch to fill (default: 5)")
+    serve.add_argument(
+        "--derivation", choices=DERIVATION_VERSIONS,
+        default=DEFAULT_DERIVATION_VERSION,
+        help=f"Derivation version (default: {DEFAULT_DERIVATION_VERSION})")
+    _add_kdf_argument(serve)
+    _add_breach_argument(serve)
+    serve.set_defaults(handler=run_serve)
+
+    regenerate_parser = subparsers.add_parser(
+        "regenerate", help="Regenerate all stored profiles for given identities")
+    regenerate_parser.add_argument(
+        "input", nargs="?", default="-",
+        help="Identity records: 'identity' plus personal fields (default: stdin)")
+    regenerate_parser.add_argument(
+        "--store", required=True, help="Profile store directory")
+    regenerate_parser.add_argument(
+        "--identity", default=None,
+        help="Only regenerate profiles of this identity")
+    regenerate_parser.add_argument(
+        "--rotate", action="store_true",
+        help="Advance each profile to its next rotation, save it, and output "
+             "the new passwords")
+    regenerate_parser.add_argument(
+        "-o", "--output", default="-",
+        help="Output file for results (default: stdout)")
+    regenerate_parser.add_argument(
+        "--input-format", choices=("jsonl", "csv"),
+        help="Input format (default: from file extension, else jsonl)")
+    regenerate_parser.add_argument(
+        "--output-format", choices=("jsonl", "csv"),
+        help="Output format (default: from file extension, else jsonl)")
+    regenerate_parser.add_argument(
+        "-w", "--workers", type=int, default=None,
+        help="Number of parallel workers (default: CPU count)")
+    regenerate_parser.add_argument(
+        "--executor", choices=EXECUTORS, default="process",
+        help="Worker pool type (default: process)")
+    regenerate_parser.set_defaults(handler=run_regenerate)
+
+    wordlist_parser = subparsers.add_parser(
+        "wordlist", help="Build a passphrase wordlist file from a text list")
+    wordlist_parser.add_argument(
+        "input", nargs="?", default="-",
+        help="Text file with one word per line (default: stdin)")
+    wordlist_parser.add_argument(
+        "-o", "--output", required=True, help="Wordlist file to write")
+    wordlist_parser.set_defaults(handler=run_wordlist)
+
+    breach_parser = subparsers.add_parser(
+        "breach-index", help="Build an offline breach index from a SHA-1 dump")
+    breach_parser.add_argument(
+        "input", nargs="?", default="-",
+        help="Text dump with one SHA1[:COUNT] per line, e.g. from Have I Been "
+             "Pwned (default: stdin)")
+    breach_parser.add_argument(
+        "-o", "--output", required=True, help="Breach index file to write")
+    breach_parser.add_argument(
+        "--bloom-bits", type=int, default=10,
+        help="Bloom filter bits per hash (default: 10, ~1%% false positives)")
+    breach_parser.add_argument(
+        "--memory-records", type=int, default=1_000_000,
+        help="Hashes sorted in memory per run for unsorted dumps "
+             "(default: 1000000)")
+    breach_parser.set_defaults(handler=run_breach_index)
+
+    calibrate_parser = subparsers.add_parser(
+        "calibrate",
+        help="Choose KDF parameters for a target latency and estimate batch cost")
+    calibrate_parser.add_argument(
+        "--kind", choices=("pbkdf2", "scrypt"), default="pbkdf2",
+        help="KDF to calibrate (default: pbkdf2)")
+    calibrate_parser.add_argument(
+        "--target-ms", type=float, default=250.0,
+        help="Target time for one derivation in milliseconds (default: 250)")
+    calibrate_parser.add_argument(
+        "--jobs", type=int, default=1,
+        help="Batch size to estimate wall time for (default: 1)")
+    calibrate_parser.add_argument(
+        "--identities", type=int, default=None,
+        help="Distinct identities in the batch, for v2+ (default: 1)")
+    calibrate_parser.add_argument(
+        "-w", "--workers", type=int, default=None,
+        help="Number of parallel workers (default: CPU count)")
+    calibrate_parser.add_argument(
+        "--derivation", choices=DERIVATION_VERSIONS,
+        default=DEFAULT_DERIVATION_VERSION,
+        help=f"Derivation version (default: {DEFAULT_DERIVATION_VERSION})")
+    _add_kdf_argument(calibrate_parser)
+    calibrate_parser.set_defaults(handler=run_calibrate)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for ``python -m pypass``"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.handler(args)
+    except (OSError, ValueError) as e:
+        parser.exit(2, f"pypass: error: {e}\n")
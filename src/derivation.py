@@ -0,0 +1,104 @@
+"""
+Key Derivation Module
+Versioned schemes that turn personal info and options into PRNG seed material
+"""
+
+import hashlib
+import hmac
+
+from .kdf import DEFAULT_KDF, SEED_LENGTH, KDFProfile
+from .keystream import Blake2bKeystream, Sha512Keystream, Shake256Keystream
+
+
+# v1: one PBKDF2 run per (identity, platform, options) - the original scheme
+# v2: one PBKDF2 run per identity, cheap HKDF expansion per platform/options
+# v3: v2 keys with unbiased rejection sampling instead of 4-byte modulo draws
+# v4: v3 plus strict, bounded personal-info pattern repair
+# v5: v4 drawing from a SHAKE-256 keystream instead of SHA-512 counter mode
+# v6: v4 drawing from a keyed BLAKE2b keystream
+DERIVATION_VERSIONS = ("v1", "v2", "v3", "v4", "v5", "v6")
+DEFAULT_DERIVATION_VERSION = "v1"
+
+PBKDF2_ITERATIONS = DEFAULT_KDF.iterations
+
+_V2_MASTER_SALT = b"pypass/v2/master"
+_V2_SUBKEY_LABEL = b"pypass/v2/subkey"
+
+
+def validate_version(version: str) -> str:
+    """Return version unchanged, or raise ValueError if it is unknown"""
+    if version not in DERIVATION_VERSIONS:
+        raise ValueError(
+            f"Unknown derivation version {version!r}; "
+            f"expected one of: {', '.join(DERIVATION_VERSIONS)}")
+    return version
+
+
+def _version_number(version: str) -> int:
+    return int(validate_version(version)[1:])
+
+
+def uses_master_key(version: str) -> bool:
+    """True for versions deriving per-platform keys from a master key"""
+    return _version_number(version) >= 2
+
+
+def uses_unbiased_sampler(version: str) -> bool:
+    """True for versions drawing characters by rejection sampling"""
+    return _version_number(version) >= 3
+
+
+def uses_strict_patterns(version: str) -> bool:
+    """True for versions repairing the full personal-info pattern set"""
+    return _version_number(version) >= 4
+
+
+def keystream_backend(version: str) -> str:
+    """Name of the keystream (see keystream.KEYSTREAMS) a version draws from"""
+    number = _version_number(version)
+    if number == 5:
+        return Shake256Keystream.name
+    if number == 6:
+        return Blake2bKeystream.name
+    return Sha512Keystream.name
+
+
+def derive_v1_seed(seed_basis: str, option_fingerprint: str,
+                   profile: KDFProfile = DEFAULT_KDF) -> bytes:
+    """Original scheme: slow KDF over the full entropy seed, salted by options"""
+    return profile.derive(seed_basis.encode('utf-8'),
+                          option_fingerprint.encode('utf-8'))
+
+
+def derive_master_key(identity_seed: str,
+                      profile: KDFProfile = DEFAULT_KDF) -> bytes:
+    """Slow, once-per-identity master key for the v2 scheme"""
+    return profile.derive(identity_seed.encode('utf-8'), _V2_MASTER_SALT)
+
+
+def hkdf_expand(prk: bytes, info: bytes, length: int = SEED_LENGTH) -> bytes:
+    """HKDF-Expand (RFC 5869) with HMAC-SHA512"""
+    hash_length = hashlib.sha512().digest_size
+    if length <= 0 or length > 255 * hash_length:
+        raise ValueError("Invalid HKDF output length")
+
+    output = b""
+    block = b""
+    counter = 1
+    while len(output) < length:
+        block = hmac.new(prk, block + info + bytes([counter]),
+                         hashlib.sha512).digest()
+        output += block
+        counter += 1
+    return output[:length]
+
+
+def derive_subkey(master_key: bytes, platform: str,
+                  derivation_fingerprint: str) -> bytes:
+    """Cheap per-platform seed material expanded from a v2 master key"""
+    info = b"\x00".join([
+        _V2_SUBKEY_LABEL,
+        platform.encode('utf-8'),
+        derivation_fingerprint.encode('utf-8'),
+    ])
+    return hkdf_expand(master_key, info)
@@ -0,0 +1,414 @@
+"""
+Guess Estimator Module
+zxcvbn-style estimate of how many guesses an attacker needs for a password
+
+The password is covered by matches (dictionary words, keyboard walks,
+dates, repeats, sequences) or brute-forced characters, and a dynamic
+program picks the cover needing the fewest guesses. Unlike Shannon entropy
+of the string itself, this recognizes "P@ssw0rd1990" as weak.
+
+Nothing is cached across calls, so passwords never linger in memory beyond
+the call that scored them.
+"""
+
+import math
+import re
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from .pattern_matcher import fold
+
+
+# Frequency-ranked common passwords and words (most common first). Parsed
+# into a rank table on first use.
+_RANKED_WORDS = """
+123456 password 12345678 qwerty 123456789 12345 1234 111111 1234567 dragon
+123123 baseball abc123 football monkey letmein shadow master 696969 666666
+qwertyuiop 123321 mustang 1234567890 michael 654321 superman 1qaz2wsx 7777777
+121212 000000 qazwsx 123qwe killer trustno1 jordan jennifer zxcvbnm asdfgh
+hunter buster soccer harley batman andrew tigger sunshine iloveyou 2000
+charlie robert thomas hockey ranger daniel starwars klaster 112233 george
+computer michelle jessica pepper 1111 zxcvbn 555555 11111111 131313 freedom
+777777 pass maggie 159753 aaaaaa ginger princess joshua cheese amanda summer
+love ashley nicole chelsea biteme matthew access yankees 987654321 dallas
+austin thunder taylor matrix welcome admin login secret hello monkey1
+passw0rd password1 qwerty123 iloveyou1 princess1 abcdef abcdefg flower
+lovely angel blessed orange purple silver golden diamond butterfly chocolate
+liverpool arsenal chelsea1 london paris berlin madrid tokyo newyork
+football1 baseball1 welcome1 hello123 admin123 root toor guest default
+changeme temp test testing master1 access1 shadow1 dragon1 monkey123
+alice bob smith johnson williams brown jones miller davis garcia wilson
+anderson taylor moore jackson martin lee thompson white harris clark
+lewis robinson walker young allen king wright scott green baker adams
+nelson hill campbell mitchell roberts carter phillips evans turner
+james john david richard joseph charles christopher mark paul steven
+kevin brian edward ronald anthony mary patricia linda barbara elizabeth
+susan margaret sarah karen nancy lisa betty sandra emily emma olivia
+sophia isabella mia charlotte amelia harper evelyn abigail ella
+january february march april may june july august september october
+november december monday tuesday wednesday thursday friday saturday sunday
+spring winter autumn the and you that was for are with his they
+have this from word what some other time were when your can said
+there use each which she how their will way about many then them
+would write like these her long make thing see him two has look
+more day could come did number sound most people over know water
+than call first who down side been now find any new work part
+take get place made live where after back little only round man
+year came show every good give our under name very through just
+form great think say help low line differ turn cause much mean
+before move right boy old too same tell does set three want air
+well also play small end put home read hand port large spell add
+even land here must big high such follow act why ask men change
+went light kind off need house picture try again animal point
+mother world near build self earth father head stand own page
+should country found answer school grow study still learn plant
+cover food sun four between state keep eye never last let thought
+city tree cross farm hard start might story saw far sea draw left
+late run while press close night real life few north open seem
+together next white children begin got walk example ease paper
+group always music those both mark often letter until mile river
+car feet care second book carry took science eat room friend began
+idea fish mountain stop once base hear horse cut sure watch color
+face wood main enough plain girl usual young ready above ever red
+list though feel talk bird soon body dog family direct pose leave
+song measure door product black short numeral class wind question
+happen complete ship area half rock order fire south problem piece
+told knew pass since top whole king space heard best hour better
+true during hundred five remember step early hold west ground
+interest reach fast verb sing listen six table travel less morning
+ten simple several vowel toward war lay against pattern slow center
+love person money serve appear road map rain rule govern pull cold
+notice voice unit power town fine certain fly fall lead cry dark
+machine note wait plan figure star box noun field rest correct able
+pound done beauty drive stood contain front teach week final gave
+green quick develop ocean warm free minute strong special mind
+behind clear tail produce fact street inch multiply nothing course
+stay wheel full force blue object decide surface deep moon island
+foot system busy test record boat common gold possible plane stead
+dry wonder laugh thousand ago ran check game shape equate hot miss
+brought heat snow tire bring yes distant fill east paint language
+among email bank google facebook twitter amazon apple microsoft
+windows linux android iphone samsung netflix youtube instagram
+"""
+
+_WORD_RANKS: Optional[Dict[str, Tuple[int, str]]] = None
+# Every prefix of a folded word or of a reversed folded word
+_WORD_PREFIXES: Optional[FrozenSet[str]] = None
+MAX_WORD_LENGTH = 16
+
+
+def _word_ranks() -> Dict[str, Tuple[int, str]]:
+    """Folded word -> (frequency rank (1 = most common), lowercase word),
+    built on first use"""
+    global _WORD_RANKS, _WORD_PREFIXES
+    if _WORD_RANKS is None:
+        ranks = {}
+        for word in _RANKED_WORDS.split():
+            ranks.setdefault(fold(word), (len(ranks) + 1, word.lower()))
+        _WORD_PREFIXES = frozenset(
+            form[:end] for word in ranks for form in (word, word[::-1])
+            for end in range(1, len(form) + 1))
+        _WORD_RANKS = ranks
+    return _WORD_RANKS
+
+
+# Keyboard rows for walk detection (QWERTY, unshifted and shifted)
+_KEYBOARD_ROWS = ("`1234567890-=", "qwertyuiop[]\\", "asdfghjkl;'", "zxcvbnm,./")
+_SHIFTED_ROWS = ("~!@#$%^&*()_+", "QWERTYUIOP{}|", 'ASDFGHJKL:"', "ZXCVBNM<>?")
+_KEYBOARD_STARTS = 94
+_KEYBOARD_AVERAGE_DEGREE = 4.6
+_ADJACENCY: Optional[Dict[str, frozenset]] = None
+
+
+def _adjacency() -> Dict[str, frozenset]:
+    """Key -> neighbouring keys (same or adjacent row, column within one)"""
+    global _ADJACENCY
+    if _ADJACENCY is None:
+        positions = {}
+        for rows in (_KEYBOARD_ROWS, _SHIFTED_ROWS):
+            for row_index, row in enumerate(rows):
+                for column, key in enumerate(row):
+                    positions[key] = (row_index, column)
+        adjacency = {}
+        for key, (row, column) in positions.items():
+            adjacency[key] = frozenset(
+                other for other, (other_row, other_column) in positions.items()
+                if abs(other_row - row) <= 1 and abs(other_column - column) <= 1
+                and (other_row, other_column) != (row, column))
+        _ADJACENCY = adjacency
+    return _ADJACENCY
+
+
+REFERENCE_YEAR = 2025
+MIN_YEAR_SPACE = 20
+_DATE_PATTERN = re.compile(
+    r"(?<!\d)(?:(\d{1,2})[-/._ ]?(\d{1,2})[-/._ ]?(\d{4}|\d{2})"
+    r"|(\d{4})[-/._ ]?(\d{1,2})[-/._ ]?(\d{1,2}))(?!\d)")
+_YEAR_PATTERN = re.compile(r"(?<!\d)(19\d\d|20\d\d)(?!\d)")
+
+# Repeated blocks of up to MAX_REPEAT_UNIT characters; bounding the unit
+# keeps the scan linear in the password length
+MAX_REPEAT_UNIT = 16
+_GREEDY_REPEAT = re.compile(r"(.{1,%d})\1+" % MAX_REPEAT_UNIT, re.DOTALL)
+_LAZY_REPEAT = re.compile(r"(.{1,%d}?)\1+" % MAX_REPEAT_UNIT, re.DOTALL)
+
+SCORE_THRESHOLDS = (1e3, 1e6, 1e8, 1e10)  # guesses separating scores 0-4
+
+
+class Match(NamedTuple):
+    """One recognized piece of a password"""
+
+    pattern: str  # dictionary, reverse_dictionary, keyboard, date, repeat, sequence, bruteforce
+    start: int
+    end: int  # exclusive
+    guesses: float
+
+
+class GuessEstimate(NamedTuple):
+    """Estimated attack cost of a password"""
+
+    guesses: float
+    log10_guesses: float
+    score: int  # 0 (too guessable) .. 4 (very unguessable)
+    sequence: Tuple[Match, ...]  # the cheapest cover of the password
+
+    @property
+    def bits(self) -> float:
+        """Guesses expressed as bits"""
+        return math.log2(self.guesses)
+
+
+def _cardinality(text: str) -> int:
+    """Size of the character space text was drawn from"""
+    size = 0
+    if any(c.islower() for c in text):
+        size += 26
+    if any(c.isupper() for c in text):
+        size += 26
+    if any(c.isdigit() for c in text):
+        size += 10
+    if any(not c.isalnum() for c in text):
+        size += 33
+    return size or 26
+
+
+def _case_variations(token: str) -> float:
+    """Extra guesses for capitalization beyond all-lowercase"""
+    if token.lower() == token:
+        return 1.0
+    upper = sum(c.isupper() for c in token)
+    if token[0].isupper() and upper == 1 or token.isupper():
+        return 2.0
+    lower = sum(c.islower() for c in token)
+    return float(sum(math.comb(upper + lower, k)
+                     for k in range(1, min(upper, lower) + 1)))
+
+
+def _dictionary_matches(password: str, folded: str) -> List[Match]:
+    ranks = _word_ranks()
+    prefixes = _WORD_PREFIXES
+    length = len(password)
+    matches = []
+    # The scan from a start depends only on the next MAX_WORD_LENGTH
+    # characters, so repetitive passwords ("1" * 128) reuse earlier scans:
+    # window -> ((length, pattern, guesses), ...)
+    scanned: Dict[str, Tuple[Tuple[int, str, float], ...]] = {}
+    # Substring -> (pattern, guesses) or None; repeated words score once
+    scored: Dict[str, Optional[Tuple[str, float]]] = {}
+    for start in range(length):
+        window = password[start:start + MAX_WORD_LENGTH]
+        found = scanned.get(window)
+        if found is None:
+            found = scanned[window] = _scan_window(
+                window, folded[start:start + MAX_WORD_LENGTH], ranks, prefixes, scored)
+        for size, pattern, guesses in found:
+            matches.append(Match(pattern, start, start + size, guesses))
+    return matches
+
+
+def _scan_window(window: str, folded: str, ranks: Dict[str, Tuple[int, str]],
+                 prefixes: frozenset, scored: Dict[str, Optional[Tuple[str, float]]]
+                 ) -> Tuple[Tuple[int, str, float], ...]:
+    """(length, pattern, guesses) of every word starting window"""
+    found = []
+    for end in range(1, len(window) + 1):
+        token = folded[:end]
+        if token not in prefixes:
+            break  # No word (or reversed word) continues this way
+        original = window[:end]
+        if original in scored:
+            word = scored[original]
+        else:
+            word = scored[original] = _score_word(original, token, ranks)
+        if word is not None:
+            found.append((end,) + word)
+    return tuple(found)
+
+
+def _score_word(original: str, token: str,
+                ranks: Dict[str, Tuple[int, str]]) -> Optional[Tuple[str, float]]:
+    """(pattern, guesses) if the folded token is a (reversed) word"""
+    entry = ranks.get(token)
+    if entry is not None:
+        pattern, (rank, word) = "dictionary", entry
+    elif len(token) >= 3 and token[::-1] in ranks:
+        rank, word = ranks[token[::-1]]
+        pattern, rank, word = "reverse_dictionary", rank * 2, word[::-1]
+    else:
+        return None
+    # Substituted characters (leet, or any symbol folded to a letter).
+    # Compared with the word itself: fold() also maps plain letters
+    # (l -> i), which are not substitutions.
+    leet = 2.0 if original.lower() != word else 1.0
+    return pattern, max(rank, 1) * _case_variations(original) * leet
+
+
+def _keyboard_matches(password: str) -> List[Match]:
+    adjacency = _adjacency()
+    matches = []
+    start = 0
+    while start < len(password) - 2:
+        end = start + 1
+        while end < len(password) and password[end] in adjacency.get(password[end - 1], ()):
+            end += 1
+        if end - start >= 3:
+            matches.append(Match("keyboard", start, end,
+                                 _KEYBOARD_STARTS * _KEYBOARD_AVERAGE_DEGREE ** (end - start - 1)))
+            start = end
+        else:
+            start += 1
+    return matches
+
+
+def _year_space(year: int) -> int:
+    return max(abs(year - REFERENCE_YEAR), MIN_YEAR_SPACE)
+
+
+def _date_matches(password: str) -> List[Match]:
+    matches = []
+    for match in _DATE_PATTERN.finditer(password):
+        if match.group(1) is not None:
+            day, month, year = (int(g) for g in match.group(1, 2, 3))
+        else:
+            year, month, day = (int(g) for g in match.group(4, 5, 6))
+        if month > 12 >= day:
+            day, month = month, day  # Month-first ordering
+        if not (1 <= month <= 12 and 1 <= day <= 31):
+            continue
+        if year < 100:
+            year += 1900 if year > REFERENCE_YEAR % 100 else 2000
+        guesses = 365 * _year_space(year)
+        if not match.group(0).isdigit():
+            guesses *= 4  # Separator choice
+        matches.append(Match("date", match.start(), match.end(), guesses))
+    for match in _YEAR_PATTERN.finditer(password):
+        matches.append(Match("date", match.start(), match.end(),
+                             _year_space(int(match.group(0)))))
+    return matches
+
+
+def _repeat_matches(password: str) -> List[Match]:
+    # One left-to-right regex pass, as zxcvbn does: at each repeat, take the
+    # longer of the greedy (largest unit) and lazy (smallest unit) match
+    matches = []
+    position = 0
+    while True:
+        greedy = _GREEDY_REPEAT.search(password, position)
+        if greedy is None:
+            return matches
+        lazy = _LAZY_REPEAT.search(password, position)
+        if greedy.end() - greedy.start() > lazy.end() - lazy.start():
+            match = greedy
+            block = _LAZY_REPEAT.fullmatch(greedy.group(0)).group(1)
+        else:
+            match, block = lazy, lazy.group(1)
+        unit = len(block)
+        count = (match.end() - match.start()) // unit
+        if unit > 1 or count >= 3:
+            base = _cardinality(block) ** unit if unit < 4 else 10 ** unit
+            matches.append(Match("repeat", match.start(), match.end(), base * count))
+        position = match.end()
+
+
+def _sequence_matches(password: str) -> List[Match]:
+    matches = []
+    start = 0
+    length = len(password)
+    while start < length - 2:
+        delta = ord(password[start + 1]) - ord(password[start])
+        end = start + 1
+        if delta in (-1, 1, -2, 2):
+            while end < length and ord(password[end]) - ord(password[end - 1]) == delta:
+                end += 1
+        if end - start >= 3:
+            first = password[start]
+            if first in "aAzZ019":
+                base = 4
+            elif first.isdigit():
+                base = 10
+            else:
+                base = 26
+            matches.append(Match("sequence", start, end,
+                                 base * (end - start) * (2 if delta < 0 else 1)))
+            start = end
+        else:
+            start += 1
+    return matches
+
+
+def estimate_guesses(password: str) -> GuessEstimate:
+    """Estimate guesses needed for password (well under a millisecond at 128 characters)"""
+    if not password:
+        return GuessEstimate(1.0, 0.0, 0, ())
+
+    folded = fold(password)
+    candidates = (_dictionary_matches(password, folded) + _keyboard_matches(password)
+                  + _date_matches(password) + _repeat_matches(password)
+                  + _sequence_matches(password))
+    ending_at: Dict[int, List[Match]] = {}
+    for match in candidates:
+        ending_at.setdefault(match.end, []).append(match)
+
+    # For the cheapest cover of password[:i]: its guesses, its segment
+    # count, and its last match (None for a brute-forced character). Each
+    # extra segment multiplies by the segment count, as an attacker must
+    # also guess how the pieces are arranged.
+    char_guesses = float(_cardinality(password))
+    length = len(password)
+    best_guesses = [1.0] * (length + 1)
+    best_segments = [0] * (length + 1)
+    best_match: List[Optional[Match]] = [None] * (length + 1)
+    for end in range(1, length + 1):
+        previous = end - 1
+        # Adjacent brute-force characters merge into one segment
+        if previous and best_match[previous] is None:
+            segments = best_segments[previous]
+            guesses = best_guesses[previous] * char_guesses
+        else:
+            segments = best_segments[previous] + 1
+            guesses = best_guesses[previous] * char_guesses * segments
+        choice = None
+        for match in ending_at.get(end, ()):
+            match_segments = best_segments[match.start] + 1
+            match_guesses = best_guesses[match.start] * match.guesses * match_segments
+            if match_guesses < guesses:
+                guesses, segments, choice = match_guesses, match_segments, match
+        best_guesses[end], best_segments[end], best_match[end] = guesses, segments, choice
+
+    sequence = []
+    position = length
+    while position > 0:
+        match = best_match[position]
+        if match is None:
+            start = position - 1
+            while start and best_match[start] is None:
+                start -= 1
+            match = Match("bruteforce", start, position,
+                          char_guesses ** (position - start))
+        sequence.append(match)
+        position = match.start
+    sequence.reverse()
+
+    guesses = max(1.0, best_guesses[length])
+    log10_guesses = math.log10(guesses)
+    score = sum(guesses >= threshold for threshold in SCORE_THRESHOLDS)
+    return GuessEstimate(guesses, log10_guesses, score, tuple(sequence))
@@ -0,0 +1,115 @@
+"""
+Instrumentation Module
+Opt-in phase timings and counters for SecurePasswordGenerator
+
+Observers only ever receive phase names, timestamps and counts - never
+personal info, seed material or password characters.
+"""
+
+import threading
+import time
+from typing import Dict
+
+
+# Phases reported by generate_password, in order; "total" spans all of them
+PHASES = ("kdf", "sample", "requirements", "patterns", "total")
+COUNTERS = ("prng_refills", "prng_bytes", "requirement_replacements",
+            "pattern_repair_iterations")
+
+
+class GenerationObserver:
+    """Receives instrumentation events; override the methods you need"""
+
+    def phase(self, name: str, start: float, end: float):
+        """A phase ran from start to end (time.perf_counter seconds)"""
+
+    def count(self, name: str, amount: int):
+        """A counter advanced by amount during one generation"""
+
+
+class GenerationStats(GenerationObserver):
+    """Observer aggregating timings and counters across generations.
+
+    Safe to share between threads, e.g. one instance for every generator
+    of a thread pool.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Discard everything recorded so far"""
+        with self._lock:
+            self._phases: Dict[str, Dict[str, float]] = {}
+            self._counters: Dict[str, int] = {name: 0 for name in COUNTERS}
+
+    def phase(self, name: str, start: float, end: float):
+        elapsed = end - start
+        with self._lock:
+            stats = self._phases.get(name)
+            if stats is None:
+                self._phases[name] = {"calls": 1, "total": elapsed,
+                                      "min": elapsed, "max": elapsed}
+            else:
+                stats["calls"] += 1
+                stats["total"] += elapsed
+                stats["min"] = min(stats["min"], elapsed)
+                stats["max"] = max(stats["max"], elapsed)
+
+    def count(self, name: str, amount: int):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def to_dict(self) -> Dict:
+        """Aggregated stats; phase times are in seconds"""
+        with self._lock:
+            phases = {}
+            for name, stats in self._phases.items():
+                phases[name] = dict(stats, mean=stats["total"] / stats["calls"])
+            return {
+                "generations": self._phases.get("total", {}).get("calls", 0),
+                "phases": phases,
+                "counters": dict(self._counters),
+            }
+
+    def to_json(self, **kwargs) -> str:
+        """Aggregated stats as a JSON document"""
+        import json
+
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+class PhaseTimer:
+    """Reports consecutive phases of one generation to an observer"""
+
+    __slots__ = ("_observer", "_start", "_last")
+
+    def __init__(self, observer: GenerationObserver):
+        self._observer = observer
+        self._start = self._last = time.perf_counter()
+
+    def lap(self, name: str):
+        """End the current phase, naming it, and start the next one"""
+        now = time.perf_counter()
+        self._observer.phase(name, self._last, now)
+        self._last = now
+
+    def finish(self):
+        """Report the whole generation as the "total" phase"""
+        self._observer.phase("total", self._start, self._last)
+
+
+class _NullTimer:
+    """Stand-in used when instrumentation is off; every call is a no-op"""
+
+    __slots__ = ()
+
+    def lap(self, name: str):
+        pass
+
+    def finish(self):
+        pass
+
+
+NULL_TIMER = _NullTimer()
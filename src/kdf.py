@@ -0,0 +1,196 @@
+"""
+KDF Profile Module
+Selectable, calibratable key stretching (PBKDF2 or memory-hard scrypt)
+"""
+
+import hashlib
+import math
+import re
+import time
+from typing import Callable, Dict, Optional
+
+
+SEED_LENGTH = 64
+
+# Floors applied by calibrate(); below these the KDF stops being a real cost
+MIN_PBKDF2_ITERATIONS = 50_000
+MIN_SCRYPT_N = 2 ** 12
+MAX_SCRYPT_N = 2 ** 20
+
+
+class KDFProfile:
+    """A slow key derivation function together with its cost parameters"""
+
+    kind = ""
+
+    def derive(self, password: bytes, salt: bytes) -> bytes:
+        """Stretch password into SEED_LENGTH bytes of seed material"""
+        raise NotImplementedError
+
+    def fingerprint(self) -> str:
+        """Deterministic description of the function and its parameters"""
+        raise NotImplementedError
+
+    def measure(self, repeats: int = 1,
+                clock: Callable[[], float] = time.perf_counter) -> float:
+        """Seconds per derivation on this machine (best of repeats)"""
+        best = math.inf
+        for _ in range(repeats):
+            start = clock()
+            self.derive(b"pypass-calibration", b"pypass-calibration-salt")
+            best = min(best, clock() - start)
+        return best
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, KDFProfile) and \
+            self.fingerprint() == other.fingerprint()
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint())
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.fingerprint()}>"
+
+
+class PBKDF2Profile(KDFProfile):
+    """PBKDF2-HMAC-SHA512 with a configurable iteration count"""
+
+    kind = "pbkdf2"
+
+    def __init__(self, iterations: int = 200_000):
+        if iterations < 1:
+            raise ValueError("PBKDF2 iterations must be positive")
+        self.iterations = iterations
+
+    def derive(self, password: bytes, salt: bytes) -> bytes:
+        return hashlib.pbkdf2_hmac('sha512', password, salt,
+                                   self.iterations, dklen=SEED_LENGTH)
+
+    def fingerprint(self) -> str:
+        return f"pbkdf2-sha512:i={self.iterations}"
+
+
+class ScryptProfile(KDFProfile):
+    """Memory-hard scrypt; needs about 128 * n * r bytes of RAM per derivation"""
+
+    kind = "scrypt"
+
+    def __init__(self, n: int = 2 ** 15, r: int = 8, p: int = 1):
+        if n < 2 or n & (n - 1):
+            raise ValueError("scrypt n must be a power of two greater than 1")
+        if r < 1 or p < 1:
+            raise ValueError("scrypt r and p must be positive")
+        self.n = n
+        self.r = r
+        self.p = p
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate working memory of one derivation"""
+        return 128 * self.n * self.r * self.p
+
+    def derive(self, password: bytes, salt: bytes) -> bytes:
+        # OpenSSL's default 32 MiB ceiling is too low for n >= 2**15
+        maxmem = 2 * 128 * self.n * self.r * self.p + 2 ** 20
+        return hashlib.scrypt(password, salt=salt, n=self.n, r=self.r,
+                              p=self.p, maxmem=maxmem, dklen=SEED_LENGTH)
+
+    def fingerprint(self) -> str:
+        return f"scrypt:n={self.n}:r={self.r}:p={self.p}"
+
+
+DEFAULT_KDF = PBKDF2Profile()
+
+_SPEC_PATTERN = re.compile(r"^(pbkdf2(?:-sha512)?|scrypt)((?::\w+=\d+)*)$")
+
+
+def parse_kdf_profile(spec: str) -> KDFProfile:
+    """Parse a fingerprint such as 'pbkdf2-sha512:i=300000' or 'scrypt:n=32768:r=8:p=1'"""
+    match = _SPEC_PATTERN.match(spec.strip().lower())
+    if not match:
+        raise ValueError(f"Invalid KDF profile: {spec!r}")
+
+    kind, params_text = match.groups()
+    params: Dict[str, int] = {}
+    for item in params_text.split(":")[1:]:
+        key, value = item.split("=")
+        params[key] = int(value)
+
+    try:
+        if kind.startswith("pbkdf2"):
+            unknown = set(params) - {"i"}
+            profile = PBKDF2Profile(params.get("i", DEFAULT_KDF.iterations))
+        else:
+            unknown = set(params) - {"n", "r", "p"}
+            profile = ScryptProfile(**params)
+    except TypeError:
+        unknown = set(params)
+    if unknown:
+        raise ValueError(f"Unknown KDF parameters: {', '.join(sorted(unknown))}")
+    return profile
+
+
+def calibrate(kind: str = "pbkdf2", target_seconds: float = 0.25,
+              r: int = 8, p: int = 1) -> KDFProfile:
+    """Pick parameters so one derivation takes about target_seconds here.
+
+    PBKDF2 scales linearly in its iteration count, so one probe is enough.
+    scrypt's n must be a power of two; the nearest one (in log scale) to the
+    target is chosen, within [MIN_SCRYPT_N, MAX_SCRYPT_N].
+    """
+    if target_seconds <= 0:
+        raise ValueError("Target time must be positive")
+
+    if kind == "pbkdf2":
+        probe = PBKDF2Profile(20_000)
+        per_iteration = probe.measure(repeats=3) / probe.iterations
+        iterations = int(target_seconds / per_iteration) // 1000 * 1000
+        return PBKDF2Profile(max(MIN_PBKDF2_ITERATIONS, iterations))
+
+    if kind == "scrypt":
+        probe = ScryptProfile(MIN_SCRYPT_N, r, p)
+        per_n = probe.measure(repeats=3) / probe.n
+        exponent = round(math.log2(max(1.0, target_seconds / per_n)))
+        n = min(MAX_SCRYPT_N, max(MIN_SCRYPT_N, 2 ** exponent))
+        return ScryptProfile(n, r, p)
+
+    raise ValueError("KDF kind must be 'pbkdf2' or 'scrypt'")
+
+
+def estimate_batch_cost(jobs: int, profile: Optional[KDFProfile] = None,
+                        workers: int = 1, identities: Optional[int] = None,
+                        derivation_version: str = "v1",
+                        kdf_seconds: Optional[float] = None,
+                        overhead_seconds: float = 0.0002) -> Dict:
+    """Predict wall time for a batch of jobs before running it.
+
+    v1 pays one KDF per job; v2 and later pay one per identity (default: all
+    jobs share one identity). KDF runs are spread over ``workers``; since a
+    worker can only run one KDF at a time, wall time is rounded up to whole
+    rounds. ``overhead_seconds`` covers sampling and repair per job.
+    """
+    # Imported here: derivation imports this module
+    from .derivation import uses_master_key, validate_version
+
+    if jobs < 0 or workers < 1:
+        raise ValueError("jobs must be >= 0 and workers >= 1")
+    validate_version(derivation_version)
+    profile = profile or DEFAULT_KDF
+    if kdf_seconds is None:
+        kdf_seconds = profile.measure()
+
+    if uses_master_key(derivation_version):
+        kdf_runs = min(jobs, identities if identities is not None else 1)
+    else:
+        kdf_runs = jobs
+
+    rounds = math.ceil(kdf_runs / workers)
+    seconds = rounds * kdf_seconds + jobs * overhead_seconds / workers
+    return {
+        "jobs": jobs,
+        "workers": workers,
+        "kdf": profile.fingerprint(),
+        "kdf_runs": kdf_runs,
+        "kdf_seconds": kdf_seconds,
+        "estimated_seconds": seconds,
+    }
@@ -0,0 +1,197 @@
+"""
+Keystream Module
+Seekable deterministic byte streams that feed the generator's PRNG
+
+Every backend splits the stream into independently computed blocks, so any
+byte offset is reached by computing at most one block:
+
+    sha512    SHA-512(key || u64 block index), 64-byte blocks (v1-v4)
+    shake256  SHAKE-256(key || u64 chunk index), 4 KiB per call (v5)
+    blake2b   BLAKE2b-512 keyed with key over the u64 block index (v6)
+
+Block indexes are big-endian. The sha512 stream is byte-identical to the
+original generator's, which existing passwords depend on.
+"""
+
+import hashlib
+from typing import Dict, Optional, Tuple, Type
+
+
+class Keystream:
+    """Base class: random-access reads over a keyed block function"""
+
+    name = ""
+    BLOCK_SIZE = 64
+
+    def __init__(self, key: bytes):
+        self._key = key
+        self._offset = 0
+        # Last block computed for a partial read; sequential small reads hit it
+        self._cached: Optional[Tuple[int, bytes]] = None
+
+    @property
+    def size(self) -> int:
+        """Bytes addressable by seek (2^64 blocks)"""
+        return self.BLOCK_SIZE << 64
+
+    def tell(self) -> int:
+        """Current byte offset"""
+        return self._offset
+
+    def seek(self, offset: int):
+        """Move to byte offset without computing anything before it"""
+        if not 0 <= offset < self.size:
+            raise ValueError("Keystream offset out of range")
+        self._offset = offset
+
+    def _block(self, index: int) -> bytes:
+        """Compute block index (BLOCK_SIZE bytes)"""
+        raise NotImplementedError
+
+    def _blocks(self, first: int, count: int) -> bytes:
+        """Compute count consecutive blocks from first"""
+        return b"".join([self._block(index) for index in range(first, first + count)])
+
+    def _fill(self, view: memoryview, first: int):
+        """Write whole blocks first, first+1, ... into view"""
+        size = self.BLOCK_SIZE
+        for position in range(0, len(view), size):
+            view[position:position + size] = self._block(first)
+            first += 1
+
+    def _partial(self, index: int) -> bytes:
+        cached = self._cached
+        if cached is None or cached[0] != index:
+            cached = self._cached = (index, self._block(index))
+        return cached[1]
+
+    def read_into(self, buffer) -> int:
+        """Fill a writable buffer (e.g. a preallocated bytearray) from the
+        current offset and advance past it; returns the byte count"""
+        with memoryview(buffer) as raw, raw.cast("B") as view:
+            length = len(view)
+            if self._offset + length > self.size:
+                raise ValueError("Read past the end of the keystream")
+            size = self.BLOCK_SIZE
+            index, skip = divmod(self._offset, size)
+            position = 0
+
+            if skip:
+                head = self._partial(index)[skip:skip + length]
+                view[:len(head)] = head
+                position = len(head)
+                index += 1
+            whole = (length - position) // size * size
+            if whole:
+                self._fill(view[position:position + whole], index)
+                position += whole
+                index += whole // size
+            if position < length:
+                view[position:] = self._partial(index)[:length - position]
+        self._offset += length
+        return length
+
+    def read(self, length: int) -> bytes:
+        """Next length bytes"""
+        count, remainder = divmod(length, self.BLOCK_SIZE)
+        if not remainder and not self._offset % self.BLOCK_SIZE:
+            # Block-aligned (the PRNG's refills): no buffer to copy through
+            if self._offset + length > self.size:
+                raise ValueError("Read past the end of the keystream")
+            data = self._blocks(self._offset // self.BLOCK_SIZE, count)
+            self._offset += length
+            return data
+        buffer = bytearray(length)
+        self.read_into(buffer)
+        return bytes(buffer)
+
+
+class Sha512Keystream(Keystream):
+    """SHA-512 counter mode, one 64-byte block per hash call"""
+
+    name = "sha512"
+    BLOCK_SIZE = 64
+
+    def _block(self, index: int) -> bytes:
+        return hashlib.sha512(self._key + index.to_bytes(8, "big")).digest()
+
+    def _blocks(self, first: int, count: int) -> bytes:
+        key, sha512 = self._key, hashlib.sha512
+        if count == 1:
+            return sha512(key + first.to_bytes(8, "big")).digest()
+        return b"".join([sha512(key + index.to_bytes(8, "big")).digest()
+                         for index in range(first, first + count)])
+
+    def _fill(self, view: memoryview, first: int):
+        # Inlined _block: this loop is the whole cost of bulk reads
+        key, sha512 = self._key, hashlib.sha512
+        for position in range(0, len(view), 64):
+            view[position:position + 64] = sha512(key + first.to_bytes(8, "big")).digest()
+            first += 1
+
+
+class Shake256Keystream(Keystream):
+    """SHAKE-256 XOF, one 4 KiB chunk per call.
+
+    A single XOF squeezed from the start would need every earlier byte
+    recomputed to seek, so the stream is chunked by index instead. Bulk
+    reads then cost one Python round trip per 4 KiB rather than per 64 bytes.
+    """
+
+    name = "shake256"
+    BLOCK_SIZE = 4096
+
+    def __init__(self, key: bytes):
+        super().__init__(key)
+        self._base = hashlib.shake_256(key)
+
+    def _block(self, index: int) -> bytes:
+        xof = self._base.copy()
+        xof.update(index.to_bytes(8, "big"))
+        return xof.digest(self.BLOCK_SIZE)
+
+
+class Blake2bKeystream(Keystream):
+    """Keyed BLAKE2b-512 over the block index; the key is at most 64 bytes"""
+
+    name = "blake2b"
+    BLOCK_SIZE = 64
+    _PERSON = b"pypass/keystream"
+
+    def __init__(self, key: bytes):
+        if len(key) > hashlib.blake2b.MAX_KEY_SIZE:
+            raise ValueError(
+                f"BLAKE2b keys are at most {hashlib.blake2b.MAX_KEY_SIZE} bytes")
+        super().__init__(key)
+        # Keying costs a compression; copying the keyed state skips it
+        self._base = hashlib.blake2b(key=key, digest_size=64, person=self._PERSON)
+
+    def _block(self, index: int) -> bytes:
+        block = self._base.copy()
+        block.update(index.to_bytes(8, "big"))
+        return block.digest()
+
+    def _fill(self, view: memoryview, first: int):
+        base = self._base
+        for position in range(0, len(view), 64):
+            block = base.copy()
+            block.update(first.to_bytes(8, "big"))
+            view[position:position + 64] = block.digest()
+            first += 1
+
+
+KEYSTREAMS: Dict[str, Type[Keystream]] = {
+    backend.name: backend
+    for backend in (Sha512Keystream, Shake256Keystream, Blake2bKeystream)
+}
+DEFAULT_KEYSTREAM = Sha512Keystream.name
+
+
+def open_keystream(name: str, key: bytes) -> Keystream:
+    """Instantiate the named backend keyed with key"""
+    try:
+        backend = KEYSTREAMS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown keystream {name!r}; expected one of: {', '.join(KEYSTREAMS)}")
+    return backend(key)
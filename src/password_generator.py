@@ -6,7 +6,20 @@ Cryptographically secure password generation with user input integration
 import string
 import hashlib
 import math
-from typing import List, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Tuple
+
+from . import derivation
+from .instrumentation import NULL_TIMER, GenerationObserver, PhaseTimer
+from .kdf import DEFAULT_KDF, KDFProfile
+from .keystream import DEFAULT_KEYSTREAM, open_keystream
+from .pattern_matcher import PatternMatcher, fold, personal_patterns
+from .seed_cache import SeedCache
+
+if TYPE_CHECKING:
+    from .breach import BreachIndex
+    from .guess_estimator import GuessEstimate
+    from .wordlist import WordList
 
 
 class PasswordOptions:
@@ -19,9 +32,15 @@ class PasswordOptions:
         self.include_numbers = True
         self.include_special = True
         self.exclude_ambiguous = True  # Exclude 0, O, l, I, 1
+        # Generation index for scheduled rotation; 0 is the original password
+        self.rotation = 0
 
     def fingerprint(self) -> str:
-        """Return a deterministic fingerprint of the option combination."""
+        """Return a deterministic fingerprint of the option combination.
+
+        ``rotation`` is deliberately left out: every rotation shares the
+        option's seed material and only seeks to a different keystream block.
+        """
         return "|".join([
             f"len={self.length}",
             f"upper={int(self.include_uppercase)}",
@@ -33,23 +52,168 @@ class PasswordOptions:
 
     def get_character_set(self) -> str:
         """Build character set based on options"""
-        charset = ""
+        return self.compile().charset
+
+    def compile(self) -> "GenerationPlan":
+        """Return the immutable generation plan for these options.
 
-        if self.include_lowercase:
-            charset += string.ascii_lowercase
-        if self.include_uppercase:
-            charset += string.ascii_uppercase
-        if self.include_numbers:
-            charset += string.digits
-        if self.include_special:
-            charset += "!@#$%^&*()_+-=[]{}|;:,.<>?"
+        Plans are memoized per option combination (i.e. per fingerprint), so
+        repeated generations skip rebuilding the charset and class tables.
+        """
+        return _compile_plan(self.length, self.include_uppercase,
+                             self.include_lowercase, self.include_numbers,
+                             self.include_special, self.exclude_ambiguous)
 
-        # Remove ambiguous characters if requested
-        if self.exclude_ambiguous:
-            ambiguous = "0Ol1I"
-            charset = ''.join(c for c in charset if c not in ambiguous)
 
-        return charset
+class PassphraseOptions:
+    """Configuration class for diceware-style passphrase generation"""
+
+    MIN_WORDS = 3
+    MAX_WORDS = 32
+
+    def __init__(self):
+        self.word_count = 6
+        self.separator = "-"
+        self.capitalize = False  # Upper-case the first letter of every word
+        self.digits = 0  # Random digits appended to randomly chosen words
+
+    def fingerprint(self, wordlist_digest: str) -> str:
+        """Return a deterministic fingerprint of the options and wordlist"""
+        return "|".join([
+            "mode=passphrase",
+            f"words={self.word_count}",
+            f"sep={self.separator.encode('utf-8').hex()}",
+            f"cap={int(self.capitalize)}",
+            f"digits={self.digits}",
+            f"list={wordlist_digest[:16]}",
+        ])
+
+    def entropy_bits(self, list_size: int) -> float:
+        """Entropy of a passphrase drawn from a list of list_size words.
+
+        Each word adds log2(list_size) bits; each injected digit adds at most
+        log2(10 * word_count) (its value and the word it lands on).
+        Separators and capitalization are fixed and add nothing.
+        """
+        bits = self.word_count * math.log2(list_size)
+        if self.digits:
+            bits += self.digits * math.log2(10 * self.word_count)
+        return bits
+
+
+SPECIAL_CHARACTERS = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+AMBIGUOUS_CHARACTERS = "0Ol1I"
+
+# Character class bits used in GenerationPlan.class_masks
+CLASS_LOWERCASE = 1
+CLASS_UPPERCASE = 2
+CLASS_DIGIT = 4
+CLASS_SPECIAL = 8
+
+_CLASS_CHARACTERS = (
+    (CLASS_LOWERCASE, string.ascii_lowercase),
+    (CLASS_UPPERCASE, string.ascii_uppercase),
+    (CLASS_DIGIT, string.digits),
+    (CLASS_SPECIAL, SPECIAL_CHARACTERS),
+)
+
+# Keystream blocks reserved per password rotation (the counter is 64 bits)
+ROTATION_STRIDE = 2 ** 32
+MAX_ROTATION = 2 ** 32 - 1
+
+
+class GenerationPlan(NamedTuple):
+    """Precompiled charset and class tables for one PasswordOptions combination"""
+
+    fingerprint: str
+    length: int
+    charset: str
+    characters: Tuple[str, ...]
+    # (class bit, characters of that class in charset order) for each
+    # selected class that has characters left, in requirement order
+    class_pools: Tuple[Tuple[int, Tuple[str, ...]], ...]
+    # Class bit for every ASCII code point, indexed by ord()
+    class_masks: Tuple[int, ...]
+
+    def classes_present(self, chars) -> int:
+        """Bitmask of the character classes occurring in chars"""
+        masks = self.class_masks
+        present = 0
+        for char in chars:
+            code = ord(char)
+            if code < 128:
+                present |= masks[code]
+        return present
+
+    @property
+    def entropy_bits(self) -> float:
+        """Entropy of a uniformly drawn password: length * log2(charset size)"""
+        if not self.characters:
+            return 0.0
+        return self.length * math.log2(len(self.characters))
+
+
+@lru_cache(maxsize=512)
+def _compile_plan(length: int, include_uppercase: bool, include_lowercase: bool,
+                  include_numbers: bool, include_special: bool,
+                  exclude_ambiguous: bool) -> GenerationPlan:
+    options = PasswordOptions()
+    options.length = length
+    options.include_uppercase = include_uppercase
+    options.include_lowercase = include_lowercase
+    options.include_numbers = include_numbers
+    options.include_special = include_special
+    options.exclude_ambiguous = exclude_ambiguous
+
+    selected = {
+        CLASS_LOWERCASE: include_lowercase,
+        CLASS_UPPERCASE: include_uppercase,
+        CLASS_DIGIT: include_numbers,
+        CLASS_SPECIAL: include_special,
+    }
+
+    masks = [0] * 128
+    for class_bit, characters in _CLASS_CHARACTERS:
+        for char in characters:
+            masks[ord(char)] |= class_bit
+
+    charset = ''.join(characters for class_bit, characters in _CLASS_CHARACTERS
+                      if selected[class_bit])
+    # Remove ambiguous characters if requested
+    if exclude_ambiguous:
+        charset = ''.join(c for c in charset if c not in AMBIGUOUS_CHARACTERS)
+
+    class_pools = []
+    for class_bit, _ in _CLASS_CHARACTERS:
+        pool = tuple(c for c in charset if masks[ord(c)] & class_bit)
+        if selected[class_bit] and pool:
+            class_pools.append((class_bit, pool))
+
+    return GenerationPlan(
+        fingerprint=options.fingerprint(),
+        length=length,
+        charset=charset,
+        characters=tuple(charset),
+        class_pools=tuple(class_pools),
+        class_masks=tuple(masks),
+    )
+
+
+STRENGTH_LABELS = ("Very Weak", "Weak", "Medium", "Strong", "Very Strong")
+
+
+def strength_label(score: float) -> str:
+    """Categorize a 0-100 strength score"""
+    if score >= 80:
+        return "Very Strong"
+    elif score >= 60:
+        return "Strong"
+    elif score >= 40:
+        return "Medium"
+    elif score >= 20:
+        return "Weak"
+    else:
+        return "Very Weak"
 
 
 class PersonalInfo:
@@ -75,37 +239,100 @@ class PersonalInfo:
         combined = f"{self.first_name}{self.last_name}{self.birth_date}{self.current_date}{self.platform}{self.city}"
         return hashlib.sha256(combined.encode('utf-8')).hexdigest()
 
+    def get_identity_seed(self) -> str:
+        """Create a deterministic seed from every field except the platform"""
+        combined = "\x1f".join([self.first_name, self.last_name, self.birth_date,
+                                self.current_date, self.city])
+        return hashlib.sha256(combined.encode('utf-8')).hexdigest()
+
 
 class SecurePasswordGenerator:
     """Cryptographically secure password generator"""
 
-    def __init__(self):
+    # Upper bound on incremental repair rounds in strict pattern mode
+    MAX_REPAIR_ROUNDS = 8
+    # Repair budget when no charset character is pattern-free
+    MAX_RESAMPLE_ROUNDS = 64
+
+    def __init__(self, seed_cache: Optional[SeedCache] = None,
+                 derivation_version: str = derivation.DEFAULT_DERIVATION_VERSION,
+                 kdf_profile: Optional[KDFProfile] = None,
+                 observer: Optional[GenerationObserver] = None,
+                 breach_index: Optional["BreachIndex"] = None):
         self.personal_info = PersonalInfo()
         self.options = PasswordOptions()
+        # Opt-in cache of derived seed material; None disables caching
+        self.seed_cache = seed_cache
+        self.derivation_version = derivation.validate_version(
+            derivation_version)
+        self.kdf_profile = kdf_profile or DEFAULT_KDF
+        # Opt-in instrumentation; None keeps generation free of timing calls
+        self.observer = observer
+        # Opt-in offline breach corpus consulted by assess_strength
+        self.breach_index = breach_index
+        # Last v2 master key, reused across platforms when no cache is set
+        self._master_key_memo: Optional[Tuple[Tuple[str, str], bytes]] = None
+        # Pattern matcher for the current personal info (strict mode)
+        self._matcher_memo: Optional[Tuple[tuple, PatternMatcher]] = None
 
     class _DeterministicPRNG:
-        """Deterministic pseudo-random number generator based on SHA-512."""
+        """Deterministic pseudo-random number generator over a keystream.
 
-        def __init__(self, seed_material: bytes):
-            self._seed_material = seed_material
-            self._buffer = bytearray()
-            self._counter = 0
+        The keystream defaults to SHA-512 counter mode; v5+ name another
+        backend (see keystream.KEYSTREAMS).
+        """
+
+        # Drop consumed bytes once this many have accumulated at the front
+        _COMPACT_THRESHOLD = 4096
+        # Refill granularity; seek() and refills count in these blocks
+        BLOCK_SIZE = 64
 
-        def _refill(self):
-            counter_bytes = self._counter.to_bytes(8, 'big', signed=False)
-            block = hashlib.sha512(
-                self._seed_material + counter_bytes).digest()
-            self._buffer.extend(block)
-            self._counter += 1
+        def __init__(self, seed_material: bytes, keystream: str = DEFAULT_KEYSTREAM):
+            self._keystream = open_keystream(keystream, seed_material)
+            self._buffer = bytearray()
+            self._position = 0
+            self._start = 0  # Keystream offset of the first block, see seek()
+            # Bytes dropped from the front of the buffer by compaction
+            self._discarded = 0
+
+        @property
+        def refills(self) -> int:
+            """Number of keystream blocks produced so far"""
+            return (self._keystream.tell() - self._start) // self.BLOCK_SIZE
+
+        @property
+        def bytes_drawn(self) -> int:
+            """Number of bytes handed out so far"""
+            return self._discarded + self._position
+
+        def seek(self, block: int):
+            """Jump to keystream block ``block`` without computing earlier blocks"""
+            if not 0 <= block < 2 ** 64:
+                raise ValueError("Keystream block out of range")
+            self._buffer.clear()
+            self._position = 0
+            self._discarded = 0
+            self._start = block * self.BLOCK_SIZE
+            self._keystream.seek(self._start)
 
         def next_bytes(self, length: int) -> bytes:
             if length <= 0:
                 raise ValueError("Length must be positive")
-            while len(self._buffer) < length:
-                self._refill()
-            result = self._buffer[:length]
-            del self._buffer[:length]
-            return bytes(result)
+            if self._position >= self._COMPACT_THRESHOLD:
+                del self._buffer[:self._position]
+                self._discarded += self._position
+                self._position = 0
+
+            end = self._position + length
+            missing = end - len(self._buffer)
+            if missing > 0:
+                # Whole blocks, in one keystream call however many are needed
+                self._buffer += self._keystream.read(
+                    -(-missing // self.BLOCK_SIZE) * self.BLOCK_SIZE)
+            with memoryview(self._buffer) as view:
+                result = view[self._position:end].tobytes()
+            self._position = end
+            return result
 
         def next_int(self, modulo: int) -> int:
             if modulo <= 0:
@@ -113,6 +340,68 @@ class SecurePasswordGenerator:
             value = int.from_bytes(self.next_bytes(4), 'big', signed=False)
             return value % modulo
 
+        def next_ints(self, modulo: int, count: int) -> List[int]:
+            """Draw count integers in [0, modulo)"""
+            return [self.next_int(modulo) for _ in range(count)]
+
+    class _UnbiasedPRNG(_DeterministicPRNG):
+        """Rejection-sampling PRNG: uniform indices without modulo bias.
+
+        Each candidate takes only as many bytes as the modulo needs (one for
+        any character set), masked down to the needed bit width and rejected
+        if out of range. With at least half of all candidates accepted, a
+        whole password is filled in a few bulk passes.
+        """
+
+        # modulo -> (translate table, rejected byte values) for 1-byte draws
+        _byte_tables = {}
+
+        @classmethod
+        def _byte_table(cls, modulo: int) -> Tuple[bytes, bytes]:
+            table = cls._byte_tables.get(modulo)
+            if table is None:
+                mask = (1 << (modulo - 1).bit_length()) - 1
+                table = (
+                    bytes((b & mask) if (b & mask) < modulo else 0
+                          for b in range(256)),
+                    bytes(b for b in range(256) if (b & mask) >= modulo),
+                )
+                cls._byte_tables[modulo] = table
+            return table
+
+        def next_int(self, modulo: int) -> int:
+            return self.next_ints(modulo, 1)[0]
+
+        def next_ints(self, modulo: int, count: int) -> List[int]:
+            if modulo <= 0:
+                raise ValueError("Modulo must be positive")
+            if count <= 0:
+                return []
+            if modulo == 1:
+                return [0] * count
+
+            if modulo <= 256:
+                table, rejected = self._byte_table(modulo)
+                accepted = bytearray()
+                while len(accepted) < count:
+                    # One candidate byte per value still needed
+                    accepted += self.next_bytes(
+                        count - len(accepted)).translate(table, rejected)
+                return list(accepted)
+
+            bits = (modulo - 1).bit_length()
+            width = (bits + 7) // 8
+            mask = (1 << bits) - 1
+            values = []
+            while len(values) < count:
+                chunk = self.next_bytes((count - len(values)) * width)
+                for offset in range(0, len(chunk), width):
+                    value = int.from_bytes(
+                        chunk[offset:offset + width], 'big') & mask
+                    if value < modulo:
+                        values.append(value)
+            return values
+
     def set_personal_info(self, personal_info: PersonalInfo):
         """Set personal information for password generation"""
         self.personal_info = personal_info
@@ -121,49 +410,125 @@ class SecurePasswordGenerator:
         """Set password generation options"""
         self.options = options
 
+    def set_derivation_version(self, version: str):
+        """Select the derivation scheme used for subsequent passwords"""
+        self.derivation_version = derivation.validate_version(version)
+
+    def set_kdf_profile(self, profile: Optional[KDFProfile]):
+        """Select the slow KDF and its cost; None restores the default"""
+        self.kdf_profile = profile or DEFAULT_KDF
+
+    def set_breach_index(self, breach_index: Optional["BreachIndex"]):
+        """Check passwords against a local breach corpus; None disables it"""
+        self.breach_index = breach_index
+
+    def derivation_fingerprint(self) -> str:
+        """Return the options fingerprint tagged with the derivation version.
+
+        Record this alongside stored entries: together with the personal info
+        it is everything needed to reproduce a password. A non-default KDF
+        profile is appended; the default one is implied, which keeps existing
+        fingerprints (and v2+ passwords keyed on them) unchanged. So is a
+        non-zero rotation.
+        """
+        fingerprint = self._tag_fingerprint(self.options.fingerprint())
+        if self.options.rotation:
+            fingerprint += f"|rot={self.options.rotation}"
+        return fingerprint
+
+    def passphrase_fingerprint(self, options: "PassphraseOptions",
+                               wordlist: "WordList") -> str:
+        """derivation_fingerprint counterpart for generate_passphrase"""
+        return self._tag_fingerprint(options.fingerprint(wordlist.digest))
+
+    def _tag_fingerprint(self, option_fingerprint: str) -> str:
+        fingerprint = f"derivation={self.derivation_version}|{option_fingerprint}"
+        if self.kdf_profile != DEFAULT_KDF:
+            fingerprint += f"|kdf={self.kdf_profile.fingerprint()}"
+        return fingerprint
+
+    def _cached(self, cache_key: Tuple[str, ...], derive) -> bytes:
+        """Look up seed material in the optional cache, deriving on a miss"""
+        if self.seed_cache is not None:
+            material = self.seed_cache.get(cache_key)
+            if material is not None:
+                return material
+
+        material = derive()
+        if self.seed_cache is not None:
+            self.seed_cache.put(cache_key, material)
+        return material
+
+    def _master_key(self) -> bytes:
+        """Return the v2 master key for the current identity"""
+        identity_seed = self.personal_info.get_identity_seed()
+        profile = self.kdf_profile
+        memo_key = (identity_seed, profile.fingerprint())
+        if self.seed_cache is None:
+            memo = self._master_key_memo
+            if memo is not None and memo[0] == memo_key:
+                return memo[1]
+
+        master_key = self._cached(
+            ("v2-master",) + memo_key,
+            lambda: derivation.derive_master_key(identity_seed, profile))
+        if self.seed_cache is None:
+            self._master_key_memo = (memo_key, master_key)
+        return master_key
+
     def _build_prng(self) -> "SecurePasswordGenerator._DeterministicPRNG":
         """Construct a deterministic PRNG based on personal info and options."""
+        seed_material = self._seed_material(self.options.fingerprint())
+        keystream = derivation.keystream_backend(self.derivation_version)
+        if derivation.uses_unbiased_sampler(self.derivation_version):
+            rng = self._UnbiasedPRNG(seed_material, keystream)
+        else:
+            rng = self._DeterministicPRNG(seed_material, keystream)
+        if self.options.rotation:
+            # Each rotation owns a disjoint 2^32-block window of the same
+            # keystream, so rotating never re-runs the KDF
+            rng.seek(self.options.rotation * ROTATION_STRIDE)
+        return rng
+
+    def prepare_seed(self):
+        """Run the slow KDF for the current inputs ahead of generate_password.
+
+        Only useful with a seed cache (or, for v2+, on this same instance),
+        where the derived material waits for the actual generation.
+        """
+        self._seed_material(self.options.fingerprint())
+
+    def _seed_material(self, option_fingerprint: str) -> bytes:
+        """Derive PRNG seed material for personal info and an options fingerprint"""
         if not self.personal_info.is_complete():
             raise ValueError("Personal information is incomplete")
 
-        seed_basis = self.personal_info.get_entropy_seed()
-        option_fingerprint = self.options.fingerprint()
-
-        seed_material = hashlib.pbkdf2_hmac(
-            'sha512',
-            seed_basis.encode('utf-8'),
-            option_fingerprint.encode('utf-8'),
-            200_000,
-            dklen=64
-        )
+        if not derivation.uses_master_key(self.derivation_version):
+            seed_basis = self.personal_info.get_entropy_seed()
+            profile = self.kdf_profile
+            seed_material = self._cached(
+                ("v1", seed_basis, option_fingerprint, profile.fingerprint()),
+                lambda: derivation.derive_v1_seed(
+                    seed_basis, option_fingerprint, profile))
+        else:
+            seed_material = derivation.derive_subkey(
+                self._master_key(), self.personal_info.platform,
+                self._tag_fingerprint(option_fingerprint))
+        return seed_material
 
-        return self._DeterministicPRNG(seed_material)
+    def _count(self, name: str, amount: int):
+        """Report a counter to the observer, if any"""
+        if self.observer is not None and amount:
+            self.observer.count(name, amount)
 
     def _ensure_character_requirements(self, password: List[str], charset: str,
                                        rng: "SecurePasswordGenerator._DeterministicPRNG") -> List[str]:
         """Ensure password meets character type requirements"""
-        # Get required character types
-        required_chars = []
-
-        if self.options.include_lowercase:
-            lowercase = [c for c in charset if c in string.ascii_lowercase]
-            if lowercase and not any(c in lowercase for c in password):
-                required_chars.append(lowercase)
-
-        if self.options.include_uppercase:
-            uppercase = [c for c in charset if c in string.ascii_uppercase]
-            if uppercase and not any(c in uppercase for c in password):
-                required_chars.append(uppercase)
-
-        if self.options.include_numbers:
-            numbers = [c for c in charset if c in string.digits]
-            if numbers and not any(c in numbers for c in password):
-                required_chars.append(numbers)
-
-        if self.options.include_special:
-            special = [c for c in charset if c in "!@#$%^&*()_+-=[]{}|;:,.<>?"]
-            if special and not any(c in special for c in password):
-                required_chars.append(special)
+        # Pools of required character types missing from the password
+        plan = self.options.compile()
+        present = plan.classes_present(password)
+        required_chars = [pool for class_bit, pool in plan.class_pools
+                          if not present & class_bit]
 
         # Replace deterministic positions with required characters
         for char_pool in required_chars:
@@ -172,12 +537,95 @@ class SecurePasswordGenerator:
             position = rng.next_int(len(password))
             replacement = char_pool[rng.next_int(len(char_pool))]
             password[position] = replacement
+        self._count("requirement_replacements", len(required_chars))
+
+        return password
 
+    def _pattern_matcher(self) -> PatternMatcher:
+        """Return the matcher for the current personal info, building it once"""
+        info = self.personal_info
+        key = (info.first_name, info.last_name, info.birth_date,
+               info.platform, info.city)
+        if self._matcher_memo is None or self._matcher_memo[0] != key:
+            self._matcher_memo = (key, PatternMatcher(personal_patterns(info)))
+        return self._matcher_memo[1]
+
+    def _repair_patterns(self, password: List[str], charset: str,
+                         rng: "SecurePasswordGenerator._DeterministicPRNG") -> List[str]:
+        """Strict mode: break every personal-info match in bounded rounds.
+
+        All matches are found in one automaton pass. Each round changes one
+        character inside every match, then rescans only the windows around
+        the changed positions. If matches survive MAX_REPAIR_ROUNDS rounds, a
+        final pass substitutes characters that occur in no pattern, which
+        cannot form a new match. When every charset character occurs in some
+        pattern there is no such pass, so rounds continue up to
+        MAX_RESAMPLE_ROUNDS and a ValueError is raised if matches remain.
+        """
+        matcher = self._pattern_matcher()
+        if not matcher.patterns:
+            return password
+
+        folded = [fold(c) for c in password]
+        matches = matcher.find(folded)
+        if not matches:
+            return password
+
+        safe_chars = ''.join(c for c in charset if fold(c) not in matcher.alphabet)
+        limit = self.MAX_REPAIR_ROUNDS if safe_chars else self.MAX_RESAMPLE_ROUNDS
+
+        rounds = 0
+        while matches and rounds < limit:
+            changed = self._replace_in_matches(
+                password, folded, matches, charset, rng)
+            matches = self._rescan(matcher, folded, changed)
+            rounds += 1
+
+        if matches:
+            if not safe_chars:
+                raise ValueError(
+                    "Cannot keep personal information out of the password: "
+                    "every allowed character occurs in it. Enable more "
+                    "character types.")
+            self._replace_in_matches(password, folded, matches, safe_chars, rng)
+            rounds += 1
+
+        self._count("pattern_repair_iterations", rounds)
         return password
 
+    @staticmethod
+    def _replace_in_matches(password: List[str], folded: List[str],
+                            matches: List[Tuple[int, int]], pool: str,
+                            rng: "SecurePasswordGenerator._DeterministicPRNG") -> List[int]:
+        """Replace one character in each match not already touched this round"""
+        changed = []
+        for start, length in matches:
+            if any(start <= position < start + length for position in changed):
+                continue
+            position = start + rng.next_int(length)
+            password[position] = pool[rng.next_int(len(pool))]
+            folded[position] = fold(password[position])
+            changed.append(position)
+        return changed
+
+    @staticmethod
+    def _rescan(matcher: PatternMatcher, folded: List[str],
+                changed: List[int]) -> List[Tuple[int, int]]:
+        """Find matches that overlap any changed position"""
+        reach = matcher.max_length - 1
+        matches = set()
+        for position in changed:
+            matches.update(matcher.find(
+                folded, max(0, position - reach),
+                min(len(folded), position + reach + 1)))
+        return sorted(matches)
+
     def _avoid_obvious_patterns(self, password: List[str], charset: str,
                                 rng: "SecurePasswordGenerator._DeterministicPRNG") -> List[str]:
         """Check and modify password to avoid obvious personal info patterns"""
+        if derivation.uses_strict_patterns(self.derivation_version):
+            return self._repair_patterns(password, charset, rng)
+
         # Convert to lowercase for pattern checking
         password_lower = ''.join(password).lower()
 
@@ -196,39 +644,83 @@ class SecurePasswordGenerator:
         patterns_to_avoid = [p for p in patterns_to_avoid if len(p) >= 3]
 
         # Check for patterns and deterministically adjust if found
+        iterations = 0
         for pattern in patterns_to_avoid:
             while pattern and pattern in password_lower:
                 position = rng.next_int(len(password))
                 replacement = charset[rng.next_int(len(charset))]
                 password[position] = replacement
                 password_lower = ''.join(password).lower()
+                iterations += 1
 
+        self._count("pattern_repair_iterations", iterations)
         return password
 
     def generate_password(self) -> str:
         """Generate a secure password based on personal info and options"""
-        charset = self.options.get_character_set()
+        plan = self.options.compile()
+        charset = plan.charset
         if not charset:
             raise ValueError("No character types selected")
 
         if not 8 <= self.options.length <= 128:
             raise ValueError(
                 "Password length must be between 8 and 128 characters")
+        if not 0 <= self.options.rotation <= MAX_ROTATION:
+            raise ValueError(f"Rotation must be between 0 and {MAX_ROTATION}")
 
+        timer = NULL_TIMER if self.observer is None else PhaseTimer(self.observer)
         rng = self._build_prng()
+        timer.lap("kdf")
 
         # Generate password deterministically using PRNG
-        password_chars = [charset[rng.next_int(len(charset))]
-                          for _ in range(self.options.length)]
+        characters = plan.characters
+        password_chars = [characters[index] for index in
+                          rng.next_ints(len(characters), self.options.length)]
+        timer.lap("sample")
 
         # Ensure requirements and adjust patterns deterministically
         password_chars = self._ensure_character_requirements(
             password_chars, charset, rng)
+        timer.lap("requirements")
         password_chars = self._avoid_obvious_patterns(
             password_chars, charset, rng)
+        timer.lap("patterns")
 
+        timer.finish()
+        self._count("prng_refills", rng.refills)
+        self._count("prng_bytes", rng.bytes_drawn)
         return ''.join(password_chars)
 
+    def generate_passphrase(self, options: PassphraseOptions,
+                            wordlist: "WordList") -> str:
+        """Generate a deterministic passphrase from wordlist.
+
+        Words come from the same seed derivation as generate_password, salted
+        with the passphrase fingerprint (which includes the wordlist digest),
+        and are always picked by unbiased rejection sampling.
+        """
+        if not PassphraseOptions.MIN_WORDS <= options.word_count <= PassphraseOptions.MAX_WORDS:
+            raise ValueError(
+                f"Word count must be between {PassphraseOptions.MIN_WORDS} "
+                f"and {PassphraseOptions.MAX_WORDS}")
+        if not 0 <= options.digits <= options.word_count:
+            raise ValueError("Digit count must be between 0 and the word count")
+
+        rng = self._UnbiasedPRNG(
+            self._seed_material(options.fingerprint(wordlist.digest)),
+            derivation.keystream_backend(self.derivation_version))
+        words = [wordlist[index] for index in
+                 rng.next_ints(len(wordlist), options.word_count)]
+
+        if options.capitalize:
+            words = [word[:1].upper() + word[1:] for word in words]
+        for _ in range(options.digits):
+            position = rng.next_int(len(words))
+            words[position] += str(rng.next_int(10))
+
+        return options.separator.join(words)
+
     def calculate_entropy(self, password: str) -> float:
         """Calculate Shannon entropy of password"""
         if not password:
@@ -250,9 +742,26 @@ class SecurePasswordGenerator:
 
         return entropy
 
+    def estimate_guesses(self, password: str) -> "GuessEstimate":
+        """Estimate attacker guesses from recognized patterns (zxcvbn-style)"""
+        from .guess_estimator import estimate_guesses
+
+        return estimate_guesses(password)
+
+    def plan_entropy(self) -> float:
+        """Bits of entropy of a password drawn under the current options"""
+        return self.options.compile().entropy_bits
+
+    def is_breached(self, password: str) -> bool:
+        """True if password is in the breach index (False without one)"""
+        return self.breach_index is not None and password in self.breach_index
+
     def assess_strength(self, password: str) -> Tuple[str, float]:
-        """Assess password strength and return (label, score)"""
-        if not password:
+        """Assess password strength and return (label, score).
+
+        A password found in the breach index scores ("Very Weak", 0.0).
+        """
+        if not password or self.is_breached(password):
             return "Very Weak", 0.0
 
         score = 0.0
@@ -269,7 +778,7 @@ class SecurePasswordGenerator:
             variety_score += 10
         if any(c.isdigit() for c in password):
             variety_score += 10
-        if any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password):
+        if any(c in SPECIAL_CHARACTERS for c in password):
             variety_score += 10
         score += variety_score
 
@@ -281,14 +790,4 @@ class SecurePasswordGenerator:
         # Normalize to 0-100
         final_score = min(100, score)
 
-        # Categorize strength
-        if final_score >= 80:
-            return "Very Strong", final_score
-        elif final_score >= 60:
-            return "Strong", final_score
-        elif final_score >= 40:
-            return "Medium", final_score
-        elif final_score >= 20:
-            return "Weak", final_score
-        else:
-            return "Very Weak", final_score
+        return strength_label(final_score), final_score
@@ -0,0 +1,128 @@
+"""
+Pattern Matcher Module
+Aho-Corasick matching of personal-info patterns in generated passwords
+"""
+
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Case and common leet substitutions fold onto one canonical letter, so
+# "Al1c3", "ALICE" and "4lice" all match the pattern "alice". Patterns are
+# folded the same way, which keeps dates matchable ("1990" -> "i99o").
+_FOLD_TABLE = str.maketrans({
+    "4": "a", "@": "a",
+    "8": "b",
+    "3": "e",
+    "1": "i", "!": "i", "|": "i", "l": "i",
+    "0": "o",
+    "5": "s", "$": "s",
+    "7": "t", "+": "t",
+})
+
+MIN_PATTERN_LENGTH = 3
+PREFIX_LENGTH = 4
+
+_DATE_PATTERN = re.compile(r"^(\d{1,2})[-/.](\d{1,2})[-/.](\d{4})$")
+
+
+def fold(text: str) -> str:
+    """Normalize case and leet substitutions for matching"""
+    return text.lower().translate(_FOLD_TABLE)
+
+
+def date_variants(date: str) -> List[str]:
+    """Common ways a dd-mm-yyyy date shows up inside a password"""
+    variants = [date, date.replace("-", "")]
+    match = _DATE_PATTERN.match(date)
+    if match:
+        day, month, year = match.groups()
+        day, month = day.zfill(2), month.zfill(2)
+        variants += [
+            day + month + year,
+            year + month + day,
+            month + day + year,
+            day + month + year[2:],
+            month + day + year[2:],
+            year,
+        ]
+    return variants
+
+
+def personal_patterns(personal_info) -> List[str]:
+    """Raw patterns to keep out of passwords for one PersonalInfo"""
+    patterns = []
+    for word in (personal_info.first_name, personal_info.last_name,
+                 personal_info.city, personal_info.platform):
+        patterns.append(word)
+        patterns.append(word[:PREFIX_LENGTH])
+        # Multi-word values ("New York") also count word by word
+        patterns.extend(word.split())
+    patterns.extend(date_variants(personal_info.birth_date))
+    return patterns
+
+
+class PatternMatcher:
+    """Aho-Corasick automaton over folded patterns.
+
+    Built once; ``find`` reports every occurrence of every pattern in a
+    single left-to-right pass over the text.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        folded = {fold(p) for p in patterns if len(p) >= MIN_PATTERN_LENGTH}
+        self.patterns: Tuple[str, ...] = tuple(sorted(folded))
+        self.max_length = max((len(p) for p in self.patterns), default=0)
+
+        # Node 0 is the root. _outputs[n] lists the lengths of all patterns
+        # ending at node n, including those reachable through failure links.
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[Tuple[int, ...]] = [()]
+
+        for pattern in self.patterns:
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._outputs.append(())
+                node = next_node
+            self._outputs[node] += (len(pattern),)
+
+        pending = deque(self._goto[0].values())
+        while pending:
+            node = pending.popleft()
+            for char, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._outputs[child] += self._outputs[self._fail[child]]
+                pending.append(child)
+
+        self.alphabet = frozenset(
+            char for pattern in self.patterns for char in pattern)
+
+    def find(self, folded_text: Sequence[str], start: int = 0,
+             end: Optional[int] = None) -> List[Tuple[int, int]]:
+        """Return (start, length) of every match within folded_text[start:end]"""
+        if end is None:
+            end = len(folded_text)
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+
+        matches = []
+        node = 0
+        for index in range(start, end):
+            char = folded_text[index]
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for length in outputs[node]:
+                matches.append((index - length + 1, length))
+        return matches
@@ -0,0 +1,504 @@
+"""
+Profile Store Module
+Indexed on-disk store of non-secret generation parameters
+
+A profile records how to regenerate one password: an identity reference (a
+label such as "personal" - never the personal info itself), the platform, the
+PasswordOptions and the derivation version/KDF profile. Passwords and
+personal info are never written; regenerating needs the identity's
+PersonalInfo from the user.
+
+Layout of a store directory:
+
+* ``profiles.dat``: append-only records. A later record for the same
+  (identity, platform) supersedes earlier ones; a tombstone deletes.
+* ``profiles.idx``: (platform hash, record offset) pairs sorted by hash,
+  memory-mapped and binary-searched, so a lookup touches O(log n) index
+  entries and only the records for that platform. Records appended since the
+  index was last written are indexed in memory until the next ``flush``.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from collections import defaultdict
+from typing import (TYPE_CHECKING, Dict, Iterable, Iterator, List, NamedTuple,
+                    Optional, Tuple)
+
+from . import derivation
+from .kdf import DEFAULT_KDF, KDFProfile, parse_kdf_profile
+from .password_generator import SecurePasswordGenerator, PersonalInfo, PasswordOptions
+
+if TYPE_CHECKING:
+    from .batch import BatchResult
+
+
+DATA_FILE = "profiles.dat"
+INDEX_FILE = "profiles.idx"
+
+_DATA_MAGIC = b"PYPSDAT1"
+_INDEX_MAGIC = b"PYPSIDX1"
+_RECORD_HEADER = struct.Struct(">HBBBB")  # size, kind, flags, length, version
+_STRING_LENGTH = struct.Struct(">H")
+_ROTATION = struct.Struct(">I")  # after the strings, only if _ROTATION_FLAG
+_INDEX_HEADER = struct.Struct(">QQ")  # entry count, data bytes indexed
+_INDEX_ENTRY = struct.Struct(">QQ")  # platform hash, record offset
+
+_KIND_PUT = 1
+_KIND_DELETE = 2
+
+# PasswordOptions flags, in fingerprint order
+_OPTION_FLAGS = ("include_uppercase", "include_lowercase", "include_numbers",
+                 "include_special", "exclude_ambiguous")
+
+# Record flag bit marking a trailing rotation (older records have none)
+_ROTATION_FLAG = 0x80
+
+# Unindexed records kept in memory before the index is rewritten
+AUTO_FLUSH_PENDING = 4096
+
+
+def _platform_hash(platform: str) -> int:
+    """64-bit index key; case-insensitive so lookups can ignore case"""
+    digest = hashlib.blake2b(platform.strip().casefold().encode("utf-8"),
+                             digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class Profile(NamedTuple):
+    """Non-secret parameters needed to regenerate one password"""
+
+    identity: str
+    platform: str
+    options: Tuple[int, bool, bool, bool, bool, bool]  # length + _OPTION_FLAGS
+    derivation_version: str = derivation.DEFAULT_DERIVATION_VERSION
+    kdf: str = ""  # KDF profile fingerprint; empty for the default
+    rotation: int = 0
+
+    @classmethod
+    def create(cls, identity: str, platform: str, options: PasswordOptions,
+               derivation_version: str = derivation.DEFAULT_DERIVATION_VERSION,
+               kdf_profile: Optional[KDFProfile] = None) -> "Profile":
+        """Build a profile from generator settings"""
+        if not identity or not platform:
+            raise ValueError("Identity and platform are required")
+        derivation.validate_version(derivation_version)
+        return cls(
+            identity=identity,
+            platform=platform,
+            options=(options.length,) + tuple(
+                bool(getattr(options, flag)) for flag in _OPTION_FLAGS),
+            derivation_version=derivation_version,
+            kdf="" if kdf_profile in (None, DEFAULT_KDF) else kdf_profile.fingerprint(),
+            rotation=options.rotation,
+        )
+
+    def password_options(self) -> PasswordOptions:
+        """The stored options as a PasswordOptions instance"""
+        options = PasswordOptions()
+        options.length = self.options[0]
+        for flag, value in zip(_OPTION_FLAGS, self.options[1:]):
+            setattr(options, flag, value)
+        options.rotation = self.rotation
+        return options
+
+    def rotated(self) -> "Profile":
+        """This profile advanced to its next rotation"""
+        return self._replace(rotation=self.rotation + 1)
+
+    def kdf_profile(self) -> Optional[KDFProfile]:
+        """The stored KDF profile, or None for the default"""
+        return parse_kdf_profile(self.kdf) if self.kdf else None
+
+    def personal_info(self, identity_info: PersonalInfo) -> PersonalInfo:
+        """identity_info with this profile's platform filled in"""
+        return PersonalInfo(
+            first_name=identity_info.first_name,
+            last_name=identity_info.last_name,
+            birth_date=identity_info.birth_date,
+            current_date=identity_info.current_date,
+            platform=self.platform,
+            city=identity_info.city,
+        )
+
+
+def _encode_record(kind: int, profile: Profile) -> bytes:
+    length = profile.options[0]
+    if not 0 <= length <= 255:
+        raise ValueError("Password length does not fit the store format")
+    flags = 0
+    for bit, value in enumerate(profile.options[1:]):
+        if value:
+            flags |= 1 << bit
+
+    body = bytearray()
+    for text in (profile.identity, profile.platform, profile.kdf):
+        encoded = text.encode("utf-8")
+        if len(encoded) > 0xFFFF:
+            raise ValueError("Profile field too long")
+        body += _STRING_LENGTH.pack(len(encoded)) + encoded
+    if profile.rotation:
+        if not 0 < profile.rotation < 2 ** 32:
+            raise ValueError("Rotation does not fit the store format")
+        flags |= _ROTATION_FLAG
+        body += _ROTATION.pack(profile.rotation)
+
+    version = int(profile.derivation_version[1:])
+    size = _RECORD_HEADER.size - 2 + len(body)
+    return _RECORD_HEADER.pack(size, kind, flags, length, version) + bytes(body)
+
+
+def _decode_record(buffer: bytes) -> Tuple[int, Profile]:
+    """Decode a record (header included); returns (kind, profile)"""
+    _, kind, flags, length, version = _RECORD_HEADER.unpack_from(buffer)
+    position = _RECORD_HEADER.size
+    fields = []
+    for _ in range(3):
+        (size,) = _STRING_LENGTH.unpack_from(buffer, position)
+        position += _STRING_LENGTH.size
+        fields.append(buffer[position:position + size].decode("utf-8"))
+        position += size
+
+    identity, platform, kdf = fields
+    options = (length,) + tuple(bool(flags & (1 << bit))
+                                for bit in range(len(_OPTION_FLAGS)))
+    rotation = 0
+    if flags & _ROTATION_FLAG:
+        (rotation,) = _ROTATION.unpack_from(buffer, position)
+    return kind, Profile(identity, platform, options, f"v{version}", kdf, rotation)
+
+
+class ProfileStore:
+    """Append-only profile records with a memory-mapped, sorted hash index.
+
+    Use as a context manager, or call ``close()``, so the index is brought up
+    to date on disk; an index that falls behind is caught up on open.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._data_path = os.path.join(directory, DATA_FILE)
+        self._index_path = os.path.join(directory, INDEX_FILE)
+        self._lock = threading.RLock()
+
+        is_new = not os.path.exists(self._data_path)
+        self._data = open(self._data_path, "a+b")
+        if is_new:
+            self._data.write(_DATA_MAGIC)
+            self._data.flush()
+        else:
+            self._data.seek(0)
+            if self._data.read(len(_DATA_MAGIC)) != _DATA_MAGIC:
+                self._data.close()
+                raise ValueError(f"{self._data_path} is not a profile store")
+
+        self._index_file = None
+        self._index: Optional[mmap.mmap] = None
+        self._index_count = 0
+        self._indexed_size = len(_DATA_MAGIC)
+        # platform hash -> offsets of records not yet in the on-disk index
+        self._pending: Dict[int, List[int]] = defaultdict(list)
+        self._pending_count = 0
+        # (identity, platform) -> newest (kind, profile) in write order;
+        # built by the first profiles() call, then kept current by _append
+        self._live: Optional[Dict[Tuple[str, str], Tuple[int, Profile]]] = None
+
+        self._open_index()
+        self._catch_up()
+
+    # Index ---------------------------------------------------------------
+
+    def _open_index(self):
+        if not os.path.exists(self._index_path):
+            return
+        self._index_file = open(self._index_path, "rb")
+        header = self._index_file.read(len(_INDEX_MAGIC) + _INDEX_HEADER.size)
+        if not header.startswith(_INDEX_MAGIC):
+            raise ValueError(f"{self._index_path} is not a profile index")
+        self._index_count, self._indexed_size = _INDEX_HEADER.unpack_from(
+            header, len(_INDEX_MAGIC))
+        if self._index_count:
+            self._index = mmap.mmap(self._index_file.fileno(), 0,
+                                    access=mmap.ACCESS_READ)
+
+    def _close_index(self):
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
+
+    def _index_entry(self, position: int) -> Tuple[int, int]:
+        return _INDEX_ENTRY.unpack_from(
+            self._index, len(_INDEX_MAGIC) + _INDEX_HEADER.size
+            + position * _INDEX_ENTRY.size)
+
+    def _indexed_offsets(self, key: int) -> List[int]:
+        """Offsets of all indexed records whose platform hashes to key"""
+        low, high = 0, self._index_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._index_entry(middle)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        offsets = []
+        while low < self._index_count:
+            entry_key, offset = self._index_entry(low)
+            if entry_key != key:
+                break
+            offsets.append(offset)
+            low += 1
+        return offsets
+
+    def _catch_up(self):
+        """Index records appended after the on-disk index was written"""
+        data_size = os.path.getsize(self._data_path)
+        if self._indexed_size > data_size:
+            # Index belongs to another data file (e.g. restored backup)
+            self._close_index()
+            self._index_count = 0
+            self._indexed_size = len(_DATA_MAGIC)
+        for offset, _, profile in self._scan(self._indexed_size):
+            self._pending[_platform_hash(profile.platform)].append(offset)
+            self._pending_count += 1
+
+    def flush(self):
+        """Merge in-memory index entries into the on-disk index"""
+        with self._lock:
+            self._data.flush()
+            if not self._pending_count and os.path.exists(self._index_path):
+                return
+
+            entries = [self._index_entry(i) for i in range(self._index_count)]
+            entries += [(key, offset) for key, offsets in self._pending.items()
+                        for offset in offsets]
+            entries.sort()
+
+            temporary = self._index_path + ".tmp"
+            with open(temporary, "wb") as f:
+                f.write(_INDEX_MAGIC)
+                f.write(_INDEX_HEADER.pack(
+                    len(entries), os.path.getsize(self._data_path)))
+                for entry in entries:
+                    f.write(_INDEX_ENTRY.pack(*entry))
+
+            # Windows cannot replace a file that is still mapped
+            self._close_index()
+            os.replace(temporary, self._index_path)
+            self._pending.clear()
+            self._pending_count = 0
+            self._open_index()
+
+    # Records -------------------------------------------------------------
+
+    def _scan(self, start: int) -> Iterator[Tuple[int, int, Profile]]:
+        """Yield (offset, kind, profile) for every record from start on"""
+        with open(self._data_path, "rb") as f:
+            f.seek(start)
+            offset = start
+            while True:
+                header = f.read(2)
+                if len(header) < 2:
+                    return
+                (size,) = _STRING_LENGTH.unpack(header)
+                body = f.read(size)
+                if len(body) < size:
+                    return  # Torn final write; ignore it
+                kind, profile = _decode_record(header + body)
+                yield offset, kind, profile
+                offset += 2 + size
+
+    def _read_record(self, offset: int) -> Tuple[int, Profile]:
+        self._data.seek(offset)
+        (size,) = _STRING_LENGTH.unpack(self._data.read(2))
+        self._data.seek(offset)
+        return _decode_record(self._data.read(2 + size))
+
+    def _append(self, kind: int, profile: Profile):
+        record = _encode_record(kind, profile)
+        with self._lock:
+            self._data.seek(0, os.SEEK_END)
+            offset = self._data.tell()
+            self._data.write(record)
+            self._pending[_platform_hash(profile.platform)].append(offset)
+            self._pending_count += 1
+            if self._live is not None:
+                self._remember(self._live, kind, profile)
+            if self._pending_count >= AUTO_FLUSH_PENDING:
+                self.flush()
+
+    def _latest(self, platform: str) -> Dict[Tuple[str, str], Tuple[int, Profile]]:
+        """Newest record per (identity, platform) matching platform case-insensitively"""
+        key = _platform_hash(platform)
+        wanted = platform.strip().casefold()
+        with self._lock:
+            self._data.flush()
+            offsets = self._indexed_offsets(key) + self._pending.get(key, [])
+            latest = {}
+            for offset in sorted(offsets):
+                kind, profile = self._read_record(offset)
+                if profile.platform.strip().casefold() == wanted:
+                    latest[(profile.identity, profile.platform)] = (kind, profile)
+        return latest
+
+    # Public API ------------------------------------------------------------
+
+    def put(self, profile: Profile):
+        """Add or replace the profile for (identity, platform)"""
+        self._append(_KIND_PUT, profile)
+
+    def remove(self, identity: str, platform: str) -> bool:
+        """Delete a profile; returns False if there was none"""
+        existing = self.get(identity, platform)
+        if existing is None:
+            return False
+        self._append(_KIND_DELETE, existing)
+        return True
+
+    def get(self, identity: str, platform: str) -> Optional[Profile]:
+        """The profile for exactly this identity and platform, or None"""
+        found = self._latest(platform).get((identity, platform))
+        if found is None or found[0] == _KIND_DELETE:
+            return None
+        return found[1]
+
+    def find(self, platform: str) -> List[Profile]:
+        """All identities' profiles for a platform, ignoring case"""
+        return sorted(profile for kind, profile in self._latest(platform).values()
+                      if kind == _KIND_PUT)
+
+    @staticmethod
+    def _remember(latest: Dict[Tuple[str, str], Tuple[int, Profile]],
+                  kind: int, profile: Profile):
+        key = (profile.identity, profile.platform)
+        latest.pop(key, None)  # Re-insert to keep latest-write order
+        latest[key] = (kind, profile)
+
+    def profiles(self, identity: Optional[str] = None) -> List[Profile]:
+        """Every live profile (optionally for one identity) in store order.
+
+        The data file is scanned once per open store; later writes update
+        the in-memory result, so repeated calls (the GUI's platform list)
+        cost no I/O.
+        """
+        with self._lock:
+            if self._live is None:
+                self._data.flush()
+                live: Dict[Tuple[str, str], Tuple[int, Profile]] = {}
+                for _, kind, profile in self._scan(len(_DATA_MAGIC)):
+                    self._remember(live, kind, profile)
+                self._live = live
+            latest = list(self._live.values())
+        return [profile for kind, profile in latest
+                if kind == _KIND_PUT and identity in (None, profile.identity)]
+
+    def identities(self) -> List[str]:
+        """Sorted identity references with at least one profile"""
+        return sorted({profile.identity for profile in self.profiles()})
+
+    def __len__(self) -> int:
+        return len(self.profiles())
+
+    def compact(self):
+        """Rewrite the store without superseded and deleted records"""
+        with self._lock:
+            live = self.profiles()
+            temporary = self._data_path + ".tmp"
+            with open(temporary, "wb") as f:
+                f.write(_DATA_MAGIC)
+                for profile in live:
+                    f.write(_encode_record(_KIND_PUT, profile))
+
+            self._data.close()
+            self._close_index()
+            os.replace(temporary, self._data_path)
+            if os.path.exists(self._index_path):
+                os.remove(self._index_path)
+
+            self._data = open(self._data_path, "a+b")
+            self._index_count = 0
+            self._indexed_size = len(_DATA_MAGIC)
+            self._pending.clear()
+            self._pending_count = 0
+            self._live = None
+            self._catch_up()
+            self.flush()
+
+    def close(self):
+        """Write the index and release the files"""
+        with self._lock:
+            if self._data.closed:
+                return
+            self.flush()
+            self._close_index()
+            self._data.close()
+
+    def __enter__(self) -> "ProfileStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def default_store_directory() -> str:
+    """Per-user location of the GUI's profile store"""
+    return os.path.join(os.path.expanduser("~"), ".pypass", "profiles")
+
+
+def regenerate(profile: Profile, identity_info: PersonalInfo,
+               generator: Optional[SecurePasswordGenerator] = None) -> str:
+    """Regenerate the password of one stored profile.
+
+    ``identity_info`` supplies the identity's personal info; its platform is
+    ignored. Pass a long-lived ``generator`` to reuse its seed cache and
+    master key across calls.
+    """
+    if generator is None:
+        generator = SecurePasswordGenerator()
+    generator.set_derivation_version(profile.derivation_version)
+    generator.set_kdf_profile(profile.kdf_profile())
+    generator.set_personal_info(profile.personal_info(identity_info))
+    generator.set_options(profile.password_options())
+    return generator.generate_password()
+
+
+def regenerate_all(profiles: Iterable[Profile],
+                   identities: Dict[str, PersonalInfo],
+                   executor: str = "process",
+                   workers: Optional[int] = None) -> Iterator[Tuple[Profile, "BatchResult"]]:
+    """Regenerate many profiles in parallel; yields (profile, result).
+
+    Profiles are grouped by derivation version and KDF profile, each group
+    running through ``batch.iter_generate``; results come out group by group
+    in store order within each group. Profiles whose identity is missing
+    from ``identities`` are reported as failed results.
+    """
+    # Imported here: src.batch pulls in multiprocessing and src.breach, which
+    # the GUI-only build (the store's main user) leaves out
+    from .batch import BatchResult, iter_generate
+
+    groups: Dict[Tuple[str, str], List[Profile]] = defaultdict(list)
+    for profile in profiles:
+        groups[(profile.derivation_version, profile.kdf)].append(profile)
+
+    for (version, kdf), members in groups.items():
+        runnable = []
+        for profile in members:
+            if profile.identity in identities:
+                runnable.append(profile)
+            else:
+                yield profile, BatchResult(
+                    -1, None, f"Unknown identity: {profile.identity}")
+
+        jobs = ((profile.personal_info(identities[profile.identity]),
+                 profile.password_options()) for profile in runnable)
+        results = iter_generate(
+            jobs, executor=executor, workers=workers, derivation_version=version,
+            kdf_profile=parse_kdf_profile(kdf) if kdf else None)
+        for profile, result in zip(runnable, results):
+            yield profile, result
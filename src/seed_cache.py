@@ -0,0 +1,98 @@
+"""
+Seed Cache Module
+Bounded, expiring in-memory cache for derived PBKDF2 seed material
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+
+class SeedCache:
+    """LRU cache of derived seed material with TTL and explicit invalidation.
+
+    Key material is held in ``bytearray`` buffers that are overwritten with
+    zeros as soon as an entry is evicted, expires or is invalidated. Callers
+    only ever receive immutable copies.
+    """
+
+    def __init__(self, max_entries: int = 64, ttl: Optional[float] = 300.0,
+                 clock: Callable[[], float] = time.monotonic):
+        if max_entries < 1:
+            raise ValueError("Cache must hold at least one entry")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("TTL must be positive")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[bytearray, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _wipe(material: bytearray):
+        """Overwrite key material in place"""
+        for i in range(len(material)):
+            material[i] = 0
+
+    def _drop(self, key: Hashable):
+        material, _ = self._entries.pop(key)
+        self._wipe(material)
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Return cached material for key, or None on a miss or expired entry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= self._clock():
+                self._drop(key)
+                self.evictions += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return bytes(entry[0])
+
+    def put(self, key: Hashable, material: bytes):
+        """Store material for key, evicting the least recently used entries"""
+        expires_at = float("inf") if self.ttl is None else self._clock() + self.ttl
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (bytearray(material), expires_at)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Forget one entry, or every entry when no key is given"""
+        with self._lock:
+            if key is None:
+                for cached_key in list(self._entries):
+                    self._drop(cached_key)
+            elif key in self._entries:
+                self._drop(key)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current occupancy"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
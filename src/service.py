@@ -0,0 +1,362 @@
+"""
+Service Module for PyPass
+Local HTTP/JSON generation service with micro-batching and admission control
+
+Built only on the standard library. The service binds to localhost by
+default; it is meant to be one warm process shared by local tools, not an
+internet-facing server.
+"""
+
+import json
+import math
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+from .batch import _run_job, _worker_generator
+from .breach import BreachIndex
+from .derivation import DEFAULT_DERIVATION_VERSION, uses_master_key, validate_version
+from .kdf import KDFProfile
+from .password_generator import SecurePasswordGenerator, PersonalInfo, PasswordOptions
+
+
+MAX_BODY_BYTES = 64 * 1024
+LATENCY_SAMPLES = 10_000
+
+
+class ServiceOverloaded(Exception):
+    """Raised when the request queue is full"""
+
+
+class _Request:
+    """A queued unit of work and the slot its result is delivered to"""
+
+    __slots__ = ("kind", "payload", "enqueued_at", "done", "result", "error")
+
+    def __init__(self, kind: str, payload):
+        self.kind = kind
+        self.payload = payload
+        self.enqueued_at = time.perf_counter()
+        self.done = threading.Event()
+        self.result: Optional[Dict] = None
+        self.error: Optional[str] = None
+
+    def finish(self, result: Optional[Dict] = None, error: Optional[str] = None):
+        self.result = result
+        self.error = error
+        self.done.set()
+
+
+def _percentile(sorted_samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_samples:
+        return 0.0
+    rank = math.ceil(fraction * len(sorted_samples)) - 1
+    return sorted_samples[max(0, min(len(sorted_samples) - 1, rank))]
+
+
+class GenerationService:
+    """Worker pool behind a bounded queue, fed by a micro-batching dispatcher.
+
+    Requests beyond ``queue_size`` are rejected immediately (HTTP 429) so
+    latency stays bounded under overload. The dispatcher drains up to
+    ``batch_size`` queued requests at a time, waiting at most ``batch_window``
+    seconds for a batch to fill. Under master-key derivation versions (v2 and
+    later) generation jobs are grouped by identity so one worker handles all
+    platforms of an identity from a single KDF run; under v1, where every job
+    pays its own KDF, each job goes to the pool on its own.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765,
+                 workers: Optional[int] = None, queue_size: int = 256,
+                 batch_size: int = 16, batch_window: float = 0.005,
+                 request_timeout: float = 30.0,
+                 derivation_version: str = DEFAULT_DERIVATION_VERSION,
+                 kdf_profile: Optional[KDFProfile] = None,
+                 breach_index: Optional[BreachIndex] = None):
+        if queue_size < 1 or batch_size < 1:
+            raise ValueError("queue_size and batch_size must be positive")
+
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.request_timeout = request_timeout
+        self.derivation_version = validate_version(derivation_version)
+        self.kdf_profile = kdf_profile
+        # Grouping only pays off when one KDF run serves a whole identity
+        self._group_by_identity = uses_master_key(self.derivation_version)
+
+        self._queue: "queue.Queue[_Request]" = queue.Queue(maxsize=queue_size)
+        self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        # Keep the pool's own queue short so overload shows up as 429s
+        self._pool_slots = threading.BoundedSemaphore(self.workers * 2)
+        # Scores every response; breached passwords score ("Very Weak", 0.0)
+        self._strength = SecurePasswordGenerator(breach_index=breach_index)
+        self._stopping = threading.Event()
+        self._dispatcher: Optional[threading.Thread] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+
+        self._stats_lock = threading.Lock()
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+        self._accepted = 0
+        self._rejected = 0
+        self._completed = 0
+        self._batches = 0
+
+    # Admission -----------------------------------------------------------
+
+    def submit(self, kind: str, payload) -> _Request:
+        """Queue a request, raising ServiceOverloaded if the queue is full"""
+        request = _Request(kind, payload)
+        try:
+            self._queue.put_nowait(request)
+        except queue.Full:
+            with self._stats_lock:
+                self._rejected += 1
+            raise ServiceOverloaded("Request queue is full")
+        with self._stats_lock:
+            self._accepted += 1
+        return request
+
+    # Dispatching ---------------------------------------------------------
+
+    def _next_batch(self) -> List[_Request]:
+        try:
+            first = self._queue.get(timeout=0.1)
+        except queue.Empty:
+            return []
+
+        batch = [first]
+        deadline = time.perf_counter() + self.batch_window
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                if remaining <= 0:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _dispatch_loop(self):
+        while not self._stopping.is_set():
+            batch = self._next_batch()
+            if not batch:
+                continue
+            with self._stats_lock:
+                self._batches += 1
+
+            groups: Dict[object, List[_Request]] = {}
+            strength: List[_Request] = []
+            for request in batch:
+                if request.kind == "strength":
+                    strength.append(request)
+                elif self._group_by_identity:
+                    personal_info, _ = request.payload
+                    groups.setdefault(
+                        personal_info.get_identity_seed(), []).append(request)
+                else:
+                    groups[id(request)] = [request]
+
+            # Strength checks go to the pool too, so a slow one never holds
+            # up admission of the requests queued behind it
+            work = [(self._run_generation_group, group) for group in groups.values()]
+            if strength:
+                work.append((self._run_strength_group, strength))
+            for run, group in work:
+                self._pool_slots.acquire()
+                future = self._pool.submit(run, group)
+                future.add_done_callback(lambda _: self._pool_slots.release())
+
+    def _run_generation_group(self, group: List[_Request]):
+        generator = _worker_generator(self.derivation_version, self.kdf_profile)
+        for request in group:
+            personal_info, options = request.payload
+            password, error = _run_job(generator, personal_info, options)
+            if error is None:
+                label, score = self._strength.assess_strength(password)
+                self._complete(request, self._with_breach_flag(password, {
+                    "password": password,
+                    "strength": label,
+                    "score": score,
+                    "derivation": generator.derivation_fingerprint(),
+                }))
+            else:
+                self._complete(request, error=error)
+
+    def _run_strength_group(self, group: List[_Request]):
+        for request in group:
+            label, score = self._strength.assess_strength(request.payload)
+            self._complete(request, self._with_breach_flag(request.payload, {
+                "strength": label,
+                "score": score,
+                "entropy": self._strength.calculate_entropy(request.payload),
+            }))
+
+    def _with_breach_flag(self, password: str, result: Dict) -> Dict:
+        """Add "breached" to a response when a breach index is configured"""
+        if self._strength.breach_index is not None:
+            result["breached"] = self._strength.is_breached(password)
+        return result
+
+    def _complete(self, request: _Request, result: Optional[Dict] = None,
+                  error: Optional[str] = None):
+        latency = time.perf_counter() - request.enqueued_at
+        with self._stats_lock:
+            self._latencies.append(latency)
+            self._completed += 1
+        request.finish(result, error)
+
+    # Reporting -----------------------------------------------------------
+
+    def stats(self) -> Dict:
+        """Return queue depth, counters and p50/p99 latency in milliseconds"""
+        with self._stats_lock:
+            samples = sorted(self._latencies)
+            return {
+                "queue_depth": self._queue.qsize(),
+                "queue_capacity": self._queue.maxsize,
+                "workers": self.workers,
+                "accepted": self._accepted,
+                "rejected": self._rejected,
+                "completed": self._completed,
+                "batches": self._batches,
+                "latency_ms": {
+                    "p50": _percentile(samples, 0.50) * 1000,
+                    "p99": _percentile(samples, 0.99) * 1000,
+                    "samples": len(samples),
+                },
+            }
+
+    # Lifecycle -----------------------------------------------------------
+
+    def start(self) -> Tuple[str, int]:
+        """Start the dispatcher and HTTP server threads; return the bound address"""
+        self._dispatcher = threading.Thread(
+            target=self._dispatch_loop, name="pypass-dispatcher", daemon=True)
+        self._dispatcher.start()
+
+        self._server = ThreadingHTTPServer((self.host, self.port), _make_handler(self))
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever,
+                         name="pypass-http", daemon=True).start()
+        return self._server.server_address[:2]
+
+    def stop(self):
+        """Stop accepting requests and shut down the worker pool"""
+        self._stopping.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        if self._dispatcher is not None:
+            self._dispatcher.join()
+        self._pool.shutdown(wait=True)
+
+    def serve_forever(self):
+        """Run until interrupted (Ctrl+C)"""
+        self.start()
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+
+def _parse_generation_payload(body: Dict) -> Tuple[PersonalInfo, PasswordOptions]:
+    # Imported here: cli imports this module lazily for its serve command
+    from .cli import record_to_job
+    return record_to_job(body)
+
+
+def _make_handler(service: GenerationService):
+    class GenerationRequestHandler(BaseHTTPRequestHandler):
+        """JSON endpoints: POST /generate, POST /strength, GET /stats, GET /health"""
+
+        server_version = "PyPass"
+
+        def log_message(self, format, *args):
+            pass  # Keep the service quiet; never risk logging payloads
+
+        def _send_json(self, status: int, body: Dict,
+                       headers: Optional[Dict[str, str]] = None):
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _read_json(self) -> Optional[Dict]:
+            # Checked before reading: a negative length would read until the
+            # client hangs up
+            header = (self.headers.get("Content-Length") or "0").strip()
+            if not header.isdigit() or not header.isascii():
+                self._send_json(400, {"error": "Invalid Content-Length"})
+                return None
+            length = int(header)
+            if length > MAX_BODY_BYTES:
+                self._send_json(413, {"error": "Request body too large"})
+                return None
+            try:
+                body = json.loads(self.rfile.read(length) or b"{}")
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                self._send_json(400, {"error": "Invalid JSON"})
+                return None
+            if not isinstance(body, dict):
+                self._send_json(400, {"error": "Body must be a JSON object"})
+                return None
+            return body
+
+        def do_GET(self):
+            if self.path == "/stats":
+                self._send_json(200, service.stats())
+            elif self.path == "/health":
+                self._send_json(200, {"status": "ok"})
+            else:
+                self._send_json(404, {"error": "Not found"})
+
+        def do_POST(self):
+            if self.path not in ("/generate", "/strength"):
+                self._send_json(404, {"error": "Not found"})
+                return
+
+            body = self._read_json()
+            if body is None:
+                return
+
+            try:
+                if self.path == "/generate":
+                    request = service.submit(
+                        "generate", _parse_generation_payload(body))
+                else:
+                    if not isinstance(body.get("password"), str):
+                        raise ValueError("'password' must be a string")
+                    request = service.submit("strength", body["password"])
+            except ValueError as e:
+                self._send_json(400, {"error": str(e)})
+                return
+            except ServiceOverloaded as e:
+                self._send_json(429, {"error": str(e)}, {"Retry-After": "1"})
+                return
+
+            if not request.done.wait(service.request_timeout):
+                self._send_json(504, {"error": "Timed out"})
+            elif request.error is not None:
+                self._send_json(422, {"error": request.error})
+            else:
+                self._send_json(200, request.result)
+
+    return GenerationRequestHandler
@@ -0,0 +1,266 @@
+"""
+Strength Module
+Bulk strength assessment and streaming password audits
+
+Scores are exactly those of ``SecurePasswordGenerator.assess_strength``. The
+NumPy path is used when NumPy is installed; otherwise a pure-Python path with
+the same arithmetic is used.
+"""
+
+import math
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .guess_estimator import estimate_guesses
+from .password_generator import SPECIAL_CHARACTERS, STRENGTH_LABELS, strength_label
+
+if TYPE_CHECKING:
+    from .breach import BreachIndex
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+
+DEFAULT_CHUNK_SIZE = 50_000
+# Rows per NumPy block; bounds the (rows x 256) histogram to a few MB
+_NUMPY_BLOCK_ROWS = 4096
+
+_SPECIAL_SET = frozenset(SPECIAL_CHARACTERS)
+
+
+def _assess_python(password: str) -> Tuple[str, float]:
+    """assess_strength with identical arithmetic, scanning unique characters once"""
+    if not password:
+        return "Very Weak", 0.0
+
+    length = len(password)
+    # Counter keeps first-occurrence order, so the entropy terms are summed
+    # in the same order as calculate_entropy and round identically
+    frequency = Counter(password)
+
+    variety_score = 0
+    if any(c.islower() for c in frequency):
+        variety_score += 10
+    if any(c.isupper() for c in frequency):
+        variety_score += 10
+    if any(c.isdigit() for c in frequency):
+        variety_score += 10
+    if not _SPECIAL_SET.isdisjoint(frequency):
+        variety_score += 10
+
+    entropy = 0.0
+    for count in frequency.values():
+        probability = count / length
+        entropy -= probability * math.log2(probability)
+
+    score = 0.0
+    score += min(30, length * 2)
+    score += variety_score
+    score += min(30, entropy * 6)
+    final_score = min(100, score)
+    return strength_label(final_score), final_score
+
+
+# Per-byte class bits for ASCII passwords: lower, upper, digit, special
+_CLASS_BITS = [0] * 256
+for _code in range(128):
+    _char = chr(_code)
+    if _char.islower():
+        _CLASS_BITS[_code] |= 1
+    if _char.isupper():
+        _CLASS_BITS[_code] |= 2
+    if _char.isdigit():
+        _CLASS_BITS[_code] |= 4
+    if _char in _SPECIAL_SET:
+        _CLASS_BITS[_code] |= 8
+_VARIETY_POINTS = [10 * bin(bits).count("1") for bits in range(16)]
+
+_entropy_terms: Dict[int, "np.ndarray"] = {}
+
+
+def _entropy_term_table(length: int) -> "np.ndarray":
+    """p*log2(p) for every count 0..length, computed exactly as the scalar path"""
+    table = _entropy_terms.get(length)
+    if table is None:
+        terms = [0.0]
+        for count in range(1, length + 1):
+            probability = count / length
+            terms.append(probability * math.log2(probability))
+        table = np.array(terms, dtype=np.float64)
+        _entropy_terms[length] = table
+    return table
+
+
+def _score_block_numpy(encoded: List[bytes], length: int) -> List[float]:
+    """Score equal-length ASCII passwords with vectorized class masks and histograms"""
+    rows = len(encoded)
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8).reshape(rows, length)
+    row_index = np.arange(rows)
+
+    class_lut = np.array(_CLASS_BITS, dtype=np.uint8)
+    classes = np.bitwise_or.reduce(class_lut[data], axis=1)
+    variety = np.array(_VARIETY_POINTS, dtype=np.float64)[classes]
+
+    counts = np.bincount((data + (row_index[:, None] * 256)).ravel(),
+                         minlength=rows * 256).reshape(rows, 256)
+    first_seen = np.full((rows, 256), length, dtype=np.int32)
+    for position in range(length - 1, -1, -1):
+        first_seen[row_index, data[:, position]] = position
+    order = np.argsort(first_seen, axis=1, kind="stable")[:, :length]
+    ordered_counts = np.take_along_axis(counts, order, axis=1)
+
+    # Sum terms column by column in first-occurrence order, as the scalar
+    # loop does; absent characters contribute an exact 0.0
+    terms = _entropy_term_table(length)
+    entropy = np.zeros(rows, dtype=np.float64)
+    for column in range(ordered_counts.shape[1]):
+        entropy = entropy - terms[ordered_counts[:, column]]
+
+    score = np.full(rows, 0.0) + min(30, length * 2)
+    score = score + variety
+    score = score + np.minimum(30.0, entropy * 6)
+    return np.minimum(100.0, score).tolist()
+
+
+def _assess_numpy(passwords: Sequence[str]) -> List[Tuple[str, float]]:
+    results: List[Optional[Tuple[str, float]]] = [None] * len(passwords)
+    by_length: Dict[int, List[int]] = {}
+
+    for index, password in enumerate(passwords):
+        if password and password.isascii():
+            by_length.setdefault(len(password), []).append(index)
+        else:
+            results[index] = _assess_python(password)
+
+    for length, indices in by_length.items():
+        for start in range(0, len(indices), _NUMPY_BLOCK_ROWS):
+            block = indices[start:start + _NUMPY_BLOCK_ROWS]
+            scores = _score_block_numpy(
+                [passwords[i].encode("ascii") for i in block], length)
+            for index, score in zip(block, scores):
+                results[index] = (strength_label(score), score)
+
+    return results
+
+
+def assess_strength_batch(passwords: Sequence[str],
+                          use_numpy: Optional[bool] = None,
+                          breach_index: Optional["BreachIndex"] = None) -> List[Tuple[str, float]]:
+    """Assess many passwords at once; returns (label, score) in input order.
+
+    ``use_numpy`` forces a path; by default NumPy is used when installed.
+    Results equal ``assess_strength`` for every password, including the
+    ("Very Weak", 0.0) given to passwords found in ``breach_index``.
+    """
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        if np is None:
+            raise RuntimeError("NumPy is not installed")
+        results = _assess_numpy(passwords)
+    else:
+        results = [_assess_python(password) for password in passwords]
+    if breach_index is not None:
+        _mark_breached(passwords, results, breach_index)
+    return results
+
+
+def _mark_breached(passwords: Sequence[str], results: List[Tuple[str, float]],
+                   breach_index: "BreachIndex") -> int:
+    """Score breached passwords ("Very Weak", 0.0) in place; returns how many"""
+    breached = 0
+    for i, password in enumerate(passwords):
+        if password and password in breach_index:
+            results[i] = ("Very Weak", 0.0)
+            breached += 1
+    return breached
+
+
+def _chunks(lines: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    chunk = []
+    for line in lines:
+        chunk.append(line.rstrip("\r\n"))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def audit_passwords(lines: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    use_numpy: Optional[bool] = None, guesses: bool = False,
+                    breach_index: Optional["BreachIndex"] = None) -> Dict:
+    """Score a stream of passwords (one per line) chunk by chunk.
+
+    Only aggregates are kept, so memory is bounded by ``chunk_size`` however
+    long the input. Returns a JSON-serializable summary report. With
+    ``guesses`` the report also summarizes guess estimates (pure Python,
+    roughly 0.2ms per password). With ``breach_index`` breached passwords
+    are counted and scored as ``assess_strength`` scores them.
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive")
+    if use_numpy is None:
+        use_numpy = np is not None
+
+    total = 0
+    empty = 0
+    score_sum = 0.0
+    length_sum = 0
+    min_score: Optional[float] = None
+    max_score: Optional[float] = None
+    labels = {label: 0 for label in STRENGTH_LABELS}
+    histogram = [0] * 10  # 10-point score buckets; 100 goes in the last one
+    breached = 0
+    guess_scores = [0] * 5
+    log10_sum = 0.0
+    min_log10: Optional[float] = None
+
+    for chunk in _chunks(lines, chunk_size):
+        scores = assess_strength_batch(chunk, use_numpy)
+        if breach_index is not None:
+            breached += _mark_breached(chunk, scores, breach_index)
+        for password, (label, score) in zip(chunk, scores):
+            total += 1
+            if not password:
+                empty += 1
+            length_sum += len(password)
+            score_sum += score
+            labels[label] += 1
+            histogram[min(9, int(score // 10))] += 1
+            min_score = score if min_score is None else min(min_score, score)
+            max_score = score if max_score is None else max(max_score, score)
+            if guesses:
+                estimate = estimate_guesses(password)
+                guess_scores[estimate.score] += 1
+                log10_sum += estimate.log10_guesses
+                min_log10 = (estimate.log10_guesses if min_log10 is None
+                             else min(min_log10, estimate.log10_guesses))
+
+    report = {
+        "passwords": total,
+        "empty": empty,
+        "labels": labels,
+        "score": {
+            "mean": score_sum / total if total else 0.0,
+            "min": min_score or 0.0,
+            "max": max_score or 0.0,
+            "histogram": {f"{bucket * 10}-{bucket * 10 + 9 if bucket < 9 else 100}": count
+                          for bucket, count in enumerate(histogram)},
+        },
+        "mean_length": length_sum / total if total else 0.0,
+        "weak_fraction": (labels["Very Weak"] + labels["Weak"]) / total if total else 0.0,
+        "engine": "numpy" if use_numpy else "python",
+    }
+    if breach_index is not None:
+        report["breached"] = breached
+        report["breached_fraction"] = breached / total if total else 0.0
+    if guesses:
+        report["guesses"] = {
+            "mean_log10": log10_sum / total if total else 0.0,
+            "min_log10": min_log10 or 0.0,
+            "scores": {str(score): count for score, count in enumerate(guess_scores)},
+        }
+    return report
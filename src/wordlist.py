@@ -0,0 +1,149 @@
+"""
+Wordlist Module
+Compact, memory-mapped wordlists for passphrase generation
+
+File layout (all integers big-endian)::
+
+    magic  b"PYPWL001"
+    u32    word count N
+    32B    SHA-256 of the offset table and word data (the list's identity)
+    u32    offsets[N + 1]   byte offsets of each word in the data
+    bytes  UTF-8 word data, words concatenated without separators
+
+Words are read straight from the mapping on demand, so opening a list costs
+the same for 1k or 1M words and the list never exists as Python strings.
+"""
+
+import hashlib
+import itertools
+import mmap
+import os
+import struct
+from typing import Iterable, Optional
+
+
+_MAGIC = b"PYPWL001"
+_HEADER = struct.Struct(">I32s")
+_OFFSET = struct.Struct(">I")
+
+MIN_WORDS = 2
+
+# Built-in list: every consonant-vowel-consonant-vowel-consonant syllable
+# pair over these letters (16 * 5 * 16 * 5 * 16 = 102,400 pronounceable
+# five-letter words, ~16.6 bits each). Passphrases depend on the exact list,
+# so these letters and their order must never change.
+_DEFAULT_CONSONANTS = "bdfghjklmnprstvz"
+_DEFAULT_VOWELS = "aeiou"
+DEFAULT_WORDLIST_NAME = "syllables-v1.pwl"
+
+
+def _content_digest(offsets: bytes, data: bytes) -> bytes:
+    return hashlib.sha256(offsets + data).digest()
+
+
+def build_wordlist(words: Iterable[str], path: str) -> int:
+    """Write words to path in wordlist format; returns the word count.
+
+    Surrounding whitespace is stripped, blank lines and duplicates dropped,
+    and the words sorted, so the same set of words always yields the same
+    file (and the same passphrases) whatever order it was given in.
+    """
+    unique = sorted({word.strip() for word in words} - {""})
+    for word in unique:
+        if any(char.isspace() for char in word):
+            raise ValueError(f"Word contains whitespace: {word!r}")
+    if len(unique) < MIN_WORDS:
+        raise ValueError(f"A wordlist needs at least {MIN_WORDS} distinct words")
+
+    data = bytearray()
+    offsets = bytearray(_OFFSET.pack(0))
+    for word in unique:
+        data += word.encode("utf-8")
+        offsets += _OFFSET.pack(len(data))
+
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as f:
+        f.write(_MAGIC)
+        f.write(_HEADER.pack(len(unique), _content_digest(bytes(offsets), bytes(data))))
+        f.write(offsets)
+        f.write(data)
+    os.replace(temporary, path)
+    return len(unique)
+
+
+class WordList:
+    """Read-only, memory-mapped view of a wordlist file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if self._map[:len(_MAGIC)] != _MAGIC:
+                raise ValueError(f"{path} is not a wordlist file")
+            self._count, self._digest = _HEADER.unpack_from(self._map, len(_MAGIC))
+            self._offsets_start = len(_MAGIC) + _HEADER.size
+            self._data_start = self._offsets_start + (self._count + 1) * _OFFSET.size
+            if self._count < MIN_WORDS or self._data_start > len(self._map):
+                raise ValueError(f"{path} is truncated or corrupt")
+        except ValueError:
+            self._map.close()
+            raise
+
+    @property
+    def digest(self) -> str:
+        """Hex SHA-256 identifying the list's exact contents"""
+        return self._digest.hex()
+
+    def verify(self) -> bool:
+        """Recompute the content digest (reads the whole file)"""
+        offsets = self._map[self._offsets_start:self._data_start]
+        return _content_digest(offsets, self._map[self._data_start:]) == self._digest
+
+    def _offset(self, index: int) -> int:
+        return _OFFSET.unpack_from(
+            self._map, self._offsets_start + index * _OFFSET.size)[0]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Word index out of range")
+        start = self._data_start + self._offset(index)
+        end = self._data_start + self._offset(index + 1)
+        return self._map[start:end].decode("utf-8")
+
+    def close(self):
+        """Unmap the file"""
+        self._map.close()
+
+    def __enter__(self) -> "WordList":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def default_words() -> Iterable[str]:
+    """Words of the built-in syllable list, in sorted order"""
+    consonants, vowels = _DEFAULT_CONSONANTS, _DEFAULT_VOWELS
+    for letters in itertools.product(consonants, vowels, consonants, vowels, consonants):
+        yield "".join(letters)
+
+
+def default_wordlist(directory: Optional[str] = None) -> WordList:
+    """Open the built-in list, building its file on first use.
+
+    ``directory`` defaults to ``~/.pypass``.
+    """
+    if directory is None:
+        directory = os.path.join(os.path.expanduser("~"), ".pypass")
+    path = os.path.join(directory, DEFAULT_WORDLIST_NAME)
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        build_wordlist(default_words(), path)
+    return WordList(path)
@@ -139,3 +139,1221 @@ def test_deterministic_generation():
     password_third = generator.generate_password()
 
     assert password_third != password_first
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_generate_many_matches_single_calls(executor):
+    from src.batch import generate_many
+
+    jobs = []
+    for platform, length in [("Email", 12), ("Bank", 20), ("Forum", 16)]:
+        personal_info = PersonalInfo(
+            first_name="Alice",
+            last_name="Smith",
+            birth_date="12-08-1992",
+            current_date="02-10-2025",
+            platform=platform,
+            city="London",
+        )
+        options = PasswordOptions()
+        options.length = length
+        jobs.append((personal_info, options))
+    jobs.append((PersonalInfo(first_name="Incomplete"), PasswordOptions()))
+
+    results = generate_many(jobs, executor=executor, workers=2)
+
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    for (personal_info, options), result in zip(jobs[:3], results[:3]):
+        assert result.ok
+        assert result.password == _build_generator(
+            personal_info, options).generate_password()
+    assert not results[3].ok
+    assert results[3].password is None
+    assert "incomplete" in results[3].error
+
+
+def test_seed_cache_reuses_and_wipes_material():
+    from src.seed_cache import SeedCache
+
+    now = [0.0]
+    cache = SeedCache(max_entries=1, ttl=10.0, clock=lambda: now[0])
+    personal_info = PersonalInfo(
+        first_name="Alice",
+        last_name="Smith",
+        birth_date="12-08-1992",
+        current_date="02-10-2025",
+        platform="Email",
+        city="London",
+    )
+    options = PasswordOptions()
+
+    uncached = _build_generator(personal_info, options).generate_password()
+    generator = SecurePasswordGenerator(seed_cache=cache)
+    generator.set_personal_info(personal_info)
+    generator.set_options(options)
+
+    assert generator.generate_password() == uncached
+    assert generator.generate_password() == uncached
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    stored_material = next(iter(cache._entries.values()))[0]
+    now[0] = 11.0
+    assert generator.generate_password() == uncached
+    assert cache.misses == 2
+    assert stored_material == bytearray(len(stored_material))
+
+    cache.put("other", b"\x01" * 64)
+    assert len(cache) == 1
+    assert cache.stats()["evictions"] == 2
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_v1_derivation_known_answer():
+    personal_info = PersonalInfo(
+        first_name="Alice",
+        last_name="Smith",
+        birth_date="12-08-1992",
+        current_date="02-10-2025",
+        platform="Email",
+        city="London",
+    )
+    generator = _build_generator(personal_info, PasswordOptions())
+
+    assert generator.derivation_version == "v1"
+    assert generator.generate_password() == ",#]QbZ3Rh=W,"
+
+
+def test_v2_derivation_runs_kdf_once_per_identity(monkeypatch):
+    import src.derivation
+
+    kdf_calls = []
+    original_pbkdf2 = src.derivation.hashlib.pbkdf2_hmac
+
+    def counting_pbkdf2(*args, **kwargs):
+        kdf_calls.append(args)
+        return original_pbkdf2(*args, **kwargs)
+
+    monkeypatch.setattr(src.derivation.hashlib, "pbkdf2_hmac", counting_pbkdf2)
+
+    generator = SecurePasswordGenerator(derivation_version="v2")
+    generator.set_options(PasswordOptions())
+    passwords = []
+    for platform in ["Email", "Bank", "Forum"]:
+        generator.set_personal_info(PersonalInfo(
+            first_name="Alice",
+            last_name="Smith",
+            birth_date="12-08-1992",
+            current_date="02-10-2025",
+            platform=platform,
+            city="London",
+        ))
+        passwords.append(generator.generate_password())
+        assert generator.generate_password() == passwords[-1]
+
+    assert len(kdf_calls) == 1
+    assert len(set(passwords)) == 3
+    assert passwords[0] != ",#]QbZ3Rh=W,"
+    assert generator.derivation_fingerprint().startswith("derivation=v2|len=12|")
+
+    with pytest.raises(ValueError):
+        SecurePasswordGenerator(derivation_version="v9")
+
+
+def test_cli_streams_csv_records(tmp_path):
+    import csv
+    import json
+    import subprocess
+    import sys
+
+    from src.cli import main
+
+    input_path = tmp_path / "jobs.csv"
+    output_path = tmp_path / "results.jsonl"
+    with open(input_path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows([
+            ["id", "first_name", "last_name", "birth_date", "current_date",
+             "platform", "city", "length", "include_special"],
+            ["a", "Alice", "Smith", "12-08-1992", "02-10-2025", "Email", "London", "", ""],
+            ["b", "Alice", "Smith", "12-08-1992", "02-10-2025", "Bank", "London", "14", "no"],
+            ["c", "Alice", "", "12-08-1992", "02-10-2025", "Forum", "London", "", ""],
+        ])
+
+    exit_code = main(["generate", str(input_path), "-o", str(output_path),
+                      "--executor", "thread", "-w", "2"])
+
+    rows = [json.loads(line) for line in output_path.read_text().splitlines()]
+    assert exit_code == 1
+    assert [row["id"] for row in rows] == ["a", "b", "c"]
+    assert rows[0]["password"] == ",#]QbZ3Rh=W,"
+    assert len(rows[1]["password"]) == 14
+    assert not any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in rows[1]["password"])
+    assert rows[2]["password"] is None and rows[2]["error"]
+
+    probe = subprocess.run(
+        [sys.executable, "-c",
+         "import sys, src.cli; print('tkinter' in sys.modules)"],
+        capture_output=True, text=True, check=True)
+    assert probe.stdout.strip() == "False"
+
+
+def test_async_generation_caps_in_flight_and_times_out():
+    import asyncio
+
+    from src.async_generation import AsyncPasswordGenerator
+
+    personal_info = PersonalInfo(
+        first_name="Alice",
+        last_name="Smith",
+        birth_date="12-08-1992",
+        current_date="02-10-2025",
+        platform="Email",
+        city="London",
+    )
+    jobs = [(personal_info, PasswordOptions()) for _ in range(3)]
+    jobs.append((PersonalInfo(first_name="Incomplete"), PasswordOptions()))
+
+    async def scenario():
+        async with AsyncPasswordGenerator(max_in_flight=1) as generator:
+            batch = asyncio.ensure_future(generator.generate_many_async(jobs))
+            await asyncio.sleep(0.05)
+            assert generator.in_flight == 1
+            results = await batch
+
+            with pytest.raises(asyncio.TimeoutError):
+                await generator.generate_password_async(
+                    personal_info, PasswordOptions(), timeout=0.001)
+
+            single = await generator.generate_password_async(
+                personal_info, PasswordOptions())
+            return results, single
+
+    results, single = asyncio.run(scenario())
+
+    assert single == ",#]QbZ3Rh=W,"
+    assert [result.password for result in results[:3]] == [single] * 3
+    assert results[3].error and results[3].password is None
+
+
+def test_async_batch_timeout_excludes_slot_wait():
+    """Per-job timeouts start when the job gets a slot, not when it queues"""
+    import asyncio
+
+    from src.async_generation import AsyncPasswordGenerator
+    from src.kdf import parse_kdf_profile
+
+    # ~50ms derivations: twelve of them queue far longer than the timeout
+    kdf = parse_kdf_profile("pbkdf2-sha512:i=40000")
+    jobs = [(PersonalInfo(first_name="Alice", last_name="Smith",
+                          birth_date="12-08-1992", current_date="02-10-2025",
+                          platform=f"site{number}", city="London"), PasswordOptions())
+            for number in range(12)]
+
+    async def scenario():
+        async with AsyncPasswordGenerator(max_in_flight=2, kdf_profile=kdf) as generator:
+            return await generator.generate_many_async(jobs, timeout=0.25)
+
+    results = asyncio.run(scenario())
+    assert [result.error for result in results] == [None] * 12
+
+
+def test_generation_service_endpoints_and_admission():
+    import json
+    import urllib.error
+    import urllib.request
+
+    from src.service import GenerationService, ServiceOverloaded
+
+    service = GenerationService(port=0, workers=2)
+    host, port = service.start()
+    base_url = f"http://{host}:{port}"
+
+    def post(path, body):
+        request = urllib.request.Request(
+            base_url + path, data=json.dumps(body).encode("utf-8"),
+            headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    try:
+        status, body = post("/generate", {
+            "first_name": "Alice", "last_name": "Smith",
+            "birth_date": "12-08-1992", "current_date": "02-10-2025",
+            "platform": "Email", "city": "London",
+        })
+        assert status == 200
+        assert body["password"] == ",#]QbZ3Rh=W,"
+
+        status, body = post("/strength", {"password": "abc"})
+        assert status == 200 and body["strength"] == "Weak"
+
+        assert post("/generate", {"first_name": "Alice"})[0] == 422
+        assert post("/strength", {"password": 5})[0] == 400
+
+        with urllib.request.urlopen(base_url + "/stats", timeout=10) as response:
+            stats = json.loads(response.read())
+        assert stats["completed"] == 3
+        assert stats["latency_ms"]["p99"] >= stats["latency_ms"]["p50"] > 0
+    finally:
+        service.stop()
+
+    idle_service = GenerationService(queue_size=1)
+    idle_service.submit("strength", "abc")
+    with pytest.raises(ServiceOverloaded):
+        idle_service.submit("strength", "abc")
+    assert idle_service.stats()["rejected"] == 1
+
+
+def test_generation_service_groups_by_identity_only_for_master_key_versions():
+    from src.service import GenerationService
+
+    def group_sizes(version):
+        service = GenerationService(port=0, workers=2, batch_window=0.2,
+                                    derivation_version=version)
+        sizes = []
+
+        def record(group):
+            sizes.append(len(group))
+            for request in group:
+                service._complete(request, {})
+
+        service._run_generation_group = record
+        requests = []
+        for platform in ("Email", "Bank", "Forum"):
+            personal_info = PersonalInfo("Alice", "Smith", "12-08-1992",
+                                         "02-10-2025", platform, "London")
+            requests.append(service.submit(
+                "generate", (personal_info, PasswordOptions())))
+        service.start()
+        try:
+            assert all(request.done.wait(10) for request in requests)
+        finally:
+            service.stop()
+        return sizes
+
+    assert group_sizes("v1") == [1, 1, 1]
+    assert group_sizes("v2") == [3]
+
+
+def test_generation_service_rejects_bad_content_length_and_offloads_strength():
+    import http.client
+    import json
+    import threading
+
+    from src.service import GenerationService, MAX_BODY_BYTES
+
+    service = GenerationService(port=0, workers=1)
+    scored_on = []
+    assess_strength = service._strength.assess_strength
+
+    def recording_assess(password):
+        scored_on.append(threading.current_thread().name)
+        return assess_strength(password)
+
+    service._strength.assess_strength = recording_assess
+    host, port = service.start()
+
+    def post(length_header, body=b""):
+        connection = http.client.HTTPConnection(host, port, timeout=10)
+        try:
+            connection.putrequest("POST", "/strength")
+            connection.putheader("Content-Length", length_header)
+            connection.endheaders(body)
+            response = connection.getresponse()
+            return response.status, json.loads(response.read())
+        finally:
+            connection.close()
+
+    try:
+        assert post("abc")[0] == 400
+        assert post("-5")[0] == 400
+        assert post("1e3")[0] == 400
+        assert post(str(MAX_BODY_BYTES + 1))[0] == 413
+
+        payload = json.dumps({"password": "abc"}).encode("utf-8")
+        status, body = post(str(len(payload)), payload)
+        assert status == 200 and body["strength"] == "Weak"
+        assert scored_on and "pypass-dispatcher" not in scored_on
+    finally:
+        service.stop()
+
+
+class _FakeTkRoot:
+    """Stand-in for tk.Tk that runs after() callbacks on demand"""
+
+    def __init__(self):
+        self.pending = {}
+        self._ids = 0
+
+    def after(self, delay_ms, callback):
+        self._ids += 1
+        self.pending[self._ids] = callback
+        return self._ids
+
+    def after_cancel(self, call_id):
+        self.pending.pop(call_id, None)
+
+    def run_pending(self):
+        callbacks, self.pending = self.pending, {}
+        for callback in callbacks.values():
+            callback()
+
+
+def test_tk_scheduler_drops_superseded_results():
+    import threading
+    import time
+
+    from src.gui import TkScheduler
+
+    root = _FakeTkRoot()
+    scheduler = TkScheduler(root)
+    release = threading.Event()
+    delivered = []
+
+    scheduler.submit("generate", lambda: release.wait(5) and "stale",
+                     delivered.append)
+    scheduler.submit("generate", lambda: "fresh", delivered.append)
+    release.set()
+
+    for _ in range(100):
+        root.run_pending()
+        if not scheduler.is_busy("generate"):
+            break
+        time.sleep(0.01)
+
+    assert delivered == ["fresh"]
+    scheduler.shutdown()
+
+
+class _FakeVar:
+    """Stand-in for a Tk variable"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+def test_gui_speculative_derivation_warms_seed_cache():
+    import itertools
+    import time
+
+    from src.gui import PasswordGeneratorApp, TkScheduler
+    from src.seed_cache import SeedCache
+
+    root = _FakeTkRoot()
+    app = PasswordGeneratorApp.__new__(PasswordGeneratorApp)
+    app.scheduler = TkScheduler(root, max_workers=3)
+    app.password_generator = SecurePasswordGenerator(seed_cache=SeedCache())
+    app._speculation_call = None
+    app._speculations = {}
+    app._latest_speculation = None
+    app._speculation_deferred = False
+    app._speculation_ids = itertools.count(1)
+    fields = {"first_name": "Alice", "last_name": "Smith", "birth_date": "12-08-1992",
+              "current_date": "02-10-2025", "platform": "Email", "city": "London"}
+    for name, value in fields.items():
+        setattr(app, f"{name}_var", _FakeVar(value))
+    for name in ("include_uppercase", "include_lowercase", "include_numbers",
+                 "include_special", "exclude_ambiguous", "speculate_var"):
+        setattr(app, name, _FakeVar(True))
+    app.length_var = _FakeVar(12)
+    app.rotation_var = _FakeVar(0)
+
+    # Debounced: nothing starts until the timer fires
+    app._schedule_speculation()
+    app._schedule_speculation()
+    assert len(root.pending) == 1 and not app._speculations
+    root.run_pending()
+    assert len(app._speculations) == 1
+
+    # Clicking Generate now waits for the speculative KDF instead of repeating it
+    personal_info, options = app._collect_inputs()
+    assert app._derive_password(personal_info, options) == ",#]QbZ3Rh=W,"
+    stats = app.password_generator.seed_cache.stats()
+    assert stats["entries"] == 1 and stats["hits"] == 1
+
+    for _ in range(100):
+        root.run_pending()
+        if not app._speculations:
+            break
+        time.sleep(0.01)
+    assert not app._speculations
+
+    # Invalid inputs (or the toggle off) never start a derivation
+    app.birth_date_var = _FakeVar("1992")
+    app._schedule_speculation()
+    root.run_pending()
+    app.speculate_var = _FakeVar(False)
+    app._schedule_speculation()
+    assert not root.pending and not app._speculations
+
+    # A speculation cancelled before it ran must not leave Generate waiting
+    import threading
+
+    app.birth_date_var, app.speculate_var = _FakeVar("12-08-1992"), _FakeVar(True)
+    app.password_generator.seed_cache.invalidate()
+    release = threading.Event()
+    for worker in range(3):
+        app.scheduler.submit(f"busy-{worker}", release.wait, lambda _: None)
+    app._start_speculation()
+    assert len(app._speculations) == 1
+    for channel in [c for c in app.scheduler._current if c.startswith("speculate")]:
+        app.scheduler.cancel(channel)
+    release.set()
+    assert app._derive_password(personal_info, options) == ",#]QbZ3Rh=W,"
+    app.scheduler.shutdown()
+
+
+def test_gui_loaded_profile_scheme_applies_to_one_password():
+    from src.gui import PasswordGeneratorApp
+    from src.profile_store import Profile
+    from src.seed_cache import SeedCache
+
+    app = PasswordGeneratorApp.__new__(PasswordGeneratorApp)
+    app.password_generator = SecurePasswordGenerator(seed_cache=SeedCache())
+    app._speculations = {}
+    info = PersonalInfo(first_name="Alice", last_name="Smith",
+                        birth_date="12-08-1992", current_date="02-10-2025",
+                        platform="Email", city="London")
+    profile = Profile.create("me", "Email", PasswordOptions(), "v2")
+
+    expected = SecurePasswordGenerator(derivation_version="v2")
+    expected.set_personal_info(info)
+    expected.set_options(PasswordOptions())
+    assert app._derive_password(info, PasswordOptions(), profile) == \
+        expected.generate_password()
+    # Later Generate clicks still use the user's own scheme
+    assert app.password_generator.derivation_version == "v1"
+    assert app._derive_password(info, PasswordOptions()) == ",#]QbZ3Rh=W,"
+
+
+class _FakeWidget:
+    """Stand-in for a Tk widget that records its configuration"""
+
+    def __init__(self):
+        self.options = {}
+
+    def config(self, **options):
+        self.options.update(options)
+
+
+def test_gui_strength_preview_coalesces_option_changes():
+    import math
+
+    from src.gui import PasswordGeneratorApp, TkScheduler
+
+    root = _FakeTkRoot()
+    app = PasswordGeneratorApp.__new__(PasswordGeneratorApp)
+    app.scheduler = TkScheduler(root)
+    app._strength_preview_call = None
+    app.strength_label, app.strength_progress = _FakeWidget(), _FakeWidget()
+    for name in ("first_name", "last_name", "birth_date", "current_date", "platform", "city"):
+        setattr(app, f"{name}_var", _FakeVar(""))
+    for name in ("include_uppercase", "include_lowercase", "include_numbers",
+                 "include_special", "exclude_ambiguous"):
+        setattr(app, name, _FakeVar(True))
+    app.rotation_var = _FakeVar(0)
+
+    # Dragging the slider: many changes, one update with the final length
+    for length in range(8, 129):
+        app.length_var = _FakeVar(length)
+        app._schedule_strength_preview()
+    assert len(root.pending) == 1
+    root.run_pending()
+    bits = 128 * math.log2(len(PasswordOptions().compile().characters))
+    assert app.strength_label.options["text"] == \
+        f"Expected strength: Very Strong (~{bits:.0f} bits)"
+    assert app.strength_progress.options["value"] == 100.0
+
+    for name in ("include_uppercase", "include_lowercase", "include_special"):
+        setattr(app, name, _FakeVar(False))
+    app.length_var = _FakeVar(8)
+    app._schedule_strength_preview()
+    root.run_pending()
+    assert app.strength_label.options["text"].startswith("Expected strength: Weak")
+
+    app.include_numbers = _FakeVar(False)
+    app._schedule_strength_preview()
+    root.run_pending()
+    assert app.strength_progress.options["value"] == 0
+
+
+@pytest.mark.parametrize("modulo", [1, 2, 3, 57, 88, 256, 7776])
+def test_unbiased_sampler_matches_reference_rejection(modulo):
+    seed = bytes(range(64))
+    sampler = SecurePasswordGenerator._UnbiasedPRNG(seed)
+    reference = SecurePasswordGenerator._DeterministicPRNG(seed)
+
+    values = sampler.next_ints(modulo, 500)
+
+    bits = (modulo - 1).bit_length()
+    width = max(1, (bits + 7) // 8)
+    expected = []
+    while modulo > 1 and len(expected) < 500:
+        need = 500 - len(expected)
+        for _ in range(need):
+            candidate = int.from_bytes(reference.next_bytes(width), "big")
+            candidate &= (1 << bits) - 1
+            if candidate < modulo:
+                expected.append(candidate)
+    if modulo == 1:
+        expected = [0] * 500
+
+    assert values == expected
+    assert all(0 <= value < modulo for value in values)
+
+
+def test_v3_derivation_uses_unbiased_sampler():
+    personal_info = PersonalInfo(
+        first_name="Alice",
+        last_name="Smith",
+        birth_date="12-08-1992",
+        current_date="02-10-2025",
+        platform="Email",
+        city="London",
+    )
+    options = PasswordOptions()
+    options.length = 128
+
+    passwords = {}
+    for version in ["v2", "v3"]:
+        generator = SecurePasswordGenerator(derivation_version=version)
+        generator.set_personal_info(personal_info)
+        generator.set_options(options)
+        passwords[version] = generator.generate_password()
+        assert generator.generate_password() == passwords[version]
+        assert isinstance(generator._build_prng(),
+                          SecurePasswordGenerator._UnbiasedPRNG) == (version == "v3")
+
+    assert len(passwords["v3"]) == 128
+    assert passwords["v3"] != passwords["v2"]
+    assert set(passwords["v3"]) <= set(options.get_character_set())
+
+
+def test_pattern_matcher_matches_naive_search():
+    import random
+
+    from src.pattern_matcher import PatternMatcher, fold
+
+    patterns = ["alice", "ali", "lice", "1992", "london", "emai", "ice"]
+    matcher = PatternMatcher(patterns)
+    folded_patterns = {fold(p) for p in patterns}
+    rng = random.Random(7)
+    alphabet = "aAl1!iIc3e4@L0ndo9N2m"
+
+    for _ in range(200):
+        text = fold(''.join(rng.choice(alphabet) for _ in range(40)))
+        expected = sorted(
+            (start, len(p)) for p in folded_patterns
+            for start in range(len(text) - len(p) + 1)
+            if text.startswith(p, start))
+        assert sorted(matcher.find(text)) == expected
+
+    assert sorted(matcher.find(fold("xxAL1C3xx"))) == [
+        (2, 3), (2, 5), (3, 4), (4, 3)]
+
+
+def test_v4_strict_patterns_repairs_all_matches():
+    from src.pattern_matcher import fold
+
+    personal_info = PersonalInfo(
+        first_name="Alice",
+        last_name="Smith",
+        birth_date="12-08-1992",
+        current_date="02-10-2025",
+        platform="Email",
+        city="London",
+    )
+    generator = SecurePasswordGenerator(derivation_version="v4")
+    generator.set_personal_info(personal_info)
+    charset = "alice"
+    rng = SecurePasswordGenerator._UnbiasedPRNG(bytes(64))
+
+    password = list("A1ic3xxLONDONxx19920812Sm1thEMAIL")
+    repaired = generator._repair_patterns(password, charset + "#", rng)
+
+    folded = [fold(c) for c in repaired]
+    assert generator._pattern_matcher().find(folded) == []
+    assert len(repaired) == 33
+
+    options = PasswordOptions()
+    options.length = 64
+    generator.set_options(options)
+    assert generator.generate_password() == generator.generate_password()
+
+
+def test_v4_strict_patterns_without_pattern_free_characters():
+    from src.pattern_matcher import fold
+
+    personal_info = PersonalInfo(
+        first_name="Alice",
+        last_name="Smith",
+        birth_date="12-08-1992",
+        current_date="02-10-2025",
+        platform="Email",
+        city="London",
+    )
+    generator = SecurePasswordGenerator(derivation_version="v4")
+    generator.set_personal_info(personal_info)
+    # Every character of "alice" occurs in a pattern, so the final
+    # pattern-free pass has nothing to substitute with
+    generator.MAX_REPAIR_ROUNDS = 0
+    rng = SecurePasswordGenerator._UnbiasedPRNG(bytes(64))
+
+    repaired = generator._repair_patterns(list("xxALICExxSMITHxx"), "alice", rng)
+    assert generator._pattern_matcher().find([fold(c) for c in repaired]) == []
+
+    generator.MAX_RESAMPLE_ROUNDS = 0
+    with pytest.raises(ValueError, match="character types"):
+        generator._repair_patterns(list("xxALICExx"), "alice", rng)
+
+
+def test_generation_plan_is_memoized_and_tabulated():
+    from src.password_generator import CLASS_DIGIT, CLASS_LOWERCASE, CLASS_SPECIAL
+
+    options = PasswordOptions()
+    options.include_uppercase = False
+    same_options = PasswordOptions()
+    same_options.include_uppercase = False
+
+    plan = options.compile()
+
+    assert same_options.compile() is plan
+    assert plan.fingerprint == options.fingerprint()
+    assert plan.charset == options.get_character_set()
+    assert plan.characters == tuple(plan.charset)
+    assert [class_bit for class_bit, _ in plan.class_pools] == [
+        CLASS_LOWERCASE, CLASS_DIGIT, CLASS_SPECIAL]
+    assert "0" not in plan.class_pools[1][1]
+    assert plan.classes_present("ab3") == CLASS_LOWERCASE | CLASS_DIGIT
+    assert plan.classes_present("é#") == CLASS_SPECIAL
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_batch_strength_matches_scalar(use_numpy):
+    import random
+
+    from src.strength import assess_strength_batch
+
+    if use_numpy:
+        pytest.importorskip("numpy")
+
+    rng = random.Random(11)
+    alphabet = (
+        "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+        "!@#$%^&*()_+-=[]{}|;:,.<>? ~é")
+    passwords = ["", "aaaa", "Password1!", "ÄÖÜ123"] + [
+        ''.join(rng.choice(alphabet[:rng.randint(1, len(alphabet))])
+                for _ in range(rng.randint(1, 40)))
+        for _ in range(2000)]
+
+    generator = SecurePasswordGenerator()
+    expected = [generator.assess_strength(password) for password in passwords]
+
+    assert assess_strength_batch(passwords, use_numpy=use_numpy) == expected
+
+
+def test_cli_audit_writes_summary(tmp_path):
+    import json
+
+    from src.cli import main
+
+    passwords_path = tmp_path / "passwords.txt"
+    report_path = tmp_path / "report.json"
+    passwords_path.write_text("123456\npassword\n\nK#9vLq!2xP@7mZ$4\n",
+                              encoding="utf-8")
+
+    assert main(["audit", str(passwords_path), "-o", str(report_path),
+                 "--chunk-size", "2", "--no-numpy"]) == 0
+
+    report = json.loads(report_path.read_text())
+    assert report["passwords"] == 4
+    assert report["empty"] == 1
+    assert report["labels"]["Very Strong"] == 1
+    assert sum(report["labels"].values()) == 4
+    assert sum(report["score"]["histogram"].values()) == 4
+    assert report["engine"] == "python"
+
+
+def test_benchmark_compare_flags_regressions():
+    from benchmarks.harness import compare
+
+    baseline = {"kdf": {"median": 0.200}, "sample": {"median": 0.001},
+                "retired": {"median": 1.0}}
+    results = {"kdf": {"median": 0.210}, "sample": {"median": 0.0015},
+               "new_phase": {"median": 5.0}}
+
+    regressions = compare(results, baseline, threshold_percent=25)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("sample:")
+    assert compare(results, baseline, threshold_percent=60) == []
+
+
+def test_kdf_profiles_are_encoded_and_reproducible():
+    from src.kdf import DEFAULT_KDF, PBKDF2Profile, ScryptProfile, parse_kdf_profile
+
+    personal_info = PersonalInfo(
+        first_name="Alice",
+        last_name="Smith",
+        birth_date="12-08-1992",
+        current_date="02-10-2025",
+        platform="Email",
+        city="London",
+    )
+    default = _build_generator(personal_info, PasswordOptions())
+    explicit = SecurePasswordGenerator(kdf_profile=PBKDF2Profile(200_000))
+    explicit.set_personal_info(personal_info)
+    explicit.set_options(PasswordOptions())
+
+    # The default profile is implied: fingerprint and output are unchanged
+    assert explicit.derivation_fingerprint() == default.derivation_fingerprint()
+    assert explicit.generate_password() == ",#]QbZ3Rh=W,"
+
+    for profile in (PBKDF2Profile(1000), ScryptProfile(n=2 ** 10, r=8, p=1)):
+        generator = SecurePasswordGenerator(derivation_version="v2",
+                                            kdf_profile=profile)
+        generator.set_personal_info(personal_info)
+        generator.set_options(PasswordOptions())
+        fingerprint = generator.derivation_fingerprint()
+        assert fingerprint.endswith(f"|kdf={profile.fingerprint()}")
+        assert parse_kdf_profile(fingerprint.split("|kdf=")[1]) == profile
+
+        password = generator.generate_password()
+        assert password != ",#]QbZ3Rh=W,"
+        twin = SecurePasswordGenerator(derivation_version="v2",
+                                       kdf_profile=parse_kdf_profile(profile.fingerprint()))
+        twin.set_personal_info(personal_info)
+        twin.set_options(PasswordOptions())
+        assert twin.generate_password() == password
+
+    assert parse_kdf_profile("pbkdf2") == DEFAULT_KDF
+    for spec in ("argon2", "scrypt:n=1000", "pbkdf2:n=5"):
+        with pytest.raises(ValueError):
+            parse_kdf_profile(spec)
+
+
+def test_batch_cost_estimate_counts_kdf_runs():
+    from src.kdf import PBKDF2Profile, estimate_batch_cost
+
+    profile = PBKDF2Profile(1000)
+    v1 = estimate_batch_cost(10, profile, workers=4, kdf_seconds=0.1,
+                             overhead_seconds=0.0)
+    assert v1["kdf_runs"] == 10
+    assert v1["estimated_seconds"] == pytest.approx(0.3)  # ceil(10 / 4) rounds
+
+    v2 = estimate_batch_cost(10, profile, workers=4, identities=2,
+                             derivation_version="v2", kdf_seconds=0.1,
+                             overhead_seconds=0.0)
+    assert v2["kdf_runs"] == 2
+    assert v2["estimated_seconds"] == pytest.approx(0.1)
+
+    for typo in ("V1", "v9"):
+        with pytest.raises(ValueError, match="Unknown derivation version"):
+            estimate_batch_cost(10, profile, derivation_version=typo, kdf_seconds=0.1)
+
+
+def test_instrumentation_reports_phases_and_counters():
+    import json
+    from src.instrumentation import COUNTERS, PHASES, GenerationStats
+
+    personal_info = PersonalInfo(
+        first_name="Alice",
+        last_name="Smith",
+        birth_date="12-08-1992",
+        current_date="02-10-2025",
+        platform="Email",
+        city="London",
+    )
+    stats = GenerationStats()
+    generator = SecurePasswordGenerator(observer=stats)
+    generator.set_personal_info(personal_info)
+    generator.set_options(PasswordOptions())
+
+    # Instrumentation must not change the output
+    assert generator.generate_password() == ",#]QbZ3Rh=W,"
+    generator.generate_password()
+
+    report = json.loads(stats.to_json())
+    assert report["generations"] == 2
+    assert set(report["phases"]) == set(PHASES)
+    assert report["phases"]["kdf"]["calls"] == 2
+    assert report["phases"]["total"]["total"] >= report["phases"]["kdf"]["total"]
+    assert set(COUNTERS) <= set(report["counters"])
+    assert report["counters"]["prng_refills"] >= 2
+    # 12 four-byte draws per password plus any replacement draws
+    assert report["counters"]["prng_bytes"] >= 2 * 12 * 4
+    assert ",#]QbZ3Rh=W," not in stats.to_json()
+
+    stats.reset()
+    assert stats.to_dict()["generations"] == 0
+
+
+def test_core_imports_without_gui_dependencies():
+    import subprocess
+    import sys
+
+    headless = (
+        "import sys\n"
+        "import src.password_generator, src.cli\n"
+        "print('tkinter' in sys.modules)\n"
+    )
+    gui = (
+        "import sys\n"
+        "import src.gui\n"
+        "deferred = ('tkinter.messagebox', 'tkinter.filedialog', 'concurrent.futures')\n"
+        "print([name for name in deferred if name in sys.modules])\n"
+    )
+    outputs = [subprocess.run([sys.executable, "-c", probe], capture_output=True,
+                              text=True, check=True).stdout.strip()
+               for probe in (headless, gui)]
+    assert outputs == ["False", "[]"]
+
+
+def test_profile_store_indexes_and_regenerates(tmp_path):
+    import json
+    from src.cli import main as cli_main
+    from src.profile_store import Profile, ProfileStore, regenerate
+
+    identity = PersonalInfo(
+        first_name="Alice",
+        last_name="Smith",
+        birth_date="12-08-1992",
+        current_date="02-10-2025",
+        platform="",
+        city="London",
+    )
+    store_dir = str(tmp_path / "store")
+    with ProfileStore(store_dir) as store:
+        for number in range(300):
+            store.put(Profile.create("personal", f"site{number}", PasswordOptions(), "v2"))
+        store.flush()
+        store.put(Profile.create("personal", "Email", PasswordOptions()))
+        store.put(Profile.create("work", "EMAIL", PasswordOptions(), "v2"))
+        assert store.remove("personal", "site7")
+
+    # Reopened: indexed records come from the mapped index, none pending
+    with ProfileStore(store_dir) as store:
+        assert store._pending_count == 0
+        assert store.get("personal", "site7") is None
+        assert store.get("personal", "site8").platform == "site8"
+        assert [p.identity for p in store.find("email")] == ["personal", "work"]
+        assert len(store) == 301
+        profile = store.get("personal", "Email")
+        # Served from memory after the first scan, and kept current
+        store._scan = None
+        store.put(Profile.create("work", "Bank", PasswordOptions()))
+        assert len(store) == 302 and store.profiles("work")[-1].platform == "Bank"
+        assert store.remove("work", "Bank") and len(store) == 301
+
+    assert regenerate(profile, identity) == ",#]QbZ3Rh=W,"
+    stored = open(tmp_path / "store" / "profiles.dat", "rb").read()
+    assert b"Alice" not in stored and b"London" not in stored
+
+    identities = tmp_path / "identities.jsonl"
+    identities.write_text(json.dumps(dict(
+        vars(identity), identity="personal")) + "\n", encoding="utf-8")
+    output = tmp_path / "out.jsonl"
+    assert cli_main(["regenerate", str(identities), "--store", store_dir,
+                     "-o", str(output), "--workers", "1"]) == 0
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert len(rows) == 300
+    assert {row["platform"]: row["password"] for row in rows}["Email"] == ",#]QbZ3Rh=W,"
+
+
+def test_gui_reachable_modules_import_without_excluded_modules():
+    """The onefile GUI build excludes src.batch and friends (pypass.spec)"""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "class Block:\n"
+        "    def find_spec(self, name, path=None, target=None):\n"
+        "        if name in ('src.batch', 'src.breach', 'multiprocessing'):\n"
+        "            raise ImportError('excluded: ' + name)\n"
+        "sys.meta_path.insert(0, Block())\n"
+        "import src.gui, src.profile_store, src.batch_panel\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_passphrase_from_mapped_wordlist(tmp_path):
+    import math
+    from src.password_generator import PassphraseOptions
+    from src.wordlist import WordList, build_wordlist, default_wordlist
+
+    path = str(tmp_path / "words.pwl")
+    assert build_wordlist(["pear ", "apple", "", "fig", "apple"], path) == 3
+    with WordList(path) as wordlist:
+        assert [wordlist[i] for i in range(len(wordlist))] == ["apple", "fig", "pear"]
+        assert wordlist[-1] == "pear" and wordlist.verify()
+
+    # The built-in list must never change: passphrases depend on it
+    wordlist = default_wordlist(str(tmp_path))
+    assert len(wordlist) == 102_400
+    assert wordlist.digest.startswith("dbbd2c502fe73a22")
+
+    generator = SecurePasswordGenerator(derivation_version="v2")
+    generator.set_personal_info(PersonalInfo(
+        first_name="Alice",
+        last_name="Smith",
+        birth_date="12-08-1992",
+        current_date="02-10-2025",
+        platform="Email",
+        city="London",
+    ))
+    options = PassphraseOptions()
+    assert generator.generate_passphrase(options, wordlist) == \
+        "miluf-kosuz-kumem-gokom-mudap-hebop"
+    options.capitalize = True
+    options.digits = 2
+    options.separator = "."
+
+    passphrase = generator.generate_passphrase(options, wordlist)
+    assert passphrase == generator.generate_passphrase(options, wordlist)
+    words = passphrase.split(".")
+    assert len(words) == 6 and all(word[0].isupper() for word in words)
+    assert sum(char.isdigit() for char in passphrase) == 2
+    assert options.entropy_bits(len(wordlist)) == pytest.approx(
+        6 * math.log2(102_400) + 2 * math.log2(60))
+    assert f"list={wordlist.digest[:16]}" in generator.passphrase_fingerprint(
+        options, wordlist)
+
+    options.word_count = 2
+    with pytest.raises(ValueError):
+        generator.generate_passphrase(options, wordlist)
+    wordlist.close()
+
+
+def test_guess_estimator_spots_patterns():
+    """Pattern-based guess estimates penalize guessable structure"""
+    import math
+    import timeit
+
+    from src.guess_estimator import estimate_guesses
+    from src.password_generator import SPECIAL_CHARACTERS
+
+    weak = estimate_guesses("P@ssw0rd1990")
+    assert weak.score == 0
+    assert [match.pattern for match in weak.sequence] == ["dictionary", "date"]
+    assert estimate_guesses("qwertyuiop").score == 0
+    assert estimate_guesses("aaaaaaaaaa").score == 0
+    assert estimate_guesses("abcdefgh").score == 0
+    assert estimate_guesses(",#]QbZ3Rh=W,").score == 4
+
+    # Plain words containing 'l' (folded to 'i') are not leet substitutions
+    from src.guess_estimator import _word_ranks
+
+    hello = estimate_guesses("hello").sequence
+    assert [m.pattern for m in hello] == ["dictionary"]
+    assert hello[0].guesses == _word_ranks()["heiio"][0]
+    assert estimate_guesses("h3llo").sequence[0].guesses == 2 * hello[0].guesses
+
+    # Under 1ms at the maximum length, even for worst-case repeats, so it
+    # can run live on the GUI thread and in bulk audits
+    import random
+    import string
+
+    scrambled = "".join(random.Random(0).choice(string.printable[:94]) for _ in range(128))
+    # Single repeated characters that fold onto dictionary words ("1" and
+    # "l" -> "iiii...") are the slowest inputs
+    degenerate = ["1" * 128, "l" * 128, "!" * 128, "0" * 128, "s" * 128, "ab" * 64]
+    for password in [scrambled, "a" * 128, "abc" * 43, "Ab1!" * 32] + degenerate:
+        password = password[:128]
+        best = min(timeit.repeat(lambda: estimate_guesses(password), number=50, repeat=5))
+        assert best / 50 < 0.001, password
+
+    options = PasswordOptions()
+    options.length = 16
+    options.include_special = False
+    plan = options.compile()
+    assert not any(char in plan.characters for char in SPECIAL_CHARACTERS)
+    assert plan.entropy_bits == pytest.approx(16 * math.log2(len(plan.characters)))
+
+
+def test_breach_index_flags_known_passwords(tmp_path):
+    """Offline breach index: external sort, Bloom front, mmap lookups"""
+    import hashlib
+    import pickle
+
+    from src.batch import generate_many
+    from src.breach import BreachIndex, build_breach_index
+    from src.strength import audit_passwords
+
+    breached = [f"leaked{i}" for i in range(500)] + ["password"]
+    lines = [f"{hashlib.sha1(p.encode()).hexdigest().upper()}:{i + 1}"
+             for i, p in enumerate(breached)]
+    # Unsorted input with a duplicate, spread over several sort runs
+    shuffled = list(reversed(lines)) + [lines[0]]
+    assert build_breach_index(shuffled, str(tmp_path / "a.pbi"), memory_records=64) == 501
+    assert build_breach_index(sorted(lines), str(tmp_path / "b.pbi")) == 501
+
+    with BreachIndex(str(tmp_path / "a.pbi")) as index:
+        assert index.count("leaked0") == 2 and index.count("leaked7") == 8
+        assert "password" in index and "not-leaked" not in index
+        assert pickle.loads(pickle.dumps(index)).count("leaked9") == 10
+
+        generator = SecurePasswordGenerator(breach_index=index)
+        assert generator.assess_strength("password") == ("Very Weak", 0.0)
+        assert generator.assess_strength("zQ7#vK2!mP9x")[1] > 0
+
+        report = audit_passwords(["password", "zQ7#vK2!mP9x", ""],
+                                 use_numpy=False, breach_index=index)
+        assert report["breached"] == 1 and report["labels"]["Very Weak"] == 2
+
+        info = PersonalInfo(first_name="Alice", last_name="Smith",
+                            birth_date="12-08-1992", current_date="02-10-2025",
+                            platform="Email", city="London")
+        [result] = generate_many([(info, PasswordOptions())], executor="thread",
+                                 breach_index=index)
+        assert result.password == ",#]QbZ3Rh=W," and result.breached is False
+
+    with BreachIndex(str(tmp_path / "b.pbi")) as index:
+        assert index.count("leaked0") == 1 and "password" in index
+
+    negative = [lines[0], lines[1].split(":")[0] + ":-5"]
+    with pytest.raises(ValueError, match="Line 2: expected SHA1"):
+        build_breach_index(negative, str(tmp_path / "c.pbi"))
+
+
+def test_rotation_seeks_keystream_without_new_kdf(tmp_path, monkeypatch):
+    """Rotations reuse the derived key and jump to their own keystream block"""
+    from src import derivation
+    from src.profile_store import Profile, ProfileStore, regenerate
+
+    prng = SecurePasswordGenerator._DeterministicPRNG(b"seed")
+    prng.next_bytes(64 * 5)
+    expected = prng.next_bytes(100)
+    prng.seek(5)
+    assert prng.next_bytes(100) == expected and prng.refills == 2
+
+    info = PersonalInfo(first_name="Alice", last_name="Smith",
+                        birth_date="12-08-1992", current_date="02-10-2025",
+                        platform="Email", city="London")
+    generator = _build_generator(info, PasswordOptions())
+    assert generator.generate_password() == ",#]QbZ3Rh=W,"
+    generator.options.rotation = 1
+    rotated = generator.generate_password()
+    assert rotated != ",#]QbZ3Rh=W," and generator.derivation_fingerprint().endswith("|rot=1")
+
+    runs = []
+    real_derive = derivation.derive_master_key
+    monkeypatch.setattr(derivation, "derive_master_key",
+                        lambda *args: runs.append(1) or real_derive(*args))
+    generator = SecurePasswordGenerator(derivation_version="v2")
+    generator.set_personal_info(info)
+    passwords = set()
+    for platform in ("Email", "Bank", "Work"):
+        for rotation in range(3):
+            options = PasswordOptions()
+            options.rotation = rotation
+            generator.set_personal_info(PersonalInfo(**dict(vars(info), platform=platform)))
+            generator.set_options(options)
+            passwords.add(generator.generate_password())
+    assert len(passwords) == 9 and len(runs) == 1
+
+    with ProfileStore(str(tmp_path)) as store:
+        store.put(Profile.create("me", "Email", PasswordOptions()).rotated())
+    with ProfileStore(str(tmp_path)) as store:
+        profile = store.get("me", "Email")
+    assert profile.rotation == 1 and regenerate(profile, info) == rotated
+
+
+def test_v1_known_answer_corpus_sample():
+    """Frozen v1 vectors; PYPASS_FULL_CORPUS=1 checks all of them"""
+    import os
+
+    from verification import reference
+    from verification.corpus import check_corpus, read_corpus
+
+    vectors = list(read_corpus())
+    assert len(vectors) >= 2048
+    assert reference.password(vectors[0]) == vectors[0]["password"]
+
+    full = os.environ.get("PYPASS_FULL_CORPUS") == "1"
+    assert check_corpus(sample=None if full else 8, workers=2) == []
+
+
+def test_differential_fuzz_against_reference():
+    """src's v1 fast path matches the frozen reference on random cases"""
+    from verification.fuzz import fuzz
+
+    assert fuzz(cases=1000, seed=12345, workers=2) == []
+
+
+def test_batch_panel_runner_fills_table_model():
+    """Batch rows derive in the background and render a window at a time"""
+    import time
+
+    from src.batch_panel import (STATUS_DONE, STATUS_QUEUED, BatchRunner,
+                                 BatchTableModel, parse_platforms)
+
+    platforms = parse_platforms("Email\n  Bank \n\nEmail\nWork\n")
+    assert platforms == ["Email", "Bank", "Work"]
+
+    info = PersonalInfo(first_name="Alice", last_name="Smith",
+                        birth_date="12-08-1992", current_date="02-10-2025",
+                        platform="", city="London")
+    model = BatchTableModel(platforms * 4000)
+    assert len(model.window(11990, 20)) == 10
+    assert model.window(0, 1) == [(1, "Email", STATUS_QUEUED, "")]
+
+    model = BatchTableModel(platforms)
+    runner = BatchRunner(info, PasswordOptions(), platforms, "v1", workers=2)
+    runner.start()
+    deadline = time.monotonic() + 30
+    while not runner.done and time.monotonic() < deadline:
+        runner.drain(model)
+        time.sleep(0.01)
+    assert model.finished == 3 and model.failed == 0
+    assert [row.status for row in model.rows] == [STATUS_DONE] * 3
+    assert model.rows[0].password == ",#]QbZ3Rh=W,"
+    assert model.display(0)[3] != ",#]QbZ3Rh=W,"
+    model.toggle_reveal(0)
+    assert model.display(0)[3] == ",#]QbZ3Rh=W,"
+
+
+def test_keystream_backends_seek_and_read_into():
+    """Every backend reads the same bytes sequentially, seeked or in bulk"""
+    import hashlib
+
+    from src.keystream import KEYSTREAMS, open_keystream
+
+    key = bytes(range(64))
+    assert open_keystream("sha512", key).read(128) == b"".join(
+        hashlib.sha512(key + i.to_bytes(8, "big")).digest() for i in range(2))
+
+    for name in KEYSTREAMS:
+        stream = open_keystream(name, key)
+        sequential = b"".join(stream.read(size) for size in (1, 63, 64, 4000, 4545))
+        assert len(sequential) == 8673 and stream.tell() == 8673
+        for offset, size in ((0, 8673), (5, 70), (4095, 2), (4096, 4577), (8600, 73)):
+            buffer = bytearray(size)
+            stream.seek(offset)
+            assert stream.read_into(buffer) == size
+            assert bytes(buffer) == sequential[offset:offset + size]
+        stream.seek(2 ** 66)
+        assert len(stream.read(100)) == 100
+
+    info = PersonalInfo(first_name="Alice", last_name="Smith",
+                        birth_date="12-08-1992", current_date="02-10-2025",
+                        platform="Email", city="London")
+    passwords = set()
+    for version in ("v4", "v5", "v6"):
+        generator = SecurePasswordGenerator(derivation_version=version)
+        generator.set_personal_info(info)
+        options = PasswordOptions()
+        options.length = 32
+        generator.set_options(options)
+        password = generator.generate_password()
+        assert len(password) == 32 and generator.generate_password() == password
+        passwords.add(password)
+    assert len(passwords) == 3
@@ -0,0 +1 @@
+"""PyPass output verification: frozen known answers and differential fuzzing."""
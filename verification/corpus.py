@@ -0,0 +1,167 @@
+"""
+Known-Answer Corpus
+Frozen v1 (PersonalInfo, PasswordOptions) -> password vectors
+
+Usage:
+    python -m verification.corpus check                 # every vector, all CPUs
+    python -m verification.corpus check --sample 50     # a quick spot check
+    python -m verification.corpus build                 # only to (re)freeze
+
+Vectors use the CLI job record fields plus the expected ``password``. The
+corpus was frozen from the original v1 code and must never be rebuilt to
+make a failing check pass: a mismatch means registered passwords changed.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional
+
+from src.cli import OPTION_FLAGS, record_to_job
+from src.password_generator import SecurePasswordGenerator
+
+
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), "v1_known_answers.jsonl.gz")
+CORPUS_SEED = 20251002
+CORPUS_SIZE = 2048
+
+_NAMES = ("Alice", "Bob", "José", "Zoë", "Łukasz", "李", "O'Brien", "Anne-Marie",
+          "Mohammed", "Ng", "Siobhán", "Jo", "Ægir", "Renée", "Kim", "  Padded  ")
+_CITIES = ("London", "Paris", "São Paulo", "Zürich", "Kyiv", "Rome", "Oslo",
+           "New York", "Reykjavík", "Ulm", "東京", "Lima")
+_PLATFORMS = ("Email", "Bank", "GitHub", "Work VPN", "amazon.com", "X",
+              "Steam", "PayPal", "router-admin", "Wi-Fi")
+
+
+def _random_word(rng: random.Random) -> str:
+    letters = "abcdefghijklmnopqrstuvwxyzäöüß"
+    word = "".join(rng.choice(letters) for _ in range(rng.randint(1, 12)))
+    return word.capitalize()
+
+
+def _random_date(rng: random.Random, first_year: int, last_year: int) -> str:
+    day, month, year = rng.randint(1, 28), rng.randint(1, 12), rng.randint(first_year, last_year)
+    style = rng.random()
+    if style < 0.85:
+        return f"{day:02d}-{month:02d}-{year}"
+    if style < 0.95:
+        return f"{day}/{month}/{year}"  # The API accepts any text
+    return f"{year}-{month:02d}-{day:02d}"
+
+
+def random_vector(rng: random.Random) -> Dict:
+    """A random, valid v1 job record (without the expected password)"""
+    pick = lambda pool: rng.choice(pool) if rng.random() < 0.6 else _random_word(rng)
+    vector = {
+        "first_name": pick(_NAMES),
+        "last_name": pick(_NAMES),
+        "birth_date": _random_date(rng, 1930, 2015),
+        "current_date": _random_date(rng, 2020, 2035),
+        "platform": pick(_PLATFORMS),
+        "city": pick(_CITIES),
+    }
+    roll = rng.random()
+    if roll < 0.7:
+        vector["length"] = rng.randint(8, 24)
+    elif roll < 0.9:
+        vector["length"] = rng.randint(25, 64)
+    else:
+        vector["length"] = rng.randint(65, 128)
+    while True:
+        flags = {flag: rng.random() < 0.75 for flag in OPTION_FLAGS}
+        if any(flags[flag] for flag in OPTION_FLAGS[:4]):
+            break
+    vector.update(flags)
+    return vector
+
+
+def generate_vectors(count: int = CORPUS_SIZE, seed: int = CORPUS_SEED) -> List[Dict]:
+    """The corpus inputs: count random vectors from a fixed seed"""
+    rng = random.Random(seed)
+    return [random_vector(rng) for _ in range(count)]
+
+
+def read_corpus(path: str = CORPUS_PATH) -> Iterator[Dict]:
+    """Yield the vectors of a corpus file"""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def write_corpus(vectors: List[Dict], path: str = CORPUS_PATH):
+    """Write vectors (with passwords); byte-identical for identical vectors"""
+    with open(path, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f:
+        for vector in vectors:
+            f.write((json.dumps(vector, ensure_ascii=False, sort_keys=True) + "\n").encode("utf-8"))
+
+
+def generate(vector: Dict) -> str:
+    """The password src generates for a vector (v1, default KDF)"""
+    personal_info, options = record_to_job(vector)
+    generator = SecurePasswordGenerator()
+    generator.set_personal_info(personal_info)
+    generator.set_options(options)
+    return generator.generate_password()
+
+
+def _check(vector: Dict) -> Optional[Dict]:
+    actual = generate(vector)
+    if actual == vector["password"]:
+        return None
+    return dict(vector, actual=actual)
+
+
+def check_corpus(path: str = CORPUS_PATH, workers: Optional[int] = None,
+                 sample: Optional[int] = None, seed: int = 0) -> List[Dict]:
+    """Regenerate corpus vectors in parallel; returns the mismatching ones.
+
+    ``sample`` checks a random subset of that many vectors instead of all.
+    """
+    vectors = list(read_corpus(path))
+    if sample is not None and sample < len(vectors):
+        vectors = random.Random(seed).sample(vectors, sample)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return [mismatch for mismatch in pool.map(_check, vectors, chunksize=4)
+                if mismatch is not None]
+
+
+def build_corpus(path: str = CORPUS_PATH, count: int = CORPUS_SIZE,
+                 seed: int = CORPUS_SEED, workers: Optional[int] = None) -> int:
+    """Freeze the current v1 output for the corpus inputs"""
+    vectors = generate_vectors(count, seed)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        passwords = list(pool.map(generate, vectors, chunksize=4))
+    write_corpus([dict(vector, password=password)
+                  for vector, password in zip(vectors, passwords)], path)
+    return len(vectors)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("command", choices=("check", "build"))
+    parser.add_argument("--path", default=CORPUS_PATH, help="Corpus file")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--sample", type=int, default=None,
+                        help="Check only this many randomly chosen vectors")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        count = build_corpus(args.path, workers=args.workers)
+        print(f"Froze {count} vectors to {args.path}")
+        return 0
+
+    mismatches = check_corpus(args.path, workers=args.workers, sample=args.sample)
+    for mismatch in mismatches:
+        print(json.dumps(mismatch, ensure_ascii=False))
+    print(f"{len(mismatches)} mismatching vectors", file=sys.stderr)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Differential Fuzzer
+Runs random vectors through src's v1 fast path and the frozen reference
+
+Usage:
+    python -m verification.fuzz                      # 100k cases, seeds injected
+    python -m verification.fuzz --cases 200 --full-kdf
+    python -m verification.fuzz --seed 7 -w 4
+
+By default both sides get the same random seed material in place of the
+KDF output. That skips PBKDF2, so hundreds of thousands of cases run in
+minutes and exercise everything the optimizations touch: the PRNG, the
+charset, sampling, requirement fixes and pattern repair. ``--full-kdf``
+also runs the real KDF on both sides, at about 0.25s per case.
+"""
+
+import argparse
+import json
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from src.cli import record_to_job
+from src.password_generator import SecurePasswordGenerator
+
+from . import reference
+from .corpus import random_vector
+
+
+DEFAULT_CASES = 100_000
+
+
+class _InjectedSeedGenerator(SecurePasswordGenerator):
+    """Generator whose KDF output is supplied by the fuzzer"""
+
+    def __init__(self, seed_material: bytes):
+        super().__init__()
+        self._injected = seed_material
+
+    def _seed_material(self, option_fingerprint: str) -> bytes:
+        return self._injected
+
+
+def fuzz_vector(rng: random.Random) -> Dict:
+    """A random vector, biased towards the rarely-taken pattern repair paths"""
+    vector = random_vector(rng)
+    if rng.random() < 0.25:
+        # Digit-only passwords and four-digit "names" hit repairs often
+        for flag in ("include_uppercase", "include_lowercase", "include_special"):
+            vector[flag] = False
+        vector["include_numbers"] = True
+        vector["length"] = rng.randint(8, 128)
+        for field in ("first_name", "last_name", "city"):
+            if rng.random() < 0.6:
+                vector[field] = "".join(rng.choice("23456789") for _ in range(4))
+        if rng.random() < 0.3:
+            vector["birth_date"] = "-".join(rng.choice("23456789") for _ in range(3))
+    return vector
+
+
+def run_case(case: Tuple[int, bool]) -> Optional[Dict]:
+    """Compare both implementations on one case; returns a mismatch or None"""
+    case_seed, full_kdf = case
+    rng = random.Random(case_seed)
+    vector = fuzz_vector(rng)
+    personal_info, options = record_to_job(vector)
+
+    if full_kdf:
+        expected = reference.password(vector)
+        generator = SecurePasswordGenerator()
+    else:
+        seed_material = rng.randbytes(64)
+        expected = reference.password_from_seed(seed_material, vector)
+        generator = _InjectedSeedGenerator(seed_material)
+    generator.set_personal_info(personal_info)
+    generator.set_options(options)
+    actual = generator.generate_password()
+
+    if actual == expected:
+        return None
+    return dict(vector, case_seed=case_seed, expected=expected, actual=actual)
+
+
+def fuzz(cases: int = DEFAULT_CASES, seed: int = 0, full_kdf: bool = False,
+         workers: Optional[int] = None) -> List[Dict]:
+    """Run cases in parallel processes; returns the mismatching cases.
+
+    Case i uses seed ``seed + i``, so any reported case reproduces alone.
+    """
+    work = ((seed + i, full_kdf) for i in range(cases))
+    chunksize = 4 if full_kdf else 256
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return [mismatch for mismatch in pool.map(run_case, work, chunksize=chunksize)
+                if mismatch is not None]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--cases", type=int, default=DEFAULT_CASES,
+                        help=f"Number of random cases (default: {DEFAULT_CASES})")
+    parser.add_argument("--seed", type=int, default=0, help="First case seed")
+    parser.add_argument("--full-kdf", action="store_true",
+                        help="Also run the real KDF on both sides (slow)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    mismatches = fuzz(args.cases, args.seed, args.full_kdf, args.workers)
+    for mismatch in mismatches:
+        print(json.dumps(mismatch, ensure_ascii=False))
+    print(f"{len(mismatches)} mismatches in {args.cases} cases", file=sys.stderr)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
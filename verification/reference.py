@@ -0,0 +1,117 @@
+"""
+Reference v1 Implementation
+A frozen, deliberately plain restatement of the original v1 algorithm
+
+This module must never be optimized or share code with ``src``: it is the
+yardstick that fast paths in ``src.password_generator`` are fuzzed against.
+It works on plain vector dicts (the CLI job record fields) so nothing from
+``src`` can leak into it.
+"""
+
+import hashlib
+import string
+from typing import Dict, List
+
+
+SPECIAL = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+AMBIGUOUS = "0Ol1I"
+ITERATIONS = 200_000
+
+PERSONAL_FIELDS = ("first_name", "last_name", "birth_date",
+                   "current_date", "platform", "city")
+
+
+class ReferencePRNG:
+    """SHA-512 counter-mode byte stream, 4-byte big-endian draws, modulo"""
+
+    def __init__(self, seed: bytes):
+        self.seed = seed
+        self.buffer = b""
+        self.counter = 0
+
+    def next_bytes(self, length: int) -> bytes:
+        while len(self.buffer) < length:
+            self.buffer += hashlib.sha512(
+                self.seed + self.counter.to_bytes(8, "big")).digest()
+            self.counter += 1
+        result, self.buffer = self.buffer[:length], self.buffer[length:]
+        return result
+
+    def next_int(self, modulo: int) -> int:
+        return int.from_bytes(self.next_bytes(4), "big") % modulo
+
+
+def _personal(vector: Dict) -> Dict[str, str]:
+    return {field: str(vector[field]).strip() for field in PERSONAL_FIELDS}
+
+
+def charset(vector: Dict) -> str:
+    chars = ""
+    if vector["include_lowercase"]:
+        chars += string.ascii_lowercase
+    if vector["include_uppercase"]:
+        chars += string.ascii_uppercase
+    if vector["include_numbers"]:
+        chars += string.digits
+    if vector["include_special"]:
+        chars += SPECIAL
+    if vector["exclude_ambiguous"]:
+        chars = "".join(c for c in chars if c not in AMBIGUOUS)
+    return chars
+
+
+def fingerprint(vector: Dict) -> str:
+    return (f"len={vector['length']}|upper={int(vector['include_uppercase'])}"
+            f"|lower={int(vector['include_lowercase'])}"
+            f"|digits={int(vector['include_numbers'])}"
+            f"|special={int(vector['include_special'])}"
+            f"|exclude_ambiguous={int(vector['exclude_ambiguous'])}")
+
+
+def seed(vector: Dict) -> bytes:
+    """The slow part: PBKDF2-SHA512 over the personal info"""
+    personal = _personal(vector)
+    combined = "".join(personal[field] for field in PERSONAL_FIELDS)
+    basis = hashlib.sha256(combined.encode("utf-8")).hexdigest()
+    return hashlib.pbkdf2_hmac("sha512", basis.encode("utf-8"),
+                               fingerprint(vector).encode("utf-8"), ITERATIONS, dklen=64)
+
+
+def password_from_seed(seed_material: bytes, vector: Dict) -> str:
+    """Everything after the KDF: sampling, requirements, pattern repair"""
+    chars = charset(vector)
+    rng = ReferencePRNG(seed_material)
+    password: List[str] = [chars[rng.next_int(len(chars))]
+                           for _ in range(vector["length"])]
+
+    pools = []
+    for flag, letters in (("include_lowercase", string.ascii_lowercase),
+                          ("include_uppercase", string.ascii_uppercase),
+                          ("include_numbers", string.digits),
+                          ("include_special", SPECIAL)):
+        if vector[flag]:
+            pool = [c for c in chars if c in letters]
+            if pool and not any(c in pool for c in password):
+                pools.append(pool)
+    for pool in pools:
+        position = rng.next_int(len(password))
+        password[position] = pool[rng.next_int(len(pool))]
+
+    personal = _personal(vector)
+    patterns = [
+        personal["first_name"].lower()[:4] if len(personal["first_name"]) >= 4 else "",
+        personal["last_name"].lower()[:4] if len(personal["last_name"]) >= 4 else "",
+        personal["birth_date"].replace("-", ""),
+        personal["city"].lower()[:4] if len(personal["city"]) >= 4 else "",
+    ]
+    for pattern in [p for p in patterns if len(p) >= 3]:
+        while pattern in "".join(password).lower():
+            position = rng.next_int(len(password))
+            password[position] = chars[rng.next_int(len(chars))]
+
+    return "".join(password)
+
+
+def password(vector: Dict) -> str:
+    """The v1 password for a vector"""
+    return password_from_seed(seed(vector), vector)